@@ -272,9 +272,9 @@ def build_table():
     return tbl
 
 
-def main():
+def build(output_path=OUTPUT):
     doc = SimpleDocTemplate(
-        str(OUTPUT),
+        str(output_path),
         pagesize=letter,
         leftMargin=0.75 * inch,
         rightMargin=0.75 * inch,
@@ -298,8 +298,9 @@ def main():
     story.append(build_table())
 
     doc.build(story)
-    print(f"Wrote {OUTPUT}")
+    print(f"Wrote {output_path}")
+    return output_path
 
 
 if __name__ == "__main__":
-    main()
+    build()
@@ -13,6 +13,7 @@ path one-pagers.
 """
 
 import os
+import sys
 from reportlab.lib.pagesizes import letter, landscape
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import inch
@@ -21,57 +22,15 @@ from reportlab.platypus import (BaseDocTemplate, Frame, PageTemplate,
                                 Paragraph, Spacer, Table, TableStyle,
                                 HRFlowable, FrameBreak, KeepTogether)
 from reportlab.lib.enums import TA_LEFT, TA_RIGHT
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.pdfbase.pdfmetrics import registerFontFamily
 
 # ── Paths ────────────────────────────────────────────────────────────────────
 DOCS_DIR   = os.path.dirname(os.path.abspath(__file__))
 ROOT_DIR   = os.path.abspath(os.path.join(DOCS_DIR, ".."))
 PUBLIC_DIR = os.path.join(ROOT_DIR, "public")
-FONTS_DIR  = os.path.join(ROOT_DIR, "scripts", ".fonts")
-
-# ── Inter (auto-download on first run) ──────────────────────────────────────
-INTER_WEIGHTS = {
-    "Inter":             "Inter-Regular.ttf",
-    "Inter-Medium":      "Inter-Medium.ttf",
-    "Inter-SemiBold":    "Inter-SemiBold.ttf",
-    "Inter-Bold":        "Inter-Bold.ttf",
-    "Inter-ExtraBold":   "Inter-ExtraBold.ttf",
-    "Inter-Black":       "Inter-Black.ttf",
-    "Inter-Italic":      "Inter-Italic.ttf",
-    "Inter-BoldItalic":  "Inter-BoldItalic.ttf",
-}
-INTER_RELEASE_URL = "https://github.com/rsms/inter/releases/download/v4.0/Inter-4.0.zip"
-
-
-def _ensure_fonts():
-    missing = [fn for fn in INTER_WEIGHTS.values()
-               if not os.path.exists(os.path.join(FONTS_DIR, fn))]
-    if not missing:
-        return
-    import urllib.request, zipfile, io
-    os.makedirs(FONTS_DIR, exist_ok=True)
-    print(f"Downloading Inter v4 ({len(missing)} weight(s) missing)…")
-    with urllib.request.urlopen(INTER_RELEASE_URL) as resp:
-        data = resp.read()
-    with zipfile.ZipFile(io.BytesIO(data)) as zf:
-        for fn in missing:
-            with zf.open(f"extras/ttf/{fn}") as src, \
-                 open(os.path.join(FONTS_DIR, fn), "wb") as dst:
-                dst.write(src.read())
-    print("Fonts ready.")
-
-
-def _register_fonts():
-    _ensure_fonts()
-    for name, fn in INTER_WEIGHTS.items():
-        pdfmetrics.registerFont(TTFont(name, os.path.join(FONTS_DIR, fn)))
-    registerFontFamily("Inter",
-        normal="Inter", bold="Inter-Bold",
-        italic="Inter-Italic", boldItalic="Inter-BoldItalic")
-
-_register_fonts()
+
+# ── Inter (matches the website's V2 typography; see scripts/doc_fonts.py) ───
+sys.path.insert(0, os.path.join(ROOT_DIR, "scripts"))
+from doc_fonts import register_inter
 
 # ── V2 palette ───────────────────────────────────────────────────────────────
 TEXT      = HexColor('#1A1A1A')
@@ -635,12 +594,15 @@ def story_addons():
 
 
 # ── Driver ───────────────────────────────────────────────────────────────────
-def main():
+OUTPUT_PATH = os.path.join(PUBLIC_DIR, "Range-Lab-Panels-Guide.pdf")
+
+
+def build(output_path=OUTPUT_PATH):
     from reportlab.platypus import PageBreak, NextPageTemplate
 
-    os.makedirs(PUBLIC_DIR, exist_ok=True)
-    out = os.path.join(PUBLIC_DIR, "Range-Lab-Panels-Guide.pdf")
-    doc = make_doc(out, "Lab Panels Guide — Range Medical")
+    register_inter()
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    doc = make_doc(output_path, "Lab Panels Guide — Range Medical")
 
     story = []
 
@@ -658,8 +620,9 @@ def main():
     story.extend(story_addons())
 
     doc.build(story)
-    print(f"Wrote {out}")
+    print(f"Wrote {output_path}")
+    return output_path
 
 
 if __name__ == "__main__":
-    main()
+    build()
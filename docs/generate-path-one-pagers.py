@@ -14,6 +14,7 @@ Outputs:
 """
 
 import os
+import sys
 from reportlab.lib.pagesizes import letter, landscape
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import inch
@@ -22,67 +23,15 @@ from reportlab.platypus import (BaseDocTemplate, Frame, PageTemplate,
                                 Paragraph, Spacer, Table, TableStyle,
                                 HRFlowable, FrameBreak)
 from reportlab.lib.enums import TA_LEFT, TA_RIGHT
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.pdfbase.pdfmetrics import registerFontFamily
 
 # ── Paths ────────────────────────────────────────────────────────────────────
 DOCS_DIR   = os.path.dirname(os.path.abspath(__file__))
 ROOT_DIR   = os.path.abspath(os.path.join(DOCS_DIR, ".."))
 PUBLIC_DIR = os.path.join(ROOT_DIR, "public")
-FONTS_DIR  = os.path.join(ROOT_DIR, "scripts", ".fonts")
-
-# ── Register Inter (matches the website's V2 typography) ────────────────────
-INTER_WEIGHTS = {
-    "Inter":             "Inter-Regular.ttf",
-    "Inter-Medium":      "Inter-Medium.ttf",
-    "Inter-SemiBold":    "Inter-SemiBold.ttf",
-    "Inter-Bold":        "Inter-Bold.ttf",
-    "Inter-ExtraBold":   "Inter-ExtraBold.ttf",
-    "Inter-Black":       "Inter-Black.ttf",
-    "Inter-Italic":      "Inter-Italic.ttf",
-    "Inter-BoldItalic":  "Inter-BoldItalic.ttf",
-}
-INTER_RELEASE_URL = "https://github.com/rsms/inter/releases/download/v4.0/Inter-4.0.zip"
-
-
-def _ensure_fonts_downloaded():
-    """Fetch the Inter v4 release zip on first run; static TTFs are gitignored."""
-    missing = [fn for fn in INTER_WEIGHTS.values()
-               if not os.path.exists(os.path.join(FONTS_DIR, fn))]
-    if not missing:
-        return
-
-    import urllib.request, zipfile, io
-    os.makedirs(FONTS_DIR, exist_ok=True)
-    print(f"Downloading Inter v4 ({len(missing)} weight(s) missing)…")
-    with urllib.request.urlopen(INTER_RELEASE_URL) as resp:
-        data = resp.read()
-    with zipfile.ZipFile(io.BytesIO(data)) as zf:
-        for fn in missing:
-            try:
-                with zf.open(f"extras/ttf/{fn}") as src, \
-                     open(os.path.join(FONTS_DIR, fn), "wb") as dst:
-                    dst.write(src.read())
-            except KeyError:
-                raise RuntimeError(f"Inter weight {fn} not found in release zip")
-    print("Fonts ready.")
-
-
-def _register_fonts():
-    _ensure_fonts_downloaded()
-    for name, fn in INTER_WEIGHTS.items():
-        pdfmetrics.registerFont(TTFont(name, os.path.join(FONTS_DIR, fn)))
-    # Make <b> / <i> in inline markup resolve correctly
-    registerFontFamily(
-        "Inter",
-        normal="Inter",
-        bold="Inter-Bold",
-        italic="Inter-Italic",
-        boldItalic="Inter-BoldItalic",
-    )
 
-_register_fonts()
+# ── Inter (matches the website's V2 typography; see scripts/doc_fonts.py) ───
+sys.path.insert(0, os.path.join(ROOT_DIR, "scripts"))
+from doc_fonts import register_inter
 
 # ── V2 palette (mirrors styles/globals.css) ──────────────────────────────────
 TEXT      = HexColor('#1A1A1A')   # h1, h2, .rm-wordmark color
@@ -545,25 +494,39 @@ def story_injury_recovery():
 
 
 # ── Driver ───────────────────────────────────────────────────────────────────
-def render(out_dir, filename, title, story_fn):
-    path = os.path.join(out_dir, filename)
+OUTPUT_HOW_IT_WORKS = os.path.join(PUBLIC_DIR, "Range-How-It-Works-One-Pager.pdf")
+OUTPUT_ENERGY_HORMONES_WEIGHT = os.path.join(PUBLIC_DIR, "Range-Energy-Hormones-Weight-Path.pdf")
+OUTPUT_INJURY_RECOVERY = os.path.join(PUBLIC_DIR, "Range-Injury-Recovery-Path.pdf")
+
+
+def render(path, title, story_fn):
+    register_inter()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
     doc = make_doc(path, title)
     doc.build(story_fn())
     print(f"Wrote {path}")
+    return path
+
+
+def build_how_it_works(output_path=OUTPUT_HOW_IT_WORKS):
+    return render(output_path, "How Range Medical Works — Range Medical",
+                  story_how_it_works)
+
+
+def build_energy_hormones_weight(output_path=OUTPUT_ENERGY_HORMONES_WEIGHT):
+    return render(output_path, "Energy, Hormones & Weight Path — Range Medical",
+                  story_energy_hormones_weight)
+
+
+def build_injury_recovery(output_path=OUTPUT_INJURY_RECOVERY):
+    return render(output_path, "Injury & Recovery Path — Range Medical",
+                  story_injury_recovery)
 
 
 def main():
-    os.makedirs(PUBLIC_DIR, exist_ok=True)
-
-    render(PUBLIC_DIR, "Range-How-It-Works-One-Pager.pdf",
-           "How Range Medical Works — Range Medical",
-           story_how_it_works)
-    render(PUBLIC_DIR, "Range-Energy-Hormones-Weight-Path.pdf",
-           "Energy, Hormones & Weight Path — Range Medical",
-           story_energy_hormones_weight)
-    render(PUBLIC_DIR, "Range-Injury-Recovery-Path.pdf",
-           "Injury & Recovery Path — Range Medical",
-           story_injury_recovery)
+    build_how_it_works()
+    build_energy_hormones_weight()
+    build_injury_recovery()
 
 
 if __name__ == "__main__":
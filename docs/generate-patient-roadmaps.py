@@ -5,6 +5,7 @@ from reportlab.lib.colors import HexColor
 from reportlab.platypus import (SimpleDocTemplate, Paragraph, Spacer, Table,
                                  TableStyle, HRFlowable, PageBreak)
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
+import os
 
 BLACK      = HexColor('#0A0A0A')
 DARK_GRAY  = HexColor('#1A1A1A')
@@ -153,252 +154,263 @@ def checkbox_row(options):
 # ═══════════════════════════════════════════════════════════════════════════════
 # WEIGHT LOSS ROADMAP
 # ═══════════════════════════════════════════════════════════════════════════════
-OUTPUT_WL = "/Users/chriscupp/Code/rangemedical-system-2/docs/Range-WL-Patient-Roadmap.pdf"
-
-doc_wl = SimpleDocTemplate(
-    OUTPUT_WL, pagesize=letter,
-    rightMargin=0.75*inch, leftMargin=0.75*inch,
-    topMargin=0.55*inch, bottomMargin=0.5*inch,
-)
-story = []
-build_header(story)
-
-story.append(Paragraph("MEDICAL WEIGHT LOSS PROGRAM", title_s))
-story.append(Paragraph("Your Roadmap", subtitle_s))
-story.append(Spacer(1, 6))
-
-story += section_label("Patient Information")
-info_data = [
-    [Paragraph("<b>Patient</b>", label_s), Paragraph("_" * 50, blank_s),
-     Paragraph("<b>Date</b>", label_s), Paragraph("_" * 22, blank_s)],
-    [Paragraph("<b>Provider</b>", label_s), Paragraph("_" * 50, blank_s),
-     Paragraph("<b>Start Weight</b>", label_s), Paragraph("_" * 22, blank_s)],
-]
-info_tbl = Table(info_data, colWidths=[0.8*inch, 2.9*inch, 1.1*inch, 2.2*inch])
-info_tbl.setStyle(TableStyle([
-    ('VALIGN', (0,0), (-1,-1), 'BOTTOM'),
-    ('LEFTPADDING', (0,0), (-1,-1), 0),
-    ('RIGHTPADDING', (0,0), (-1,-1), 4),
-    ('TOPPADDING', (0,0), (-1,-1), 3),
-    ('BOTTOMPADDING', (0,0), (-1,-1), 3),
-]))
-story.append(info_tbl)
-story.append(Spacer(1, 2))
-
-story += section_label("Your Program Length")
-story.append(checkbox_row([
-    "24 weeks  (up to 20 lbs)",
-    "32 weeks  (21–40 lbs)",
-    "48 weeks  (41+ lbs)",
-]))
-story.append(Spacer(1, 3))
-
-story.append(Paragraph(
-    "Your program has three phases: <b>lose the weight</b>, <b>let your body adjust</b>, "
-    "and <b>learn to eat and live at your new weight</b>.",
-    body_s
-))
-story.append(Spacer(1, 5))
-
-story += section_label("Your Three Phases")
-
-story.append(phase_block(
-    1, "Weight Loss", "First 8–24 weeks",
-    None,
-    [
-        "Baseline labs and personalized treatment plan",
-        "Weekly or biweekly check-ins (in-person or telehealth)",
-        "Medication, nutrition, and activity adjusted as needed",
-        "Follow-up labs around week 8, then every 12 weeks",
-        "<b>What you're tracking:</b> weight, measurements, energy, cravings",
+OUTPUT_WL = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Range-WL-Patient-Roadmap.pdf")
+
+
+def build_wl(output_path=OUTPUT_WL):
+    doc_wl = SimpleDocTemplate(
+        output_path, pagesize=letter,
+        rightMargin=0.75*inch, leftMargin=0.75*inch,
+        topMargin=0.55*inch, bottomMargin=0.5*inch,
+    )
+    story = []
+    build_header(story)
+
+    story.append(Paragraph("MEDICAL WEIGHT LOSS PROGRAM", title_s))
+    story.append(Paragraph("Your Roadmap", subtitle_s))
+    story.append(Spacer(1, 6))
+
+    story += section_label("Patient Information")
+    info_data = [
+        [Paragraph("<b>Patient</b>", label_s), Paragraph("_" * 50, blank_s),
+         Paragraph("<b>Date</b>", label_s), Paragraph("_" * 22, blank_s)],
+        [Paragraph("<b>Provider</b>", label_s), Paragraph("_" * 50, blank_s),
+         Paragraph("<b>Start Weight</b>", label_s), Paragraph("_" * 22, blank_s)],
     ]
-))
-story.append(Spacer(1, 4))
-
-story.append(phase_block(
-    2, "Recalibration", "8–12 weeks",
-    "Teach your metabolism this new weight is the new normal.",
-    [
-        "Hold your weight within a narrow band — no more losing, no regaining",
-        "Gradually adjust calories and macros upward as appropriate",
-        "Fine-tune or begin reducing medications when clinically safe",
-        "Labs every ~12 weeks, tied to provider visits",
-    ]
-))
-story.append(Spacer(1, 4))
-
-story.append(phase_block(
-    3, "Reverse &amp; Transition", "8–12 weeks",
-    "Raise your food and activity to a long-term level without regaining.",
-    [
-        "Gradually increase intake and activity to sustainable levels",
-        "Lock in routines for work, travel, and weekends",
-        "Build your long-term follow-up plan with your provider",
-        "Transition into <b>Range Continued Care Membership</b> to keep your results",
+    info_tbl = Table(info_data, colWidths=[0.8*inch, 2.9*inch, 1.1*inch, 2.2*inch])
+    info_tbl.setStyle(TableStyle([
+        ('VALIGN', (0,0), (-1,-1), 'BOTTOM'),
+        ('LEFTPADDING', (0,0), (-1,-1), 0),
+        ('RIGHTPADDING', (0,0), (-1,-1), 4),
+        ('TOPPADDING', (0,0), (-1,-1), 3),
+        ('BOTTOMPADDING', (0,0), (-1,-1), 3),
+    ]))
+    story.append(info_tbl)
+    story.append(Spacer(1, 2))
+
+    story += section_label("Your Program Length")
+    story.append(checkbox_row([
+        "24 weeks  (up to 20 lbs)",
+        "32 weeks  (21–40 lbs)",
+        "48 weeks  (41+ lbs)",
+    ]))
+    story.append(Spacer(1, 3))
+
+    story.append(Paragraph(
+        "Your program has three phases: <b>lose the weight</b>, <b>let your body adjust</b>, "
+        "and <b>learn to eat and live at your new weight</b>.",
+        body_s
+    ))
+    story.append(Spacer(1, 5))
+
+    story += section_label("Your Three Phases")
+
+    story.append(phase_block(
+        1, "Weight Loss", "First 8–24 weeks",
+        None,
+        [
+            "Baseline labs and personalized treatment plan",
+            "Weekly or biweekly check-ins (in-person or telehealth)",
+            "Medication, nutrition, and activity adjusted as needed",
+            "Follow-up labs around week 8, then every 12 weeks",
+            "<b>What you're tracking:</b> weight, measurements, energy, cravings",
+        ]
+    ))
+    story.append(Spacer(1, 4))
+
+    story.append(phase_block(
+        2, "Recalibration", "8–12 weeks",
+        "Teach your metabolism this new weight is the new normal.",
+        [
+            "Hold your weight within a narrow band — no more losing, no regaining",
+            "Gradually adjust calories and macros upward as appropriate",
+            "Fine-tune or begin reducing medications when clinically safe",
+            "Labs every ~12 weeks, tied to provider visits",
+        ]
+    ))
+    story.append(Spacer(1, 4))
+
+    story.append(phase_block(
+        3, "Reverse &amp; Transition", "8–12 weeks",
+        "Raise your food and activity to a long-term level without regaining.",
+        [
+            "Gradually increase intake and activity to sustainable levels",
+            "Lock in routines for work, travel, and weekends",
+            "Build your long-term follow-up plan with your provider",
+            "Transition into <b>Range Continued Care Membership</b> to keep your results",
+        ]
+    ))
+
+    story.append(Spacer(1, 5))
+    story += section_label("Upcoming Dates")
+    dates_data = [
+        [Paragraph("<b>Next Visit</b>", label_s), Paragraph("_" * 28, blank_s),
+         Paragraph("<b>Next Labs</b>", label_s), Paragraph("_" * 28, blank_s)],
     ]
-))
-
-story.append(Spacer(1, 5))
-story += section_label("Upcoming Dates")
-dates_data = [
-    [Paragraph("<b>Next Visit</b>", label_s), Paragraph("_" * 28, blank_s),
-     Paragraph("<b>Next Labs</b>", label_s), Paragraph("_" * 28, blank_s)],
-]
-dates_tbl = Table(dates_data, colWidths=[0.9*inch, 2.6*inch, 0.9*inch, 2.6*inch])
-dates_tbl.setStyle(TableStyle([
-    ('VALIGN', (0,0), (-1,-1), 'BOTTOM'),
-    ('LEFTPADDING', (0,0), (-1,-1), 0),
-    ('RIGHTPADDING', (0,0), (-1,-1), 4),
-    ('TOPPADDING', (0,0), (-1,-1), 2),
-    ('BOTTOMPADDING', (0,0), (-1,-1), 2),
-]))
-story.append(dates_tbl)
-story.append(Spacer(1, 4))
-
-callout_data = [[Paragraph(
-    "<b>This is where most diets fail.</b> Phases 2 and 3 are built in so your body doesn't rebound. "
-    "We're not just helping you lose weight — we're helping you <b>keep</b> it off.",
-    callout_s
-)]]
-callout_tbl = Table(callout_data, colWidths=[W])
-callout_tbl.setStyle(TableStyle([
-    ('BACKGROUND', (0,0), (-1,-1), HexColor('#F0F5F0')),
-    ('BOX', (0,0), (-1,-1), 0.5, HexColor('#C8D8C8')),
-    ('LEFTPADDING', (0,0), (-1,-1), 10),
-    ('RIGHTPADDING', (0,0), (-1,-1), 10),
-    ('TOPPADDING', (0,0), (-1,-1), 6),
-    ('BOTTOMPADDING', (0,0), (-1,-1), 6),
-]))
-story.append(callout_tbl)
-
-story.append(Spacer(1, 4))
-build_footer(story)
-doc_wl.build(story)
-print(f"PDF saved to {OUTPUT_WL}")
+    dates_tbl = Table(dates_data, colWidths=[0.9*inch, 2.6*inch, 0.9*inch, 2.6*inch])
+    dates_tbl.setStyle(TableStyle([
+        ('VALIGN', (0,0), (-1,-1), 'BOTTOM'),
+        ('LEFTPADDING', (0,0), (-1,-1), 0),
+        ('RIGHTPADDING', (0,0), (-1,-1), 4),
+        ('TOPPADDING', (0,0), (-1,-1), 2),
+        ('BOTTOMPADDING', (0,0), (-1,-1), 2),
+    ]))
+    story.append(dates_tbl)
+    story.append(Spacer(1, 4))
+
+    callout_data = [[Paragraph(
+        "<b>This is where most diets fail.</b> Phases 2 and 3 are built in so your body doesn't rebound. "
+        "We're not just helping you lose weight — we're helping you <b>keep</b> it off.",
+        callout_s
+    )]]
+    callout_tbl = Table(callout_data, colWidths=[W])
+    callout_tbl.setStyle(TableStyle([
+        ('BACKGROUND', (0,0), (-1,-1), HexColor('#F0F5F0')),
+        ('BOX', (0,0), (-1,-1), 0.5, HexColor('#C8D8C8')),
+        ('LEFTPADDING', (0,0), (-1,-1), 10),
+        ('RIGHTPADDING', (0,0), (-1,-1), 10),
+        ('TOPPADDING', (0,0), (-1,-1), 6),
+        ('BOTTOMPADDING', (0,0), (-1,-1), 6),
+    ]))
+    story.append(callout_tbl)
+
+    story.append(Spacer(1, 4))
+    build_footer(story)
+    doc_wl.build(story)
+    print(f"PDF saved to {output_path}")
+    return output_path
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # HORMONE OPTIMIZATION ROADMAP
 # ═══════════════════════════════════════════════════════════════════════════════
-OUTPUT_HRT = "/Users/chriscupp/Code/rangemedical-system-2/docs/Range-HRT-Patient-Roadmap.pdf"
-
-doc_hrt = SimpleDocTemplate(
-    OUTPUT_HRT, pagesize=letter,
-    rightMargin=0.75*inch, leftMargin=0.75*inch,
-    topMargin=0.55*inch, bottomMargin=0.5*inch,
-)
-story = []
-build_header(story)
-
-story.append(Paragraph("HORMONE OPTIMIZATION PROGRAM", title_s))
-story.append(Paragraph("Your Roadmap", subtitle_s))
-story.append(Spacer(1, 6))
-
-story += section_label("Patient Information")
-info_data = [
-    [Paragraph("<b>Patient</b>", label_s), Paragraph("_" * 50, blank_s),
-     Paragraph("<b>Date</b>", label_s), Paragraph("_" * 22, blank_s)],
-    [Paragraph("<b>Provider</b>", label_s), Paragraph("_" * 50, blank_s),
-     Paragraph("<b>Primary Goal</b>", label_s), Paragraph("_" * 22, blank_s)],
-]
-info_tbl = Table(info_data, colWidths=[0.8*inch, 2.9*inch, 1.1*inch, 2.2*inch])
-info_tbl.setStyle(TableStyle([
-    ('VALIGN', (0,0), (-1,-1), 'BOTTOM'),
-    ('LEFTPADDING', (0,0), (-1,-1), 0),
-    ('RIGHTPADDING', (0,0), (-1,-1), 4),
-    ('TOPPADDING', (0,0), (-1,-1), 3),
-    ('BOTTOMPADDING', (0,0), (-1,-1), 3),
-]))
-story.append(info_tbl)
-story.append(Spacer(1, 3))
-
-story.append(Paragraph(
-    "Your program has three phases: <b>find your dose</b>, <b>stabilize and fine-tune</b>, "
-    "and <b>maintain your results long-term</b>. Hormone optimization is not a quick fix — "
-    "it's a process, and each phase has a purpose.",
-    body_s
-))
-story.append(Spacer(1, 5))
-
-story += section_label("Your Three Phases")
-
-story.append(phase_block(
-    1, "Reset &amp; Find Your Dose", "First 8–12 weeks",
-    "This phase is about finding your sweet spot, not perfection on day one.",
-    [
-        "Baseline labs and comprehensive symptom review",
-        "Start or adjust hormones based on your labs and goals",
-        "First follow-up labs around week 8 to see how your body responds",
-        "Regular check-ins to monitor symptoms and adjust",
-        "<b>What you're tracking:</b> energy, mood, sleep, libido, any side effects",
+OUTPUT_HRT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Range-HRT-Patient-Roadmap.pdf")
+
+
+def build_hrt(output_path=OUTPUT_HRT):
+    doc_hrt = SimpleDocTemplate(
+        output_path, pagesize=letter,
+        rightMargin=0.75*inch, leftMargin=0.75*inch,
+        topMargin=0.55*inch, bottomMargin=0.5*inch,
+    )
+    story = []
+    build_header(story)
+
+    story.append(Paragraph("HORMONE OPTIMIZATION PROGRAM", title_s))
+    story.append(Paragraph("Your Roadmap", subtitle_s))
+    story.append(Spacer(1, 6))
+
+    story += section_label("Patient Information")
+    info_data = [
+        [Paragraph("<b>Patient</b>", label_s), Paragraph("_" * 50, blank_s),
+         Paragraph("<b>Date</b>", label_s), Paragraph("_" * 22, blank_s)],
+        [Paragraph("<b>Provider</b>", label_s), Paragraph("_" * 50, blank_s),
+         Paragraph("<b>Primary Goal</b>", label_s), Paragraph("_" * 22, blank_s)],
     ]
-))
-story.append(Spacer(1, 4))
-
-story.append(phase_block(
-    2, "Stabilize &amp; Fine-Tune", "Next 3–6 months",
-    "Do most days feel better than before we started?",
-    [
-        "Keep your levels in a stable, optimal range",
-        "Small dose adjustments if labs or symptoms call for it",
-        "Provider visits every 8–12 weeks with labs at the same rhythm",
-        "Address any secondary factors — sleep, stress, nutrition, training",
+    info_tbl = Table(info_data, colWidths=[0.8*inch, 2.9*inch, 1.1*inch, 2.2*inch])
+    info_tbl.setStyle(TableStyle([
+        ('VALIGN', (0,0), (-1,-1), 'BOTTOM'),
+        ('LEFTPADDING', (0,0), (-1,-1), 0),
+        ('RIGHTPADDING', (0,0), (-1,-1), 4),
+        ('TOPPADDING', (0,0), (-1,-1), 3),
+        ('BOTTOMPADDING', (0,0), (-1,-1), 3),
+    ]))
+    story.append(info_tbl)
+    story.append(Spacer(1, 3))
+
+    story.append(Paragraph(
+        "Your program has three phases: <b>find your dose</b>, <b>stabilize and fine-tune</b>, "
+        "and <b>maintain your results long-term</b>. Hormone optimization is not a quick fix — "
+        "it's a process, and each phase has a purpose.",
+        body_s
+    ))
+    story.append(Spacer(1, 5))
+
+    story += section_label("Your Three Phases")
+
+    story.append(phase_block(
+        1, "Reset &amp; Find Your Dose", "First 8–12 weeks",
+        "This phase is about finding your sweet spot, not perfection on day one.",
+        [
+            "Baseline labs and comprehensive symptom review",
+            "Start or adjust hormones based on your labs and goals",
+            "First follow-up labs around week 8 to see how your body responds",
+            "Regular check-ins to monitor symptoms and adjust",
+            "<b>What you're tracking:</b> energy, mood, sleep, libido, any side effects",
+        ]
+    ))
+    story.append(Spacer(1, 4))
+
+    story.append(phase_block(
+        2, "Stabilize &amp; Fine-Tune", "Next 3–6 months",
+        "Do most days feel better than before we started?",
+        [
+            "Keep your levels in a stable, optimal range",
+            "Small dose adjustments if labs or symptoms call for it",
+            "Provider visits every 8–12 weeks with labs at the same rhythm",
+            "Address any secondary factors — sleep, stress, nutrition, training",
+        ]
+    ))
+    story.append(Spacer(1, 4))
+
+    story.append(phase_block(
+        3, "Maintain &amp; Monitor", "Ongoing",
+        None,
+        [
+            "Move to a steady maintenance schedule",
+            "Labs every 3–6+ months as clinically appropriate",
+            "Check-ins to adjust for life changes — stress, weight, other health shifts",
+            "Transition into <b>Range Continued Care Membership</b> for ongoing labs, "
+            "follow-ups, and easier access to adjustments",
+        ]
+    ))
+
+    story.append(Spacer(1, 5))
+    story += section_label("Upcoming Dates")
+    dates_data = [
+        [Paragraph("<b>Next Visit</b>", label_s), Paragraph("_" * 28, blank_s),
+         Paragraph("<b>Next Labs</b>", label_s), Paragraph("_" * 28, blank_s)],
     ]
-))
-story.append(Spacer(1, 4))
-
-story.append(phase_block(
-    3, "Maintain &amp; Monitor", "Ongoing",
-    None,
-    [
-        "Move to a steady maintenance schedule",
-        "Labs every 3–6+ months as clinically appropriate",
-        "Check-ins to adjust for life changes — stress, weight, other health shifts",
-        "Transition into <b>Range Continued Care Membership</b> for ongoing labs, "
-        "follow-ups, and easier access to adjustments",
+    dates_tbl = Table(dates_data, colWidths=[0.9*inch, 2.6*inch, 0.9*inch, 2.6*inch])
+    dates_tbl.setStyle(TableStyle([
+        ('VALIGN', (0,0), (-1,-1), 'BOTTOM'),
+        ('LEFTPADDING', (0,0), (-1,-1), 0),
+        ('RIGHTPADDING', (0,0), (-1,-1), 4),
+        ('TOPPADDING', (0,0), (-1,-1), 2),
+        ('BOTTOMPADDING', (0,0), (-1,-1), 2),
+    ]))
+    story.append(dates_tbl)
+    story.append(Spacer(1, 4))
+
+    story += section_label("What to Expect")
+    expect_data = [
+        [Paragraph("<b>Weeks 1–4</b>", label_s),
+         Paragraph("Early changes in energy and sleep. Full hormone response takes 6–8 weeks.", body_sm)],
+        [Paragraph("<b>Weeks 6–12</b>", label_s),
+         Paragraph("Meaningful improvement in mood, body composition, libido, and recovery. Follow-up labs confirm we're on track.", body_sm)],
+        [Paragraph("<b>Month 3+</b>", label_s),
+         Paragraph("Compounding benefits. This is when patients say they feel like themselves again.", body_sm)],
     ]
-))
-
-story.append(Spacer(1, 5))
-story += section_label("Upcoming Dates")
-dates_data = [
-    [Paragraph("<b>Next Visit</b>", label_s), Paragraph("_" * 28, blank_s),
-     Paragraph("<b>Next Labs</b>", label_s), Paragraph("_" * 28, blank_s)],
-]
-dates_tbl = Table(dates_data, colWidths=[0.9*inch, 2.6*inch, 0.9*inch, 2.6*inch])
-dates_tbl.setStyle(TableStyle([
-    ('VALIGN', (0,0), (-1,-1), 'BOTTOM'),
-    ('LEFTPADDING', (0,0), (-1,-1), 0),
-    ('RIGHTPADDING', (0,0), (-1,-1), 4),
-    ('TOPPADDING', (0,0), (-1,-1), 2),
-    ('BOTTOMPADDING', (0,0), (-1,-1), 2),
-]))
-story.append(dates_tbl)
-story.append(Spacer(1, 4))
-
-story += section_label("What to Expect")
-expect_data = [
-    [Paragraph("<b>Weeks 1–4</b>", label_s),
-     Paragraph("Early changes in energy and sleep. Full hormone response takes 6–8 weeks.", body_sm)],
-    [Paragraph("<b>Weeks 6–12</b>", label_s),
-     Paragraph("Meaningful improvement in mood, body composition, libido, and recovery. Follow-up labs confirm we're on track.", body_sm)],
-    [Paragraph("<b>Month 3+</b>", label_s),
-     Paragraph("Compounding benefits. This is when patients say they feel like themselves again.", body_sm)],
-]
-expect_tbl = Table(expect_data, colWidths=[0.9*inch, W - 0.9*inch])
-expect_tbl.setStyle(TableStyle([
-    ('VALIGN', (0,0), (-1,-1), 'TOP'),
-    ('LEFTPADDING', (0,0), (-1,-1), 8),
-    ('RIGHTPADDING', (0,0), (-1,-1), 8),
-    ('TOPPADDING', (0,0), (-1,-1), 4),
-    ('BOTTOMPADDING', (0,0), (-1,-1), 4),
-    ('ROWBACKGROUNDS', (0,0), (-1,-1), [LIGHT_GRAY, WHITE]),
-    ('BOX', (0,0), (-1,-1), 0.5, RULE_GRAY),
-    ('LINEBELOW', (0,0), (-1,-2), 0.5, RULE_GRAY),
-]))
-story.append(expect_tbl)
-
-story.append(Spacer(1, 4))
-build_footer(story)
-doc_hrt.build(story)
-print(f"PDF saved to {OUTPUT_HRT}")
+    expect_tbl = Table(expect_data, colWidths=[0.9*inch, W - 0.9*inch])
+    expect_tbl.setStyle(TableStyle([
+        ('VALIGN', (0,0), (-1,-1), 'TOP'),
+        ('LEFTPADDING', (0,0), (-1,-1), 8),
+        ('RIGHTPADDING', (0,0), (-1,-1), 8),
+        ('TOPPADDING', (0,0), (-1,-1), 4),
+        ('BOTTOMPADDING', (0,0), (-1,-1), 4),
+        ('ROWBACKGROUNDS', (0,0), (-1,-1), [LIGHT_GRAY, WHITE]),
+        ('BOX', (0,0), (-1,-1), 0.5, RULE_GRAY),
+        ('LINEBELOW', (0,0), (-1,-2), 0.5, RULE_GRAY),
+    ]))
+    story.append(expect_tbl)
+
+    story.append(Spacer(1, 4))
+    build_footer(story)
+    doc_hrt.build(story)
+    print(f"PDF saved to {output_path}")
+    return output_path
+
+
+if __name__ == '__main__':
+    build_wl()
+    build_hrt()
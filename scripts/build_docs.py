@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+Document Build — Range Medical
+Rebuilds every reportlab document (staff guides, SOPs, patient handouts,
+one-pagers) in one run instead of executing each generator by hand.
+
+DOCUMENTS is the registry: one (generator script, builder) entry per PDF.
+Generators do no work at import time; each builder takes an output path
+(defaulting to the document's usual location) and returns it, so they can
+also be imported and called directly. Documents are built in-process by a
+pool of long-lived workers — each worker imports reportlab and a generator
+once, not once per document — so a full rebuild takes about as long as the
+slowest document rather than the sum. A reportlab generator under
+GENERATOR_GLOBS that is neither registered nor in SKIP is reported, so new
+ones don't go unbuilt.
+
+Every document is timed; a failing generator doesn't stop the others, and
+the build exits 1 with a summary (and that generator's output) at the end.
+
+Builds are incremental, like make but on content hashes. While a document
+builds, every repo file opened is recorded (an audit hook in each worker):
+files read are its inputs — its generator's source and the repo modules it
+imports, fonts in scripts/.fonts, images — and files written are its outputs. BuildState
+keeps their SHA-256s; next time the document is skipped when the script, all
+recorded inputs and all recorded outputs still hash the same (and reportlab
+is the same version). Editing a script, replacing a font or logo, or
+touching the PDF by hand makes it stale; --force rebuilds everything.
+Before building, the font store is filled (scripts/doc_fonts.py fetch) if a
+stale document needs fonts that aren't provisioned yet.
+
+Usage:
+    python3 scripts/build_docs.py                  (stale documents, one worker per CPU)
+    python3 scripts/build_docs.py --force          (every document)
+    python3 scripts/build_docs.py --workers 4
+    python3 scripts/build_docs.py roadmap lab      (only documents whose name contains a pattern)
+    python3 scripts/build_docs.py --list           (with up-to-date / stale status)
+"""
+
+import argparse, contextlib, hashlib, importlib.util, io, json, os, sys, time, traceback
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+GENERATOR_GLOBS = ['scripts/generate[-_]*.py', 'docs/generate[-_]*.py', 'public/docs/*.py']
+DEFAULT_STATE = Path.home() / '.cache' / 'build_docs' / 'state.json'
+STATE_VERSION = 1
+
+Document = namedtuple('Document', ['script', 'builder'])
+
+DOCUMENTS = [
+    Document('scripts/generate-assessment-sop.py', 'build'),
+    Document('scripts/generate-ayala-consultation.py', 'build'),
+    Document('scripts/generate-checkin-guide.py', 'build'),
+    Document('scripts/generate-front-desk-guide.py', 'build'),
+    Document('scripts/generate-graziano-protocol.py', 'build'),
+    Document('scripts/generate-hbot-package-guide.py', 'build'),
+    Document('scripts/generate-injection-instructions.py', 'build'),
+    Document('scripts/generate-lab-comparison.py', 'build'),
+    Document('scripts/generate-lab-panel-decision-tree.py', 'build'),
+    Document('scripts/generate-lab-panels-guide.py', 'build'),
+    Document('scripts/generate-mso-overview-pdf.py', 'build'),
+    Document('scripts/generate-patient-comms-privacy.py', 'build'),
+    Document('scripts/generate-process-extraction-pdf.py', 'build'),
+    Document('scripts/generate-questionnaire-quick-ref.py', 'build'),
+    Document('scripts/generate-sports-therapy-flyer.py', 'build'),
+    Document('scripts/generate-system-updates-pdf.py', 'build'),
+    Document('scripts/generate-tesa-ipa-guide.py', 'build'),
+    Document('scripts/generate-wl-staff-guide.py', 'build'),
+    Document('scripts/generate_lookbook.py', 'build'),
+    Document('docs/generate-lab-panel-comparison.py', 'build'),
+    Document('docs/generate-lab-panels-guide-v2.py', 'build'),
+    Document('docs/generate-money-model.py', 'build'),
+    Document('docs/generate-path-one-pagers.py', 'build_how_it_works'),
+    Document('docs/generate-path-one-pagers.py', 'build_energy_hormones_weight'),
+    Document('docs/generate-path-one-pagers.py', 'build_injury_recovery'),
+    Document('docs/generate-patient-roadmaps.py', 'build_wl'),
+    Document('docs/generate-patient-roadmaps.py', 'build_hrt'),
+    Document('public/docs/assessment-staff-guide.py', 'build'),
+    Document('public/docs/intake-form-guide.py', 'build'),
+    Document('public/docs/questionnaire-sop.py', 'build'),
+    Document('public/docs/receipt-naming-staff-guide.py', 'build'),
+    Document('public/docs/training-system-framework.py', 'build'),
+]
+
+# Generators that must not run as part of a bulk rebuild: path → reason
+SKIP = {
+    'scripts/generate-raffle-gift-cards.py': 'issues new redemption codes on every run',
+}
+
+Result = namedtuple('Result', ['name', 'seconds', 'ok', 'log', 'inputs', 'outputs'])
+# inputs / outputs: repo-relative paths read / written while building the document
+
+
+def doc_name(doc):
+    """'script' for a generator's build(), 'script:builder' for its other builders."""
+    return doc.script if doc.builder == 'build' else f"{doc.script}:{doc.builder}"
+
+
+def select(patterns=()):
+    """Registered documents whose name contains one of patterns (all if none)."""
+    return [doc for doc in DOCUMENTS
+            if not patterns or any(p in doc_name(doc) for p in patterns)]
+
+
+def unregistered():
+    """reportlab generators under GENERATOR_GLOBS that are in neither DOCUMENTS nor SKIP."""
+    known = {doc.script for doc in DOCUMENTS} | set(SKIP)
+    found = []
+    for pattern in GENERATOR_GLOBS:
+        for path in sorted(ROOT.glob(pattern)):
+            name = path.relative_to(ROOT).as_posix()
+            if name not in known and 'reportlab' in path.read_text(errors='replace'):
+                found.append(name)
+    return found
+
+
+def load_generator(script):
+    """Import a generator by repo-relative path (file names have hyphens, so not via import)."""
+    module_name = 'docgen_' + ''.join(c if c.isalnum() else '_' for c in script[:-3])
+    if module_name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(module_name, ROOT / script)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[module_name]
+            raise
+    return sys.modules[module_name]
+
+
+def file_sha256(path):
+    """SHA-256 hex digest of a file, or None if it doesn't exist."""
+    h = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                h.update(chunk)
+    except FileNotFoundError:
+        return None
+    return h.hexdigest()
+
+
+def _reportlab_version():
+    try:
+        import reportlab
+    except ImportError:
+        return None
+    return reportlab.Version
+
+
+# Worker-process state: the (reads, writes) sets the audit hook currently fills,
+# and the repo files each generator read while being imported.
+_tracking = None
+_import_reads = {}
+
+
+def _track_opens():
+    """
+    Install the audit hook that adds repo files opened while _tracking is set
+    to its (reads, writes) sets of relative paths. Pool worker initializer.
+    """
+    ignore = {os.path.realpath(p) for p in (sys.prefix, sys.base_prefix)}
+    root = str(ROOT) + os.sep
+
+    def hook(event, args):
+        if _tracking is None or event not in ('open', 'doc_fonts.use') or \
+                not isinstance(args[0], str):
+            return
+        # doc_fonts.use: a font registered earlier in this worker, so not reopened
+        path, mode, flags = args if event == 'open' else (args[0], 'r', 0)
+        path = os.path.abspath(path)
+        if not path.startswith(root) or '__pycache__' in path or \
+                any(path.startswith(p + os.sep) for p in ignore):
+            return
+        rel = path[len(root):].replace(os.sep, '/')
+        writing = mode is None and flags & (os.O_WRONLY | os.O_RDWR) or \
+            mode is not None and any(c in mode for c in 'wax+')
+        _tracking[1 if writing else 0].add(rel)
+
+    sys.addaudithook(hook)
+
+
+def _helper_sources(module):
+    """
+    Repo modules the generator's globals come from (e.g. scripts/doc_fonts.py).
+    Their source is only read by the first generator importing them in a worker.
+    """
+    root = str(ROOT) + os.sep
+    found = set()
+    for value in vars(module).values():
+        source = value if isinstance(value, type(sys)) else \
+            sys.modules.get(getattr(value, '__module__', None) or '')
+        path = getattr(source, '__file__', None)
+        if source is not module and path and os.path.abspath(path).startswith(root):
+            found.add(os.path.abspath(path)[len(root):].replace(os.sep, '/'))
+    return found
+
+
+def build_one(doc):
+    """
+    Build one registered document to its default output in this process.
+    Its printed output is captured into the Result along with the repo files
+    it read and wrote (including what its generator read when first imported).
+    """
+    global _tracking
+    buf = io.StringIO()
+    reads, writes = set(), set()
+    t0 = time.perf_counter()
+    ok = True
+    with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+        try:
+            if doc.script not in _import_reads:
+                _tracking = (set(), writes)
+                load_generator(doc.script)
+                _import_reads[doc.script] = _tracking[0]
+            module = load_generator(doc.script)
+            _tracking = (reads, writes)
+            getattr(module, doc.builder)()
+        except SystemExit as e:
+            ok = e.code in (None, 0)
+        except BaseException:
+            traceback.print_exc()
+            ok = False
+        finally:
+            _tracking = None
+    reads |= _import_reads.get(doc.script, set())
+    if ok:
+        reads |= _helper_sources(module)
+    return Result(doc_name(doc), time.perf_counter() - t0, ok, buf.getvalue(),
+                  sorted(reads - writes | {doc.script}), sorted(writes))
+
+
+class BuildState:
+    """
+    JSON record of each document's last successful build: SHA-256 of every
+    input and output; see module docstring. Hashes are memoized per run, so
+    fonts shared by several documents are only read once.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._hashes = {}
+        data = {}
+        if path.exists():
+            try:
+                data = json.loads(path.read_text())
+            except ValueError:
+                pass
+        self.documents = data.get('documents', {}) if data.get('version') == STATE_VERSION else {}
+
+    def _hash(self, rel):
+        if rel not in self._hashes:
+            self._hashes[rel] = file_sha256(ROOT / rel)
+        return self._hashes[rel]
+
+    def is_current(self, name):
+        """True if name's recorded inputs and outputs all still hash the same."""
+        entry = self.documents.get(name)
+        if not entry or not entry['outputs'] or entry.get('reportlab') != _reportlab_version():
+            return False
+        files = {**entry['inputs'], **entry['outputs']}
+        return all(self._hash(rel) == digest for rel, digest in files.items())
+
+    def record(self, result):
+        """Store a finished build (forgetting the document if it failed)."""
+        if not result.ok:
+            self.documents.pop(result.name, None)
+            return
+        for rel in result.inputs + result.outputs:  # both may have changed during the build
+            self._hashes.pop(rel, None)
+        self.documents[result.name] = {
+            'built_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'seconds': round(result.seconds, 3),
+            'reportlab': _reportlab_version(),
+            'inputs': {rel: self._hash(rel) for rel in result.inputs},
+            'outputs': {rel: self._hash(rel) for rel in result.outputs},
+        }
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        tmp.write_text(json.dumps({'version': STATE_VERSION, 'documents': self.documents},
+                                  indent=2, sort_keys=True))
+        tmp.replace(self.path)
+
+
+def build_all(docs, workers=None, report=print):
+    """
+    Build docs across a pool of long-lived worker processes, calling
+    report(result) as each finishes. Returns results in docs order.
+    """
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_track_opens) as pool:
+        futures = [pool.submit(build_one, doc) for doc in docs]
+        for future in as_completed(futures):
+            result = future.result()
+            results[result.name] = result
+            report(result)
+    return [results[doc_name(doc)] for doc in docs]
+
+
+def provision_fonts(docs, report=print):
+    """
+    Fill scripts/doc_fonts.py's font store before building, if any of docs
+    uses it and the store is incomplete: a one-off `doc_fonts.py fetch`, so
+    generators themselves still never download. Documents whose fonts can't
+    be provisioned fail with doc_fonts' message like any other error.
+    """
+    if not any('doc_fonts' in (ROOT / doc.script).read_text(errors='replace') for doc in docs):
+        return
+    import doc_fonts
+    if not doc_fonts.check(report=lambda line: None):
+        return
+    report('Provisioning fonts (scripts/doc_fonts.py fetch)')
+    doc_fonts.fetch(report=report)
+
+
+def _report(result):
+    mark = '✓' if result.ok else '✗'
+    print(f"  {mark} {result.name:<62} {result.seconds:6.2f}s")
+    sys.stdout.flush()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Rebuild every reportlab document in parallel.')
+    ap.add_argument('patterns', nargs='*',
+                    help='only build documents whose name contains one of these')
+    ap.add_argument('--workers', type=int, default=0, metavar='N',
+                    help='parallel builds (default 0 = one per CPU)')
+    ap.add_argument('--force', action='store_true',
+                    help='rebuild every document, even those that are up to date')
+    ap.add_argument('--state', type=Path, default=DEFAULT_STATE,
+                    help=f'input/output hashes of previous builds (default: {DEFAULT_STATE})')
+    ap.add_argument('--list', action='store_true',
+                    help='list the documents (up to date / stale, skipped and unregistered generators) and exit')
+    args = ap.parse_args(argv)
+
+    state = BuildState(args.state)
+    docs = select(args.patterns)
+    if args.list:
+        for doc in docs:
+            name = doc_name(doc)
+            print(f"{name:<64} {'up to date' if state.is_current(name) else 'stale'}")
+        for name, reason in SKIP.items():
+            print(f"{name:<64} skipped: {reason}")
+        for name in unregistered():
+            print(f"{name:<64} not registered in DOCUMENTS")
+        return 0
+    if not docs:
+        print('No documents match.')
+        return 1
+
+    stale = docs if args.force else [d for d in docs if not state.is_current(doc_name(d))]
+    if not stale:
+        print(f"All {len(docs)} document(s) up to date ({args.state})")
+        return 0
+    provision_fonts(stale)
+    workers = min(args.workers or os.cpu_count() or 1, len(stale))
+    print(f"Building {len(stale)} document(s), {len(docs) - len(stale)} up to date, "
+          f"with {workers} worker(s)")
+    started = time.perf_counter()
+    results = build_all(stale, workers, _report)
+    wall = time.perf_counter() - started
+    for r in results:
+        state.record(r)
+    state.save()
+
+    failed = [r for r in results if not r.ok]
+    slowest = max(results, key=lambda r: r.seconds)
+    print()
+    print(f"Built {len(results) - len(failed)}/{len(results)} in {wall:.1f}s "
+          f"(slowest {slowest.name} {slowest.seconds:.1f}s, "
+          f"{sum(r.seconds for r in results):.1f}s if run one by one)")
+    for r in failed:
+        print()
+        print(f"── FAILED: {r.name} ({r.seconds:.2f}s)")
+        print(r.log.rstrip() or '(no output)')
+    if failed:
+        print()
+        print(f"{len(failed)} document(s) failed: {', '.join(r.name for r in failed)}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
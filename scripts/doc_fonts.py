@@ -0,0 +1,373 @@
+"""
+Document Fonts — Range Medical
+Inter for the document generators, registered with reportlab once per process.
+
+    register_inter()   the INTER_FACES weights plus the "Inter" family, so
+                       <b> / <i> in Paragraph markup resolve to Inter faces
+    inter_variable()   path of the variable Inter used by render-ad-images.py
+
+Generators never download anything. Fonts are provisioned once into a
+content-addressed store, STORE_DIR/<sha256>.ttf (not committed), by
+
+    python3 scripts/doc_fonts.py fetch                  (download the Inter v4.0 release zip)
+    python3 scripts/doc_fonts.py fetch --from Inter-4.0.zip --from ~/fonts
+                                                        (offline: release zip / TTF folders)
+    python3 scripts/doc_fonts.py check                  (is the store complete and intact?)
+
+Every font comes from the tagged Inter v4.0 release asset, never a branch
+that can move. LOCK_FILE (kept in git) pins every font file name to its
+SHA-256, and fetch refuses any font whose bytes don't match their pin. A
+font with no pin is taken only from a downloaded release zip whose SHA-256
+matches the digest GitHub publishes for that asset (INTER_RELEASE_API), and
+pinned then; commit the updated LOCK_FILE. Where GitHub publishes no digest,
+or offline, unpinned fonts are refused unless fetch is given --pin-new: pin
+only from a copy you trust. Generators look fonts up
+in the store by their pinned digest and verify the bytes again when
+reading them, so a build uses exactly the pinned fonts or fails before
+drawing anything.
+
+Parsing a TTF (glyph tables, metrics, cmap) is most of a generator's startup,
+so each parsed face is pickled under CACHE_DIR keyed by the font's SHA-256
+and the reportlab version; later processes unpickle it instead. A face
+already registered in this process is not loaded again, so a long-lived
+process (build_docs.py workers) pays for each font once. Every
+register_inter() raises a 'doc_fonts.use' audit event per font file, so
+build_docs.py records the fonts as a document's inputs even when they were
+registered by an earlier document.
+"""
+
+import argparse, functools, hashlib, io, json, os, pickle, sys, urllib.request, zipfile
+from pathlib import Path
+
+from reportlab import Version as REPORTLAB_VERSION
+from reportlab.pdfbase import pdfmetrics, ttfonts
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+STORE_DIR = SCRIPTS_DIR / '.fonts' / 'sha256'
+LOCK_FILE = SCRIPTS_DIR / 'fonts.sha256'
+CACHE_DIR = Path.home() / '.cache' / 'doc_fonts'
+
+INTER_FACES = {
+    'Inter':            'Inter-Regular.ttf',
+    'Inter-Medium':     'Inter-Medium.ttf',
+    'Inter-SemiBold':   'Inter-SemiBold.ttf',
+    'Inter-Bold':       'Inter-Bold.ttf',
+    'Inter-ExtraBold':  'Inter-ExtraBold.ttf',
+    'Inter-Black':      'Inter-Black.ttf',
+    'Inter-Italic':     'Inter-Italic.ttf',
+    'Inter-BoldItalic': 'Inter-BoldItalic.ttf',
+}
+INTER_VARIABLE = 'InterVariable.ttf'
+
+INTER_RELEASE_URL = 'https://github.com/rsms/inter/releases/download/v4.0/Inter-4.0.zip'
+INTER_RELEASE_API = 'https://api.github.com/repos/rsms/inter/releases/tags/v4.0'
+
+# font file → (download URL, member of that zip)
+SOURCES = {fn: (INTER_RELEASE_URL, f'extras/ttf/{fn}') for fn in INTER_FACES.values()}
+SOURCES[INTER_VARIABLE] = (INTER_RELEASE_URL, INTER_VARIABLE)
+
+
+def file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+# ── Store ────────────────────────────────────────────────────────────────────
+
+def read_lock():
+    """{font file: pinned sha256} from LOCK_FILE (sha256sum format); {} if there is none."""
+    if not LOCK_FILE.exists():
+        return {}
+    pins = {}
+    for line in LOCK_FILE.read_text().splitlines():
+        if line.strip() and not line.startswith('#'):
+            digest, fn = line.split(maxsplit=1)
+            pins[fn.lstrip('*')] = digest
+    return pins
+
+
+def write_lock(pins):
+    lines = ['# SHA-256 of every font scripts/doc_fonts.py provides (Inter v4.0 release).',
+             '# Filled by: python3 scripts/doc_fonts.py fetch  (release zip checked against the',
+             "# digest GitHub publishes for it), or from a trusted copy with fetch --pin-new"]
+    lines += [f'{pins[fn]}  {fn}' for fn in sorted(pins)]
+    LOCK_FILE.write_text('\n'.join(lines) + '\n')
+
+
+def store_path(digest):
+    return STORE_DIR / f'{digest}.ttf'
+
+
+def font_path(fn, pins=None):
+    """
+    (store path, pinned digest) of a provisioned font file. Raises RuntimeError
+    if it isn't pinned or isn't in the store; does not check its contents.
+    """
+    digest = (read_lock() if pins is None else pins).get(fn)
+    if digest is None:
+        raise RuntimeError(f"Font {fn} is not pinned in {LOCK_FILE.name} — pin a trusted copy: "
+                           f"python3 scripts/doc_fonts.py fetch --pin-new")
+    if not store_path(digest).exists():
+        raise RuntimeError(f"Font {fn} is not provisioned — run: python3 scripts/doc_fonts.py fetch")
+    return store_path(digest), digest
+
+
+def verify(path, digest):
+    """Raise RuntimeError unless the file at path hashes to digest."""
+    actual = file_sha256(path)
+    if actual != digest:
+        raise RuntimeError(f"{path} is corrupt (sha256 {actual}, expected {digest}) — "
+                           f"delete it and run: python3 scripts/doc_fonts.py fetch")
+
+
+def _put(data, expected=None):
+    """Add font bytes to the store (verified against expected if given); returns the digest."""
+    digest = hashlib.sha256(data).hexdigest()
+    if expected and digest != expected:
+        raise RuntimeError(f"sha256 {digest} does not match the pinned {expected}")
+    path = store_path(digest)
+    if not path.exists():
+        STORE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp.write_bytes(data)
+        tmp.replace(path)
+    return digest
+
+
+def _from_local(fn, sources):
+    """A font file's bytes from the first --from folder or zip that has it, else None."""
+    member = SOURCES[fn][1]
+    for src in sources:
+        if src.is_dir():
+            if (src / fn).is_file():
+                return (src / fn).read_bytes()
+            continue
+        with zipfile.ZipFile(src) as zf:
+            names = set(zf.namelist())
+            for name in (member, fn):
+                if name in names:
+                    return zf.read(name)
+    return None
+
+
+def release_digest(url):
+    """
+    The SHA-256 GitHub publishes for the Inter release asset at url (the
+    asset's "digest" in the releases API), or None if it publishes none.
+    """
+    with urllib.request.urlopen(INTER_RELEASE_API, timeout=30) as resp:
+        release = json.load(resp)
+    for asset in release.get('assets', []):
+        if asset.get('browser_download_url') == url:
+            algorithm, _, digest = (asset.get('digest') or '').partition(':')
+            return digest if algorithm == 'sha256' and digest else None
+    return None
+
+
+def _download(url, downloads, report):
+    """The release zip at url, downloaded once per fetch; None if the download fails."""
+    if url not in downloads:
+        report(f"  downloading {url}")
+        try:
+            with urllib.request.urlopen(url, timeout=120) as resp:
+                downloads[url] = resp.read()
+        except OSError as e:
+            report(f"  ✗ download failed: {e}")
+            downloads[url] = None
+    return downloads[url]
+
+
+def _attested(url, data, report):
+    """True if the downloaded release zip hashes to the SHA-256 GitHub publishes for it."""
+    try:
+        published = release_digest(url)
+    except (OSError, ValueError) as e:
+        report(f"  ✗ could not read the published digest of {url}: {e}")
+        return False
+    if published is None:
+        report(f"  ✗ GitHub publishes no digest for {url}")
+        return False
+    actual = hashlib.sha256(data).hexdigest()
+    if actual != published:
+        report(f"  ✗ {url} is sha256 {actual}, GitHub publishes {published}")
+        return False
+    report(f"  {url} matches its published sha256 {published[:12]}")
+    return True
+
+
+def fetch(sources=(), offline=False, pin_new=False, report=print):
+    """
+    Provision every SOURCES font into the store, from the local sources
+    (folders / zips) when they have it, else by download (unless offline).
+    Fonts must match their LOCK_FILE pin. An unpinned font is taken only from
+    a download that matches GitHub's published digest, unless pin_new, which
+    pins it to the bytes found wherever they came from. Returns the file
+    names that could not be provisioned.
+    """
+    pins = read_lock()
+    downloads, attested = {}, {}
+    missing = []
+    for fn, (url, member) in SOURCES.items():
+        pinned = pins.get(fn)
+        if pinned and store_path(pinned).exists() and file_sha256(store_path(pinned)) == pinned:
+            continue
+        trusted = bool(pinned) or pin_new
+        data = _from_local(fn, sources) if trusted else None
+        origin = 'local copy'
+        if data is None and not offline:
+            archive = _download(url, downloads, report)
+            if archive is not None and not trusted:
+                if url not in attested:
+                    attested[url] = _attested(url, archive, report)
+                trusted = attested[url]
+                origin = 'download, GitHub digest'
+            else:
+                origin = 'download'
+            if archive is not None and trusted:
+                with zipfile.ZipFile(io.BytesIO(archive)) as zf:
+                    data = zf.read(member)
+        if data is None:
+            missing.append(fn)
+            if not trusted:
+                report(f"  ✗ {fn}: not pinned in {LOCK_FILE.name} and no GitHub-attested download "
+                       f"(pin a trusted copy with --pin-new)")
+            else:
+                report(f"  ✗ {fn}: not found" + (" in --from sources" if offline else ""))
+            continue
+        try:
+            pins[fn] = _put(data, pinned)
+        except RuntimeError as e:
+            missing.append(fn)
+            report(f"  ✗ {fn} ({origin}): {e}")
+            continue
+        report(f"  ✓ {fn} ({origin}{'' if pinned else ', newly pinned'})")
+    if pins != read_lock():
+        write_lock(pins)
+        report(f"Pinned new fonts in {LOCK_FILE.relative_to(SCRIPTS_DIR.parent)} — review and commit it")
+    return missing
+
+
+def check(report=print):
+    """Verify every SOURCES font is pinned and intact in the store; returns the file names that aren't."""
+    pins = read_lock()
+    bad = []
+    for fn in SOURCES:
+        try:
+            path, digest = font_path(fn, pins)
+            verify(path, digest)
+        except RuntimeError as e:
+            bad.append(fn)
+            report(f"  ✗ {e}")
+        else:
+            report(f"  ✓ {fn}  {digest[:12]}")
+    return bad
+
+
+# ── Parsed-face cache ────────────────────────────────────────────────────────
+
+def _pdf_scale(units_per_em):
+    """TTFontFile._pdfScale (a lambda, so not pickled): font units → 1/1000 em."""
+    if units_per_em == 1000:
+        return lambda x: x
+    mult = 1000 / units_per_em
+    return lambda x: x * mult
+
+
+def load_face(path, digest):
+    """
+    The parsed TTFontFace for a store font, after checking it still hashes to
+    digest: unpickled from CACHE_DIR when a face for the same digest and
+    reportlab version is there, else parsed and stored.
+    """
+    verify(path, digest)
+    cached = CACHE_DIR / f"{digest}-rl{REPORTLAB_VERSION}.pickle"
+    try:
+        state = pickle.loads(cached.read_bytes())
+    except (OSError, pickle.PickleError, EOFError, AttributeError):
+        state = None
+    if state is not None:
+        face = ttfonts.TTFontFace.__new__(ttfonts.TTFontFace)
+        face.__dict__.update(state, filename=str(path))
+        face._pdfScale = _pdf_scale(face.unitsPerEm)
+        return face
+
+    face = ttfonts.TTFontFace(str(path))
+    state = {k: v for k, v in vars(face).items() if k != '_pdfScale'}
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cached.with_suffix(f'.{os.getpid()}.tmp')
+        tmp.write_bytes(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+        tmp.replace(cached)
+    except OSError:
+        pass  # read-only home: just parse every time
+    return face
+
+
+def _ttfont(name, path, face):
+    """
+    A TTFont around an already-parsed face. TTFont.__init__ always parses its
+    file; swapping the module's TTFontFace for the call keeps the rest of its
+    setup (encoding, subset state, shaping) reportlab's own.
+    """
+    parse = ttfonts.TTFontFace
+    ttfonts.TTFontFace = lambda *args, **kwargs: face
+    try:
+        return ttfonts.TTFont(name, str(path))
+    finally:
+        ttfonts.TTFontFace = parse
+
+
+# ── Registration ─────────────────────────────────────────────────────────────
+
+def register(name, fn, pins=None):
+    """Register the provisioned font file fn as reportlab font name, unless this process already has."""
+    path, digest = font_path(fn, pins)
+    sys.audit('doc_fonts.use', str(path))
+    if name not in pdfmetrics.getRegisteredFontNames():
+        pdfmetrics.registerFont(_ttfont(name, path, load_face(path, digest)))
+
+
+def register_inter():
+    """Register every INTER_FACES weight and the "Inter" family."""
+    pins = read_lock()
+    for name, fn in INTER_FACES.items():
+        register(name, fn, pins)
+    pdfmetrics.registerFontFamily('Inter', normal='Inter', bold='Inter-Bold',
+                                  italic='Inter-Italic', boldItalic='Inter-BoldItalic')
+
+
+@functools.lru_cache(maxsize=None)
+def inter_variable():
+    """Path of the provisioned, verified variable Inter TTF (opsz/wght axes); checked once per process."""
+    path, digest = font_path(INTER_VARIABLE)
+    verify(path, digest)
+    return path
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Provision and verify the document fonts.')
+    sub = ap.add_subparsers(dest='command', required=True)
+    fp = sub.add_parser('fetch', help='copy every font into the store, pinning the GitHub-attested release')
+    fp.add_argument('--from', dest='sources', type=Path, action='append', default=[],
+                    metavar='PATH', help='folder of TTFs or zip (e.g. Inter-4.0.zip) to take fonts from')
+    fp.add_argument('--offline', action='store_true',
+                    help='only use --from sources; never download')
+    fp.add_argument('--pin-new', action='store_true',
+                    help='pin fonts missing from the lock file to the bytes found (trusted sources only)')
+    sub.add_parser('check', help='verify every font is pinned and intact in the store')
+    args = ap.parse_args(argv)
+
+    if args.command == 'fetch':
+        failed = fetch(args.sources, args.offline, args.pin_new)
+    else:
+        failed = check()
+    if failed:
+        print(f"{len(failed)} font(s) unavailable: {', '.join(failed)}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -100,117 +100,124 @@ import os
 OUTPUT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
                            "public", "docs", "ipad-check-in-process.pdf")
 
-doc = SimpleDocTemplate(
-    OUTPUT_PATH,
-    pagesize=letter,
-    rightMargin=0.75*inch, leftMargin=0.75*inch,
-    topMargin=0.65*inch,   bottomMargin=0.65*inch,
-)
-story = []
-build_header(story)
-
-# Title
-story.append(Paragraph("IPAD PATIENT CHECK-IN PROCESS", title_s))
-story.append(Paragraph("Front Desk Quick Reference Guide", subtitle_s))
-story.append(Spacer(1, 14))
-
-# ── ONE-TIME SETUP ───────────────────────────────────────────────────────────
-story += section_label("One-Time Setup")
-bullet_text = [
-    'Open <b>app.range-medical.com/check-in</b> in Safari on the iPad',
-    'Tap the <b>Share</b> button (square with arrow) \u2192 <b>Add to Home Screen</b>',
-    'This gives you a one-tap icon to launch the check-in screen',
-]
-for t in bullet_text:
-    story.append(bullet(t))
-
-story.append(Spacer(1, 6))
-
-# ── CHECK-IN PROCESS ────────────────────────────────────────────────────────
-story += section_label("Check-In Process")
-story.append(Paragraph("Follow these steps each time a patient walks in.", body_s))
-story.append(Spacer(1, 6))
-
-# Step 1
-story.append(Paragraph("Step 1 \u2014 Open the Check-In Page", step_s))
-story.append(bullet("Tap the bookmark icon on the iPad home screen, or navigate to <b>app.range-medical.com/check-in</b>"))
-story.append(Spacer(1, 2))
-
-# Step 2
-story.append(Paragraph("Step 2 \u2014 Find the Patient", step_s))
-story.append(bullet("<b>Existing Patient:</b> Type their name, email, or phone in the search box, then tap their name when it appears"))
-story.append(bullet("<b>New Patient:</b> Tap \u201cNew Patient\u201d and enter first name + last name (email and phone are optional)"))
-story.append(Spacer(1, 2))
-
-# Step 3
-story.append(Paragraph("Step 3 \u2014 Select Forms", step_s))
-story.append(bullet('Tap <b>\u201cNext: Select Forms\u201d</b>'))
-story.append(bullet("Choose a <b>quick preset</b> (e.g., New Patient, HRT Patient, Weight Loss) OR select individual forms manually"))
-story.append(Spacer(1, 2))
-
-# Step 4
-story.append(Paragraph("Step 4 \u2014 Hand iPad to Patient", step_s))
-story.append(bullet('Tap the green <b>\u201cHand iPad to Patient\u201d</b> button'))
-story.append(bullet("Hand the iPad to the patient"))
-story.append(bullet("Patient fills out each form (intake, HIPAA, consents)"))
-story.append(bullet("Patient info carries forward \u2014 they only enter their details once"))
-story.append(Spacer(1, 2))
-
-# Step 5
-story.append(Paragraph("Step 5 \u2014 Patient Completes Forms", step_s))
-story.append(bullet('When all forms are done, the screen shows <b>\u201cPlease return this iPad to the front desk\u201d</b>'))
-story.append(bullet("Patient hands iPad back to staff"))
-story.append(Spacer(1, 2))
-
-# Step 6
-story.append(Paragraph("Step 6 \u2014 Reset for Next Patient", step_s))
-story.append(bullet('Staff taps <b>\u201cStart New Check-In\u201d</b> to reset for the next patient'))
-story.append(Spacer(1, 8))
-
-# ── QUICK PRESET REFERENCE ──────────────────────────────────────────────────
-story += section_label("Quick Preset Reference")
-
-preset_data = [
-    ["Preset", "Forms Included"],
-    ["New Patient", "Medical Intake + HIPAA"],
-    ["HRT Patient", "Medical Intake + HIPAA + HRT Consent + Blood Draw"],
-    ["Weight Loss", "Medical Intake + HIPAA + Weight Loss Consent + Blood Draw"],
-    ["IV Therapy", "Medical Intake + HIPAA + IV & Injection Consent"],
-    ["Peptides", "Medical Intake + HIPAA + Peptide Consent"],
-    ["HBOT", "Medical Intake + HIPAA + HBOT Consent"],
-    ["Red Light", "Medical Intake + HIPAA + Red Light Consent"],
-    ["PRP", "Medical Intake + HIPAA + PRP Consent + Blood Draw"],
-    ["Exosome IV", "Medical Intake + HIPAA + Exosome IV Consent"],
-    ["Labs + Questionnaire", "Medical Intake + HIPAA + Blood Draw + Baseline Questionnaire"],
-]
-
-header_row = [Paragraph(c, th_s) for c in preset_data[0]]
-data_rows = [[Paragraph(r[0], tv_bold_s), Paragraph(r[1], tv_s)] for r in preset_data[1:]]
-all_rows = [header_row] + data_rows
-
-preset_tbl = Table(all_rows, colWidths=[1.6*inch, 5.4*inch])
-preset_tbl.setStyle(TableStyle([
-    ('TOPPADDING',    (0,0),(-1,-1), 5),
-    ('BOTTOMPADDING', (0,0),(-1,-1), 5),
-    ('LEFTPADDING',   (0,0),(-1,-1), 10),
-    ('RIGHTPADDING',  (0,0),(-1,-1), 10),
-    ('VALIGN',        (0,0),(-1,-1), 'TOP'),
-    ('BACKGROUND',    (0,0),(-1,0), LIGHT_GRAY),
-    ('ROWBACKGROUNDS',(0,1),(-1,-1), [WHITE, LIGHT_GRAY]),
-    ('BOX',           (0,0),(-1,-1), 0.5, RULE_GRAY),
-    ('LINEBELOW',     (0,0),(-1,-1), 0.5, RULE_GRAY),
-]))
-story.append(preset_tbl)
-story.append(Spacer(1, 8))
-
-# ── WHERE DOES THE DATA GO? ─────────────────────────────────────────────────
-story += section_label("Where Does the Data Go?")
-story.append(bullet("All intake data saves to the patient\u2019s profile in the CRM"))
-story.append(bullet("Consent forms are stored and linked to the patient record"))
-story.append(bullet("Works exactly the same as sending forms via SMS or email \u2014 same database, same workflow"))
-
-story.append(Spacer(1, 16))
-build_footer(story)
-doc.build(story)
-
-print(f"\u2713 PDF generated: {OUTPUT_PATH}")
+
+def build(output_path=OUTPUT_PATH):
+    doc = SimpleDocTemplate(
+        output_path,
+        pagesize=letter,
+        rightMargin=0.75*inch, leftMargin=0.75*inch,
+        topMargin=0.65*inch,   bottomMargin=0.65*inch,
+    )
+    story = []
+    build_header(story)
+
+    # Title
+    story.append(Paragraph("IPAD PATIENT CHECK-IN PROCESS", title_s))
+    story.append(Paragraph("Front Desk Quick Reference Guide", subtitle_s))
+    story.append(Spacer(1, 14))
+
+    # ── ONE-TIME SETUP ───────────────────────────────────────────────────────────
+    story += section_label("One-Time Setup")
+    bullet_text = [
+        'Open <b>app.range-medical.com/check-in</b> in Safari on the iPad',
+        'Tap the <b>Share</b> button (square with arrow) \u2192 <b>Add to Home Screen</b>',
+        'This gives you a one-tap icon to launch the check-in screen',
+    ]
+    for t in bullet_text:
+        story.append(bullet(t))
+
+    story.append(Spacer(1, 6))
+
+    # ── CHECK-IN PROCESS ────────────────────────────────────────────────────────
+    story += section_label("Check-In Process")
+    story.append(Paragraph("Follow these steps each time a patient walks in.", body_s))
+    story.append(Spacer(1, 6))
+
+    # Step 1
+    story.append(Paragraph("Step 1 \u2014 Open the Check-In Page", step_s))
+    story.append(bullet("Tap the bookmark icon on the iPad home screen, or navigate to <b>app.range-medical.com/check-in</b>"))
+    story.append(Spacer(1, 2))
+
+    # Step 2
+    story.append(Paragraph("Step 2 \u2014 Find the Patient", step_s))
+    story.append(bullet("<b>Existing Patient:</b> Type their name, email, or phone in the search box, then tap their name when it appears"))
+    story.append(bullet("<b>New Patient:</b> Tap \u201cNew Patient\u201d and enter first name + last name (email and phone are optional)"))
+    story.append(Spacer(1, 2))
+
+    # Step 3
+    story.append(Paragraph("Step 3 \u2014 Select Forms", step_s))
+    story.append(bullet('Tap <b>\u201cNext: Select Forms\u201d</b>'))
+    story.append(bullet("Choose a <b>quick preset</b> (e.g., New Patient, HRT Patient, Weight Loss) OR select individual forms manually"))
+    story.append(Spacer(1, 2))
+
+    # Step 4
+    story.append(Paragraph("Step 4 \u2014 Hand iPad to Patient", step_s))
+    story.append(bullet('Tap the green <b>\u201cHand iPad to Patient\u201d</b> button'))
+    story.append(bullet("Hand the iPad to the patient"))
+    story.append(bullet("Patient fills out each form (intake, HIPAA, consents)"))
+    story.append(bullet("Patient info carries forward \u2014 they only enter their details once"))
+    story.append(Spacer(1, 2))
+
+    # Step 5
+    story.append(Paragraph("Step 5 \u2014 Patient Completes Forms", step_s))
+    story.append(bullet('When all forms are done, the screen shows <b>\u201cPlease return this iPad to the front desk\u201d</b>'))
+    story.append(bullet("Patient hands iPad back to staff"))
+    story.append(Spacer(1, 2))
+
+    # Step 6
+    story.append(Paragraph("Step 6 \u2014 Reset for Next Patient", step_s))
+    story.append(bullet('Staff taps <b>\u201cStart New Check-In\u201d</b> to reset for the next patient'))
+    story.append(Spacer(1, 8))
+
+    # ── QUICK PRESET REFERENCE ──────────────────────────────────────────────────
+    story += section_label("Quick Preset Reference")
+
+    preset_data = [
+        ["Preset", "Forms Included"],
+        ["New Patient", "Medical Intake + HIPAA"],
+        ["HRT Patient", "Medical Intake + HIPAA + HRT Consent + Blood Draw"],
+        ["Weight Loss", "Medical Intake + HIPAA + Weight Loss Consent + Blood Draw"],
+        ["IV Therapy", "Medical Intake + HIPAA + IV & Injection Consent"],
+        ["Peptides", "Medical Intake + HIPAA + Peptide Consent"],
+        ["HBOT", "Medical Intake + HIPAA + HBOT Consent"],
+        ["Red Light", "Medical Intake + HIPAA + Red Light Consent"],
+        ["PRP", "Medical Intake + HIPAA + PRP Consent + Blood Draw"],
+        ["Exosome IV", "Medical Intake + HIPAA + Exosome IV Consent"],
+        ["Labs + Questionnaire", "Medical Intake + HIPAA + Blood Draw + Baseline Questionnaire"],
+    ]
+
+    header_row = [Paragraph(c, th_s) for c in preset_data[0]]
+    data_rows = [[Paragraph(r[0], tv_bold_s), Paragraph(r[1], tv_s)] for r in preset_data[1:]]
+    all_rows = [header_row] + data_rows
+
+    preset_tbl = Table(all_rows, colWidths=[1.6*inch, 5.4*inch])
+    preset_tbl.setStyle(TableStyle([
+        ('TOPPADDING',    (0,0),(-1,-1), 5),
+        ('BOTTOMPADDING', (0,0),(-1,-1), 5),
+        ('LEFTPADDING',   (0,0),(-1,-1), 10),
+        ('RIGHTPADDING',  (0,0),(-1,-1), 10),
+        ('VALIGN',        (0,0),(-1,-1), 'TOP'),
+        ('BACKGROUND',    (0,0),(-1,0), LIGHT_GRAY),
+        ('ROWBACKGROUNDS',(0,1),(-1,-1), [WHITE, LIGHT_GRAY]),
+        ('BOX',           (0,0),(-1,-1), 0.5, RULE_GRAY),
+        ('LINEBELOW',     (0,0),(-1,-1), 0.5, RULE_GRAY),
+    ]))
+    story.append(preset_tbl)
+    story.append(Spacer(1, 8))
+
+    # ── WHERE DOES THE DATA GO? ─────────────────────────────────────────────────
+    story += section_label("Where Does the Data Go?")
+    story.append(bullet("All intake data saves to the patient\u2019s profile in the CRM"))
+    story.append(bullet("Consent forms are stored and linked to the patient record"))
+    story.append(bullet("Works exactly the same as sending forms via SMS or email \u2014 same database, same workflow"))
+
+    story.append(Spacer(1, 16))
+    build_footer(story)
+    doc.build(story)
+
+    print(f"\u2713 PDF generated: {output_path}")
+    return output_path
+
+
+if __name__ == '__main__':
+    build()
@@ -127,163 +127,170 @@ def build_footer(story):
 
 import os
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "public", "docs")
-os.makedirs(OUTPUT_DIR, exist_ok=True)
 OUTPUT_PATH = os.path.join(OUTPUT_DIR, "self-injection-instructions.pdf")
 
-doc = SimpleDocTemplate(
-    OUTPUT_PATH,
-    pagesize=letter,
-    rightMargin=0.75*inch, leftMargin=0.75*inch,
-    topMargin=0.65*inch,   bottomMargin=0.65*inch,
-)
-story = []
-build_header(story)
-
-# Title
-story.append(Paragraph("SUBCUTANEOUS SELF-INJECTION GUIDE", title_s))
-story.append(Paragraph("Weight Loss Medication \u2014 Abdominal Injection Instructions", subtitle_s))
-story.append(Spacer(1, 14))
-
-# ── WHAT YOU'LL NEED ─────────────────────────────────────────────────────────
-story += section_label("What You Will Need")
-story.append(bullet("Your pre-filled syringe (provided by Range Medical)"))
-story.append(bullet("Alcohol swabs"))
-story.append(bullet("Sharps container for used syringes"))
-story.append(Spacer(1, 6))
-
-# ── BEFORE YOU BEGIN ─────────────────────────────────────────────────────────
-story += section_label("Before You Begin")
-story.append(bullet("Wash your hands thoroughly with soap and warm water for at least 20 seconds"))
-story.append(bullet("Remove your pre-filled syringe from the refrigerator 15\u201320 minutes before injecting to allow it to reach room temperature"))
-story.append(bullet("Check the expiration date on the syringe label \u2014 do not use expired medication"))
-story.append(bullet("Inspect the medication for particles, cloudiness, or discoloration \u2014 if present, do not use"))
-story.append(bullet("Verify the medication name on the label matches your prescription"))
-story.append(Spacer(1, 4))
-
-# ── STEP-BY-STEP INSTRUCTIONS ───────────────────────────────────────────────
-story += section_label("Step-by-Step Instructions")
-
-for el in numbered_step(1, "Prepare Your Syringe", [
-    "Remove the pre-filled syringe from its packaging.",
-    "Remove the needle cap by pulling it straight off \u2014 do not twist.",
-    "Do not touch the needle or let it contact any surface.",
-]):
-    story.append(el)
-
-for el in numbered_step(2, "Choose Your Injection Site", [
-    "The injection goes into the fatty tissue of your abdomen (stomach area).",
-    "Stay at least 2 inches away from your belly button.",
-    "Rotate your injection site each time \u2014 do not inject in the same spot twice in a row.",
-    "Avoid areas with bruises, scars, stretch marks, or irritation.",
-]):
-    story.append(el)
-
-for el in numbered_step(3, "Clean the Injection Site", [
-    "Wipe the chosen area with a fresh alcohol swab using a circular motion.",
-    "Allow the skin to air dry completely before injecting.",
-]):
-    story.append(el)
-
-for el in numbered_step(4, "Inject the Medication", [
-    "Pinch a 1\u20132 inch fold of skin between your thumb and index finger.",
-    "Hold the syringe like a dart at a 90-degree angle (straight in) to the skin fold.",
-    "Insert the needle quickly and smoothly into the pinched skin.",
-    "Release the pinched skin.",
-    "Push the plunger down slowly and steadily to inject the full dose.",
-    "Wait 5\u201310 seconds with the needle in place before withdrawing.",
-    "Pull the needle straight out.",
-]):
-    story.append(el)
-
-for el in numbered_step(5, "After the Injection", [
-    "Apply light pressure with a clean cotton ball or gauze if needed \u2014 do not rub the site.",
-    "Dispose of the entire used syringe immediately in your sharps container.",
-    "Never recap, bend, or reuse syringes.",
-    "Record the date and injection site location for your records.",
-]):
-    story.append(el)
-
-# ── INJECTION SITE ROTATION ─────────────────────────────────────────────────
-story += section_label("Injection Site Rotation")
-story.append(Paragraph(
-    "Rotating your injection site prevents skin irritation and ensures consistent medication absorption. "
-    "Think of your abdomen as four quadrants around your belly button:",
-    body_s,
-))
-story.append(Spacer(1, 6))
-
-quad_data = [
-    [Paragraph("Week", th_s), Paragraph("Injection Area", th_s)],
-    [Paragraph("Week 1", tv_bold_s), Paragraph("Upper left abdomen", tv_s)],
-    [Paragraph("Week 2", tv_bold_s), Paragraph("Upper right abdomen", tv_s)],
-    [Paragraph("Week 3", tv_bold_s), Paragraph("Lower left abdomen", tv_s)],
-    [Paragraph("Week 4", tv_bold_s), Paragraph("Lower right abdomen", tv_s)],
-]
-quad_tbl = Table(quad_data, colWidths=[1.5*inch, 5.5*inch])
-quad_tbl.setStyle(TableStyle([
-    ('TOPPADDING',    (0,0),(-1,-1), 5),
-    ('BOTTOMPADDING', (0,0),(-1,-1), 5),
-    ('LEFTPADDING',   (0,0),(-1,-1), 10),
-    ('RIGHTPADDING',  (0,0),(-1,-1), 10),
-    ('VALIGN',        (0,0),(-1,-1), 'TOP'),
-    ('BACKGROUND',    (0,0),(-1,0),  LIGHT_GRAY),
-    ('ROWBACKGROUNDS',(0,1),(-1,-1), [WHITE, LIGHT_GRAY]),
-    ('BOX',           (0,0),(-1,-1), 0.5, RULE_GRAY),
-    ('LINEBELOW',     (0,0),(-1,-1), 0.5, RULE_GRAY),
-]))
-story.append(quad_tbl)
-story.append(Spacer(1, 4))
-story.append(Paragraph("Then repeat the cycle. Always stay at least 2 inches from your belly button.", note_s))
-
-# ── STORAGE ──────────────────────────────────────────────────────────────────
-story += section_label("Medication Storage")
-story.append(bullet("Store pre-filled syringes in the refrigerator between 36\u201346\u00b0F (2\u20138\u00b0C) unless otherwise directed"))
-story.append(bullet("Do not freeze \u2014 discard medication if it has been frozen"))
-story.append(bullet("Keep syringes in their original packaging to protect from light"))
-story.append(bullet("Never store medication in your car, bathroom, or in direct sunlight"))
-story.append(Spacer(1, 4))
-
-# ── COMMON SIDE EFFECTS ─────────────────────────────────────────────────────
-story += section_label("Common Side Effects")
-story.append(Paragraph("The following are normal and typically resolve within a few days:", body_s))
-story.append(Spacer(1, 4))
-story.append(bullet("Mild redness, swelling, or itching at the injection site"))
-story.append(bullet("Small bruise at the injection site"))
-story.append(bullet("Nausea (especially in the first few weeks \u2014 tends to improve over time)"))
-story.append(bullet("Decreased appetite (this is expected and part of how the medication works)"))
-story.append(bullet("Mild fatigue or headache"))
-story.append(Spacer(1, 6))
-
-# ── WHEN TO CALL US ──────────────────────────────────────────────────────────
-story += section_label("When to Contact Range Medical")
-story.append(Paragraph("Call or text us at <b>(949) 997-3988</b> if you experience:", warn_s))
-story.append(Spacer(1, 4))
-story.append(bullet("Severe or persistent nausea, vomiting, or abdominal pain"))
-story.append(bullet("Signs of allergic reaction \u2014 rash, hives, difficulty breathing, swelling of face or throat"))
-story.append(bullet("Infection at the injection site \u2014 increasing redness, warmth, swelling, or pus"))
-story.append(bullet("Dizziness, fainting, or rapid heartbeat"))
-story.append(bullet("Any symptom that concerns you or feels unusual"))
-story.append(Spacer(1, 6))
-
-# ── TIPS FOR SUCCESS ─────────────────────────────────────────────────────────
-story += section_label("Tips for Success")
-story.append(bullet("Inject on the same day each week to maintain a consistent schedule"))
-story.append(bullet("Set a weekly reminder on your phone so you don't forget"))
-story.append(bullet("Stay hydrated \u2014 drink plenty of water, especially in the first few days after injection"))
-story.append(bullet("Eat smaller, balanced meals to help manage nausea"))
-story.append(bullet("If you miss a dose, contact Range Medical for guidance \u2014 do not double up"))
-story.append(Spacer(1, 10))
-
-# ── SHARPS DISPOSAL ──────────────────────────────────────────────────────────
-story += section_label("Sharps Disposal")
-story.append(bullet("Always place used needles and syringes in an FDA-cleared sharps container"))
-story.append(bullet("If you don't have a sharps container, use a heavy-duty plastic container with a screw-on lid (e.g., laundry detergent bottle)"))
-story.append(bullet("When the container is \u00be full, seal it and label it \u201cSharps \u2014 Do Not Recycle\u201d"))
-story.append(bullet("Drop off at your local pharmacy or household hazardous waste facility"))
-story.append(bullet("Never throw loose needles in the trash or recycling"))
-story.append(Spacer(1, 12))
-
-# Footer
-build_footer(story)
-doc.build(story)
-print(f"PDF generated: {OUTPUT_PATH}")
+
+def build(output_path=OUTPUT_PATH):
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    doc = SimpleDocTemplate(
+        output_path,
+        pagesize=letter,
+        rightMargin=0.75*inch, leftMargin=0.75*inch,
+        topMargin=0.65*inch,   bottomMargin=0.65*inch,
+    )
+    story = []
+    build_header(story)
+
+    # Title
+    story.append(Paragraph("SUBCUTANEOUS SELF-INJECTION GUIDE", title_s))
+    story.append(Paragraph("Weight Loss Medication \u2014 Abdominal Injection Instructions", subtitle_s))
+    story.append(Spacer(1, 14))
+
+    # ── WHAT YOU'LL NEED ─────────────────────────────────────────────────────────
+    story += section_label("What You Will Need")
+    story.append(bullet("Your pre-filled syringe (provided by Range Medical)"))
+    story.append(bullet("Alcohol swabs"))
+    story.append(bullet("Sharps container for used syringes"))
+    story.append(Spacer(1, 6))
+
+    # ── BEFORE YOU BEGIN ─────────────────────────────────────────────────────────
+    story += section_label("Before You Begin")
+    story.append(bullet("Wash your hands thoroughly with soap and warm water for at least 20 seconds"))
+    story.append(bullet("Remove your pre-filled syringe from the refrigerator 15\u201320 minutes before injecting to allow it to reach room temperature"))
+    story.append(bullet("Check the expiration date on the syringe label \u2014 do not use expired medication"))
+    story.append(bullet("Inspect the medication for particles, cloudiness, or discoloration \u2014 if present, do not use"))
+    story.append(bullet("Verify the medication name on the label matches your prescription"))
+    story.append(Spacer(1, 4))
+
+    # ── STEP-BY-STEP INSTRUCTIONS ───────────────────────────────────────────────
+    story += section_label("Step-by-Step Instructions")
+
+    for el in numbered_step(1, "Prepare Your Syringe", [
+        "Remove the pre-filled syringe from its packaging.",
+        "Remove the needle cap by pulling it straight off \u2014 do not twist.",
+        "Do not touch the needle or let it contact any surface.",
+    ]):
+        story.append(el)
+
+    for el in numbered_step(2, "Choose Your Injection Site", [
+        "The injection goes into the fatty tissue of your abdomen (stomach area).",
+        "Stay at least 2 inches away from your belly button.",
+        "Rotate your injection site each time \u2014 do not inject in the same spot twice in a row.",
+        "Avoid areas with bruises, scars, stretch marks, or irritation.",
+    ]):
+        story.append(el)
+
+    for el in numbered_step(3, "Clean the Injection Site", [
+        "Wipe the chosen area with a fresh alcohol swab using a circular motion.",
+        "Allow the skin to air dry completely before injecting.",
+    ]):
+        story.append(el)
+
+    for el in numbered_step(4, "Inject the Medication", [
+        "Pinch a 1\u20132 inch fold of skin between your thumb and index finger.",
+        "Hold the syringe like a dart at a 90-degree angle (straight in) to the skin fold.",
+        "Insert the needle quickly and smoothly into the pinched skin.",
+        "Release the pinched skin.",
+        "Push the plunger down slowly and steadily to inject the full dose.",
+        "Wait 5\u201310 seconds with the needle in place before withdrawing.",
+        "Pull the needle straight out.",
+    ]):
+        story.append(el)
+
+    for el in numbered_step(5, "After the Injection", [
+        "Apply light pressure with a clean cotton ball or gauze if needed \u2014 do not rub the site.",
+        "Dispose of the entire used syringe immediately in your sharps container.",
+        "Never recap, bend, or reuse syringes.",
+        "Record the date and injection site location for your records.",
+    ]):
+        story.append(el)
+
+    # ── INJECTION SITE ROTATION ─────────────────────────────────────────────────
+    story += section_label("Injection Site Rotation")
+    story.append(Paragraph(
+        "Rotating your injection site prevents skin irritation and ensures consistent medication absorption. "
+        "Think of your abdomen as four quadrants around your belly button:",
+        body_s,
+    ))
+    story.append(Spacer(1, 6))
+
+    quad_data = [
+        [Paragraph("Week", th_s), Paragraph("Injection Area", th_s)],
+        [Paragraph("Week 1", tv_bold_s), Paragraph("Upper left abdomen", tv_s)],
+        [Paragraph("Week 2", tv_bold_s), Paragraph("Upper right abdomen", tv_s)],
+        [Paragraph("Week 3", tv_bold_s), Paragraph("Lower left abdomen", tv_s)],
+        [Paragraph("Week 4", tv_bold_s), Paragraph("Lower right abdomen", tv_s)],
+    ]
+    quad_tbl = Table(quad_data, colWidths=[1.5*inch, 5.5*inch])
+    quad_tbl.setStyle(TableStyle([
+        ('TOPPADDING',    (0,0),(-1,-1), 5),
+        ('BOTTOMPADDING', (0,0),(-1,-1), 5),
+        ('LEFTPADDING',   (0,0),(-1,-1), 10),
+        ('RIGHTPADDING',  (0,0),(-1,-1), 10),
+        ('VALIGN',        (0,0),(-1,-1), 'TOP'),
+        ('BACKGROUND',    (0,0),(-1,0),  LIGHT_GRAY),
+        ('ROWBACKGROUNDS',(0,1),(-1,-1), [WHITE, LIGHT_GRAY]),
+        ('BOX',           (0,0),(-1,-1), 0.5, RULE_GRAY),
+        ('LINEBELOW',     (0,0),(-1,-1), 0.5, RULE_GRAY),
+    ]))
+    story.append(quad_tbl)
+    story.append(Spacer(1, 4))
+    story.append(Paragraph("Then repeat the cycle. Always stay at least 2 inches from your belly button.", note_s))
+
+    # ── STORAGE ──────────────────────────────────────────────────────────────────
+    story += section_label("Medication Storage")
+    story.append(bullet("Store pre-filled syringes in the refrigerator between 36\u201346\u00b0F (2\u20138\u00b0C) unless otherwise directed"))
+    story.append(bullet("Do not freeze \u2014 discard medication if it has been frozen"))
+    story.append(bullet("Keep syringes in their original packaging to protect from light"))
+    story.append(bullet("Never store medication in your car, bathroom, or in direct sunlight"))
+    story.append(Spacer(1, 4))
+
+    # ── COMMON SIDE EFFECTS ─────────────────────────────────────────────────────
+    story += section_label("Common Side Effects")
+    story.append(Paragraph("The following are normal and typically resolve within a few days:", body_s))
+    story.append(Spacer(1, 4))
+    story.append(bullet("Mild redness, swelling, or itching at the injection site"))
+    story.append(bullet("Small bruise at the injection site"))
+    story.append(bullet("Nausea (especially in the first few weeks \u2014 tends to improve over time)"))
+    story.append(bullet("Decreased appetite (this is expected and part of how the medication works)"))
+    story.append(bullet("Mild fatigue or headache"))
+    story.append(Spacer(1, 6))
+
+    # ── WHEN TO CALL US ──────────────────────────────────────────────────────────
+    story += section_label("When to Contact Range Medical")
+    story.append(Paragraph("Call or text us at <b>(949) 997-3988</b> if you experience:", warn_s))
+    story.append(Spacer(1, 4))
+    story.append(bullet("Severe or persistent nausea, vomiting, or abdominal pain"))
+    story.append(bullet("Signs of allergic reaction \u2014 rash, hives, difficulty breathing, swelling of face or throat"))
+    story.append(bullet("Infection at the injection site \u2014 increasing redness, warmth, swelling, or pus"))
+    story.append(bullet("Dizziness, fainting, or rapid heartbeat"))
+    story.append(bullet("Any symptom that concerns you or feels unusual"))
+    story.append(Spacer(1, 6))
+
+    # ── TIPS FOR SUCCESS ─────────────────────────────────────────────────────────
+    story += section_label("Tips for Success")
+    story.append(bullet("Inject on the same day each week to maintain a consistent schedule"))
+    story.append(bullet("Set a weekly reminder on your phone so you don't forget"))
+    story.append(bullet("Stay hydrated \u2014 drink plenty of water, especially in the first few days after injection"))
+    story.append(bullet("Eat smaller, balanced meals to help manage nausea"))
+    story.append(bullet("If you miss a dose, contact Range Medical for guidance \u2014 do not double up"))
+    story.append(Spacer(1, 10))
+
+    # ── SHARPS DISPOSAL ──────────────────────────────────────────────────────────
+    story += section_label("Sharps Disposal")
+    story.append(bullet("Always place used needles and syringes in an FDA-cleared sharps container"))
+    story.append(bullet("If you don't have a sharps container, use a heavy-duty plastic container with a screw-on lid (e.g., laundry detergent bottle)"))
+    story.append(bullet("When the container is \u00be full, seal it and label it \u201cSharps \u2014 Do Not Recycle\u201d"))
+    story.append(bullet("Drop off at your local pharmacy or household hazardous waste facility"))
+    story.append(bullet("Never throw loose needles in the trash or recycling"))
+    story.append(Spacer(1, 12))
+
+    # Footer
+    build_footer(story)
+    doc.build(story)
+    print(f"PDF generated: {output_path}")
+    return output_path
+
+
+if __name__ == '__main__':
+    build()
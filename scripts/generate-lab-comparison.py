@@ -133,9 +133,13 @@ def build_elite_content():
     return items
 
 
-def build(out):
+OUTPUT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           'public', 'lab-panel-comparison.pdf')
+
+
+def build(output_path=OUTPUT_PATH):
     doc = SimpleDocTemplate(
-        out, pagesize=letter,
+        output_path, pagesize=letter,
         leftMargin=0.65 * inch, rightMargin=0.65 * inch,
         topMargin=0.45 * inch, bottomMargin=0.35 * inch,
     )
@@ -241,11 +245,9 @@ def build(out):
     story.append(ft)
 
     doc.build(story)
-    print(f'Generated: {out}')
+    print(f'Generated: {output_path}')
+    return output_path
 
 
 if __name__ == '__main__':
-    here = os.path.dirname(os.path.abspath(__file__))
-    root = os.path.dirname(here)
-    out_path = os.path.join(root, 'public', 'lab-panel-comparison.pdf')
-    build(out_path)
+    build()
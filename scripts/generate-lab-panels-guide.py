@@ -197,332 +197,339 @@ women_elite_extra = [
 
 OUTPUT_PATH = os.path.join(os.path.dirname(__file__), '..', 'public', 'docs', 'lab-panels-guide.pdf')
 
-doc = SimpleDocTemplate(
-    OUTPUT_PATH,
-    pagesize=letter,
-    rightMargin=0.75*inch, leftMargin=0.75*inch,
-    topMargin=0.65*inch,   bottomMargin=0.65*inch,
-)
-story = []
-
-
-# ═══════════════════════════════════════════════════════════════════════════
-# PAGE 1 — ESSENTIAL PANEL
-# ═══════════════════════════════════════════════════════════════════════════
-
-build_header(story)
-story.append(Paragraph("LAB PANELS GUIDE", title_s))
-story.append(Paragraph("What we test, what it means, and why it matters", subtitle_s))
-story.append(Spacer(1, 14))
-
-# Essential Panel header
-story += section_label("Essential Panel")
-
-price_row = Table([[
-    Paragraph("Essential Panel", comp_s),
-    Paragraph("$350", price_lg_s),
-]], colWidths=[5.0*inch, 2.0*inch])
-price_row.setStyle(TableStyle([
-    ('VALIGN',(0,0),(-1,-1),'MIDDLE'),
-    ('TOPPADDING',(0,0),(-1,-1),0),('BOTTOMPADDING',(0,0),(-1,-1),4),
-    ('LEFTPADDING',(0,0),(-1,-1),0),('RIGHTPADDING',(0,0),(-1,-1),0),
-    ('ALIGN',(1,0),(1,0),'RIGHT'),
-]))
-story.append(price_row)
-
-story.append(Paragraph(
-    "Our foundational panel covers hormones, thyroid, metabolic health, and key vitamins. "
-    "Goes beyond standard annual bloodwork — gives you the full baseline.",
-    body_s
-))
-story.append(Spacer(1, 6))
-story.append(Paragraph("55 biomarkers (men) • 57 biomarkers (women)", body_sm_s))
-story.append(Spacer(1, 10))
-
-# Men's Essential
-story.append(Paragraph("Men’s Essential Panel", sub_s))
-story.append(biomarker_table(men_essential, descriptions))
-story.append(Spacer(1, 10))
-
-# Women's Essential — note the extra markers (FSH, LH, Progesterone)
-story.append(Paragraph("Women’s Essential Panel", sub_s))
-story.append(Paragraph(
-    "Includes everything in the men’s panel (except PSA) plus FSH, LH, and Progesterone.",
-    note_s
-))
-women_only = [m for m in women_essential if m not in men_essential]
-if women_only:
-    for m in women_only:
-        story.append(check_bullet(f"<b>{m}</b> — {descriptions.get(m, '')}"))
-story.append(Spacer(1, 4))
-
-build_footer(story)
-
-
-# ═══════════════════════════════════════════════════════════════════════════
-# PAGE 2 — ELITE PANEL
-# ═══════════════════════════════════════════════════════════════════════════
-
-story.append(PageBreak())
-build_header(story)
-story += section_label("Elite Panel")
-
-price_row2 = Table([[
-    Paragraph("Elite Panel", comp_s),
-    Paragraph("$750", price_lg_s),
-]], colWidths=[5.0*inch, 2.0*inch])
-price_row2.setStyle(TableStyle([
-    ('VALIGN',(0,0),(-1,-1),'MIDDLE'),
-    ('TOPPADDING',(0,0),(-1,-1),0),('BOTTOMPADDING',(0,0),(-1,-1),4),
-    ('LEFTPADDING',(0,0),(-1,-1),0),('RIGHTPADDING',(0,0),(-1,-1),0),
-    ('ALIGN',(1,0),(1,0),'RIGHT'),
-]))
-story.append(price_row2)
-
-story.append(Paragraph(
-    "Everything in the Essential Panel plus advanced cardiovascular, inflammation, "
-    "and longevity markers. The most comprehensive panel we offer — includes markers "
-    "many clinics skip entirely.",
-    body_s
-))
-story.append(Spacer(1, 6))
-story.append(Paragraph("78 biomarkers (men and women)", body_sm_s))
-story.append(Spacer(1, 6))
-
-story.append(Paragraph(
-    "Includes all Essential Panel markers, plus the following:",
-    note_s
-))
-story.append(Spacer(1, 4))
-
-# Men's Elite extras
-story.append(Paragraph("Additional Men’s Elite Markers", sub_s))
-story.append(biomarker_table(men_elite_extra, descriptions))
-story.append(Spacer(1, 10))
-
-# Women's Elite extras
-story.append(Paragraph("Additional Women’s Elite Markers", sub_s))
-women_diff = [m for m in women_elite_extra if m not in men_elite_extra]
-if women_diff:
+
+def build(output_path=OUTPUT_PATH):
+    doc = SimpleDocTemplate(
+        output_path,
+        pagesize=letter,
+        rightMargin=0.75*inch, leftMargin=0.75*inch,
+        topMargin=0.65*inch,   bottomMargin=0.65*inch,
+    )
+    story = []
+
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # PAGE 1 — ESSENTIAL PANEL
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    build_header(story)
+    story.append(Paragraph("LAB PANELS GUIDE", title_s))
+    story.append(Paragraph("What we test, what it means, and why it matters", subtitle_s))
+    story.append(Spacer(1, 14))
+
+    # Essential Panel header
+    story += section_label("Essential Panel")
+
+    price_row = Table([[
+        Paragraph("Essential Panel", comp_s),
+        Paragraph("$350", price_lg_s),
+    ]], colWidths=[5.0*inch, 2.0*inch])
+    price_row.setStyle(TableStyle([
+        ('VALIGN',(0,0),(-1,-1),'MIDDLE'),
+        ('TOPPADDING',(0,0),(-1,-1),0),('BOTTOMPADDING',(0,0),(-1,-1),4),
+        ('LEFTPADDING',(0,0),(-1,-1),0),('RIGHTPADDING',(0,0),(-1,-1),0),
+        ('ALIGN',(1,0),(1,0),'RIGHT'),
+    ]))
+    story.append(price_row)
+
+    story.append(Paragraph(
+        "Our foundational panel covers hormones, thyroid, metabolic health, and key vitamins. "
+        "Goes beyond standard annual bloodwork — gives you the full baseline.",
+        body_s
+    ))
+    story.append(Spacer(1, 6))
+    story.append(Paragraph("55 biomarkers (men) • 57 biomarkers (women)", body_sm_s))
+    story.append(Spacer(1, 10))
+
+    # Men's Essential
+    story.append(Paragraph("Men’s Essential Panel", sub_s))
+    story.append(biomarker_table(men_essential, descriptions))
+    story.append(Spacer(1, 10))
+
+    # Women's Essential — note the extra markers (FSH, LH, Progesterone)
+    story.append(Paragraph("Women’s Essential Panel", sub_s))
     story.append(Paragraph(
-        f"Same as men’s Elite extras (above), except replaces PSA with: "
-        + ", ".join(f"<b>{m}</b>" for m in women_diff) + ".",
+        "Includes everything in the men’s panel (except PSA) plus FSH, LH, and Progesterone.",
         note_s
     ))
-else:
+    women_only = [m for m in women_essential if m not in men_essential]
+    if women_only:
+        for m in women_only:
+            story.append(check_bullet(f"<b>{m}</b> — {descriptions.get(m, '')}"))
+    story.append(Spacer(1, 4))
+
+    build_footer(story)
+
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # PAGE 2 — ELITE PANEL
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    story.append(PageBreak())
+    build_header(story)
+    story += section_label("Elite Panel")
+
+    price_row2 = Table([[
+        Paragraph("Elite Panel", comp_s),
+        Paragraph("$750", price_lg_s),
+    ]], colWidths=[5.0*inch, 2.0*inch])
+    price_row2.setStyle(TableStyle([
+        ('VALIGN',(0,0),(-1,-1),'MIDDLE'),
+        ('TOPPADDING',(0,0),(-1,-1),0),('BOTTOMPADDING',(0,0),(-1,-1),4),
+        ('LEFTPADDING',(0,0),(-1,-1),0),('RIGHTPADDING',(0,0),(-1,-1),0),
+        ('ALIGN',(1,0),(1,0),'RIGHT'),
+    ]))
+    story.append(price_row2)
+
+    story.append(Paragraph(
+        "Everything in the Essential Panel plus advanced cardiovascular, inflammation, "
+        "and longevity markers. The most comprehensive panel we offer — includes markers "
+        "many clinics skip entirely.",
+        body_s
+    ))
+    story.append(Spacer(1, 6))
+    story.append(Paragraph("78 biomarkers (men and women)", body_sm_s))
+    story.append(Spacer(1, 6))
+
     story.append(Paragraph(
-        "Same as men’s Elite extras above, minus PSA.",
+        "Includes all Essential Panel markers, plus the following:",
         note_s
     ))
-story.append(Spacer(1, 4))
-
-build_footer(story)
-
-
-# ═══════════════════════════════════════════════════════════════════════════
-# PAGE 3 — ADD-ON PANELS
-# ═══════════════════════════════════════════════════════════════════════════
-
-story.append(PageBreak())
-build_header(story)
-story += section_label("Add-On Panels")
-
-story.append(Paragraph(
-    "Add-on panels can be ordered alongside any Essential or Elite blood draw. "
-    "These are specialty tests that go beyond routine bloodwork to screen for "
-    "heavy metal exposure and mold sensitivity.",
-    body_s
-))
-story.append(Spacer(1, 14))
-
-
-# ── Heavy Metals Blood ──────────────────────────────────────────────────────
-
-addon1 = []
-addon1_header = Table([[
-    Paragraph("Heavy Metals Panel — Blood (3 Toxic)", addon_title_s),
-    Paragraph("$220", addon_price_s),
-]], colWidths=[5.0*inch, 2.0*inch])
-addon1_header.setStyle(TableStyle([
-    ('VALIGN',(0,0),(-1,-1),'MIDDLE'),
-    ('TOPPADDING',(0,0),(-1,-1),0),('BOTTOMPADDING',(0,0),(-1,-1),2),
-    ('LEFTPADDING',(0,0),(-1,-1),0),('RIGHTPADDING',(0,0),(-1,-1),0),
-    ('ALIGN',(1,0),(1,0),'RIGHT'),
-]))
-addon1.append(addon1_header)
-addon1.append(Paragraph("Whole Blood • ICP-MS/MS", body_sm_s))
-addon1.append(Spacer(1, 8))
-addon1.append(Paragraph(
-    "Screens for the three most common toxic heavy metals. Ideal for patients with "
-    "occupational exposure, contaminated water concerns, or unexplained symptoms like "
-    "fatigue, headaches, or cognitive issues.",
-    body_s
-))
-addon1.append(Spacer(1, 8))
-
-hm_blood_data = [
-    [Paragraph("METAL", th_s), Paragraph("WHY WE TEST IT", th_s)],
-    [Paragraph("Arsenic", tv_bold_s), Paragraph("Found in contaminated water, rice, and seafood. Chronic exposure linked to cancer, cardiovascular disease, and neurological damage.", tv_s)],
-    [Paragraph("Lead", tv_bold_s), Paragraph("From old paint, pipes, and occupational exposure. Causes cognitive decline, kidney damage, and hypertension — no safe level.", tv_s)],
-    [Paragraph("Mercury", tv_bold_s), Paragraph("Primarily from fish consumption and dental amalgams. Affects nervous system, kidneys, and immune function.", tv_s)],
-]
-hm_blood_tbl = Table(hm_blood_data, colWidths=[1.4*inch, 5.6*inch])
-hm_blood_tbl.setStyle(TableStyle([
-    ('TOPPADDING',    (0,0),(-1,0), 6),
-    ('BOTTOMPADDING', (0,0),(-1,0), 6),
-    ('TOPPADDING',    (0,1),(-1,-1), 5),
-    ('BOTTOMPADDING', (0,1),(-1,-1), 5),
-    ('LEFTPADDING',   (0,0),(-1,-1), 8),
-    ('RIGHTPADDING',  (0,0),(-1,-1), 8),
-    ('VALIGN',        (0,0),(-1,-1), 'TOP'),
-    ('ROWBACKGROUNDS',(0,1),(-1,-1), [LIGHT_GRAY, WHITE]),
-    ('LINEBELOW',     (0,0),(-1,0), 0.75, RULE_GRAY),
-    ('BOX',           (0,0),(-1,-1), 0.5, RULE_GRAY),
-    ('LINEBELOW',     (0,1),(-1,-2), 0.5, RULE_GRAY),
-]))
-addon1.append(hm_blood_tbl)
-addon1.append(Spacer(1, 6))
-addon1.append(Paragraph("No special preparation required — collected during your regular blood draw.", note_s))
-
-story.append(KeepTogether(addon1))
-story.append(Spacer(1, 16))
-
-
-# ── Heavy Metals Urine ──────────────────────────────────────────────────────
-
-addon2 = []
-addon2_header = Table([[
-    Paragraph("Heavy Metals Panel — Urine (21 Toxic)", addon_title_s),
-    Paragraph("$280", addon_price_s),
-]], colWidths=[5.0*inch, 2.0*inch])
-addon2_header.setStyle(TableStyle([
-    ('VALIGN',(0,0),(-1,-1),'MIDDLE'),
-    ('TOPPADDING',(0,0),(-1,-1),0),('BOTTOMPADDING',(0,0),(-1,-1),2),
-    ('LEFTPADDING',(0,0),(-1,-1),0),('RIGHTPADDING',(0,0),(-1,-1),0),
-    ('ALIGN',(1,0),(1,0),'RIGHT'),
-]))
-addon2.append(addon2_header)
-addon2.append(Paragraph("Urine Collection • ICP-MS/MS", body_sm_s))
-addon2.append(Spacer(1, 8))
-addon2.append(Paragraph(
-    "The most comprehensive toxic metals screen we offer. Tests 21 metals via "
-    "urine to evaluate cumulative exposure and detoxification status. Recommended for "
-    "patients concerned about environmental toxins, those undergoing chelation, or "
-    "anyone with chronic unexplained symptoms.",
-    body_s
-))
-addon2.append(Spacer(1, 8))
-
-metals_list = [
-    "Aluminum", "Arsenic", "Antimony", "Barium", "Bismuth", "Cadmium", "Cesium",
-    "Gadolinium", "Germanium", "Lead", "Mercury", "Nickel", "Niobium", "Platinum",
-    "Rubidium", "Thallium", "Thorium", "Tin", "Titanium", "Tungsten", "Uranium",
-]
+    story.append(Spacer(1, 4))
+
+    # Men's Elite extras
+    story.append(Paragraph("Additional Men’s Elite Markers", sub_s))
+    story.append(biomarker_table(men_elite_extra, descriptions))
+    story.append(Spacer(1, 10))
+
+    # Women's Elite extras
+    story.append(Paragraph("Additional Women’s Elite Markers", sub_s))
+    women_diff = [m for m in women_elite_extra if m not in men_elite_extra]
+    if women_diff:
+        story.append(Paragraph(
+            f"Same as men’s Elite extras (above), except replaces PSA with: "
+            + ", ".join(f"<b>{m}</b>" for m in women_diff) + ".",
+            note_s
+        ))
+    else:
+        story.append(Paragraph(
+            "Same as men’s Elite extras above, minus PSA.",
+            note_s
+        ))
+    story.append(Spacer(1, 4))
+
+    build_footer(story)
+
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # PAGE 3 — ADD-ON PANELS
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    story.append(PageBreak())
+    build_header(story)
+    story += section_label("Add-On Panels")
+
+    story.append(Paragraph(
+        "Add-on panels can be ordered alongside any Essential or Elite blood draw. "
+        "These are specialty tests that go beyond routine bloodwork to screen for "
+        "heavy metal exposure and mold sensitivity.",
+        body_s
+    ))
+    story.append(Spacer(1, 14))
+
 
-col1 = metals_list[:7]
-col2 = metals_list[7:14]
-col3 = metals_list[14:]
+    # ── Heavy Metals Blood ──────────────────────────────────────────────────────
+
+    addon1 = []
+    addon1_header = Table([[
+        Paragraph("Heavy Metals Panel — Blood (3 Toxic)", addon_title_s),
+        Paragraph("$220", addon_price_s),
+    ]], colWidths=[5.0*inch, 2.0*inch])
+    addon1_header.setStyle(TableStyle([
+        ('VALIGN',(0,0),(-1,-1),'MIDDLE'),
+        ('TOPPADDING',(0,0),(-1,-1),0),('BOTTOMPADDING',(0,0),(-1,-1),2),
+        ('LEFTPADDING',(0,0),(-1,-1),0),('RIGHTPADDING',(0,0),(-1,-1),0),
+        ('ALIGN',(1,0),(1,0),'RIGHT'),
+    ]))
+    addon1.append(addon1_header)
+    addon1.append(Paragraph("Whole Blood • ICP-MS/MS", body_sm_s))
+    addon1.append(Spacer(1, 8))
+    addon1.append(Paragraph(
+        "Screens for the three most common toxic heavy metals. Ideal for patients with "
+        "occupational exposure, contaminated water concerns, or unexplained symptoms like "
+        "fatigue, headaches, or cognitive issues.",
+        body_s
+    ))
+    addon1.append(Spacer(1, 8))
 
-metals_data = [[Paragraph("METALS TESTED (21)", th_s), Paragraph("", th_s), Paragraph("", th_s)]]
-for i in range(max(len(col1), len(col2), len(col3))):
-    row = [
-        Paragraph(f"✓  {col1[i]}" if i < len(col1) else "", st('C1', fontName='Helvetica', fontSize=9, textColor=DARK_GRAY, leading=13)),
-        Paragraph(f"✓  {col2[i]}" if i < len(col2) else "", st('C2', fontName='Helvetica', fontSize=9, textColor=DARK_GRAY, leading=13)),
-        Paragraph(f"✓  {col3[i]}" if i < len(col3) else "", st('C3', fontName='Helvetica', fontSize=9, textColor=DARK_GRAY, leading=13)),
+    hm_blood_data = [
+        [Paragraph("METAL", th_s), Paragraph("WHY WE TEST IT", th_s)],
+        [Paragraph("Arsenic", tv_bold_s), Paragraph("Found in contaminated water, rice, and seafood. Chronic exposure linked to cancer, cardiovascular disease, and neurological damage.", tv_s)],
+        [Paragraph("Lead", tv_bold_s), Paragraph("From old paint, pipes, and occupational exposure. Causes cognitive decline, kidney damage, and hypertension — no safe level.", tv_s)],
+        [Paragraph("Mercury", tv_bold_s), Paragraph("Primarily from fish consumption and dental amalgams. Affects nervous system, kidneys, and immune function.", tv_s)],
     ]
-    metals_data.append(row)
-
-# Add Creatinine note
-metals_data.append([
-    Paragraph("✓  Creatinine (Random Urine)", st('C4', fontName='Helvetica-Oblique', fontSize=9, textColor=MID_GRAY, leading=13)),
-    Paragraph("", tv_s),
-    Paragraph("", tv_s),
-])
-
-metals_tbl = Table(metals_data, colWidths=[2.33*inch, 2.33*inch, 2.34*inch])
-metals_tbl.setStyle(TableStyle([
-    ('TOPPADDING',    (0,0),(-1,0), 6),
-    ('BOTTOMPADDING', (0,0),(-1,0), 6),
-    ('TOPPADDING',    (0,1),(-1,-1), 3),
-    ('BOTTOMPADDING', (0,1),(-1,-1), 3),
-    ('LEFTPADDING',   (0,0),(-1,-1), 8),
-    ('RIGHTPADDING',  (0,0),(-1,-1), 8),
-    ('VALIGN',        (0,0),(-1,-1), 'TOP'),
-    ('BACKGROUND',    (0,0),(-1,0), LIGHT_GRAY),
-    ('LINEBELOW',     (0,0),(-1,0), 0.75, RULE_GRAY),
-    ('BOX',           (0,0),(-1,-1), 0.5, RULE_GRAY),
-]))
-addon2.append(metals_tbl)
-addon2.append(Spacer(1, 6))
-addon2.append(Paragraph(
-    "<b>Preparation:</b> Avoid seafood for 48 hours before collection. "
-    "Specimen must be collected in an acid-washed or metal-free plastic container.",
-    st('PrepNote', fontName='Helvetica', fontSize=8.5, textColor=DARK_GRAY, leading=13, spaceAfter=4)
-))
-
-story.append(KeepTogether(addon2))
-story.append(Spacer(1, 16))
-
-
-# ── Mold Profile Plus IgE ───────────────────────────────────────────────────
-
-addon3 = []
-addon3_header = Table([[
-    Paragraph("Mold Profile Plus IgE", addon_title_s),
-    Paragraph("$200", addon_price_s),
-]], colWidths=[5.0*inch, 2.0*inch])
-addon3_header.setStyle(TableStyle([
-    ('VALIGN',(0,0),(-1,-1),'MIDDLE'),
-    ('TOPPADDING',(0,0),(-1,-1),0),('BOTTOMPADDING',(0,0),(-1,-1),2),
-    ('LEFTPADDING',(0,0),(-1,-1),0),('RIGHTPADDING',(0,0),(-1,-1),0),
-    ('ALIGN',(1,0),(1,0),'RIGHT'),
-]))
-addon3.append(addon3_header)
-addon3.append(Paragraph("Blood Draw • Immunoassay", body_sm_s))
-addon3.append(Spacer(1, 8))
-addon3.append(Paragraph(
-    "Screens for IgE-mediated allergic sensitivity to six common indoor molds. "
-    "Ideal for patients with chronic sinus issues, unexplained respiratory symptoms, "
-    "persistent fatigue, or known mold exposure at home or work.",
-    body_s
-))
-addon3.append(Spacer(1, 8))
-
-mold_data = [
-    [Paragraph("MOLD SPECIES", th_s), Paragraph("COMMON NAME / WHERE IT’S FOUND", th_s)],
-    [Paragraph("Penicillium Notatum (m1)", tv_bold_s), Paragraph("Blue-green mold found on food, wallpaper, and damp buildings. One of the most common indoor molds.", tv_s)],
-    [Paragraph("Cladosporium herbarum (m2)", tv_bold_s), Paragraph("Found on plants, textiles, and window frames. The most common outdoor mold, also thrives indoors.", tv_s)],
-    [Paragraph("Aspergillus fumigatus (m3)", tv_bold_s), Paragraph("Found in soil, compost, and HVAC systems. Can cause serious lung infections in susceptible individuals.", tv_s)],
-    [Paragraph("Mucor racemosus (m4)", tv_bold_s), Paragraph("Fast-growing mold found in dust, soil, and decaying food. Common in older buildings.", tv_s)],
-    [Paragraph("Alternaria alternata (m6)", tv_bold_s), Paragraph("Found in showers, window frames, and damp areas. A major trigger for allergic asthma.", tv_s)],
-    [Paragraph("Stemphylium Botryosum (m10)", tv_bold_s), Paragraph("Found on decaying plants and in agricultural settings. Less common but clinically significant.", tv_s)],
-]
-mold_tbl = Table(mold_data, colWidths=[2.4*inch, 4.6*inch])
-mold_tbl.setStyle(TableStyle([
-    ('TOPPADDING',    (0,0),(-1,0), 6),
-    ('BOTTOMPADDING', (0,0),(-1,0), 6),
-    ('TOPPADDING',    (0,1),(-1,-1), 5),
-    ('BOTTOMPADDING', (0,1),(-1,-1), 5),
-    ('LEFTPADDING',   (0,0),(-1,-1), 8),
-    ('RIGHTPADDING',  (0,0),(-1,-1), 8),
-    ('VALIGN',        (0,0),(-1,-1), 'TOP'),
-    ('ROWBACKGROUNDS',(0,1),(-1,-1), [LIGHT_GRAY, WHITE]),
-    ('LINEBELOW',     (0,0),(-1,0), 0.75, RULE_GRAY),
-    ('BOX',           (0,0),(-1,-1), 0.5, RULE_GRAY),
-    ('LINEBELOW',     (0,1),(-1,-2), 0.5, RULE_GRAY),
-]))
-addon3.append(mold_tbl)
-addon3.append(Spacer(1, 6))
-addon3.append(Paragraph("No special preparation required — collected during your regular blood draw.", note_s))
-
-story.append(KeepTogether(addon3))
-story.append(Spacer(1, 10))
-
-build_footer(story)
-
-
-# ── GENERATE ────────────────────────────────────────────────────────────────
-
-os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
-doc.build(story)
-print(f"Generated: {OUTPUT_PATH}")
+    hm_blood_tbl = Table(hm_blood_data, colWidths=[1.4*inch, 5.6*inch])
+    hm_blood_tbl.setStyle(TableStyle([
+        ('TOPPADDING',    (0,0),(-1,0), 6),
+        ('BOTTOMPADDING', (0,0),(-1,0), 6),
+        ('TOPPADDING',    (0,1),(-1,-1), 5),
+        ('BOTTOMPADDING', (0,1),(-1,-1), 5),
+        ('LEFTPADDING',   (0,0),(-1,-1), 8),
+        ('RIGHTPADDING',  (0,0),(-1,-1), 8),
+        ('VALIGN',        (0,0),(-1,-1), 'TOP'),
+        ('ROWBACKGROUNDS',(0,1),(-1,-1), [LIGHT_GRAY, WHITE]),
+        ('LINEBELOW',     (0,0),(-1,0), 0.75, RULE_GRAY),
+        ('BOX',           (0,0),(-1,-1), 0.5, RULE_GRAY),
+        ('LINEBELOW',     (0,1),(-1,-2), 0.5, RULE_GRAY),
+    ]))
+    addon1.append(hm_blood_tbl)
+    addon1.append(Spacer(1, 6))
+    addon1.append(Paragraph("No special preparation required — collected during your regular blood draw.", note_s))
+
+    story.append(KeepTogether(addon1))
+    story.append(Spacer(1, 16))
+
+
+    # ── Heavy Metals Urine ──────────────────────────────────────────────────────
+
+    addon2 = []
+    addon2_header = Table([[
+        Paragraph("Heavy Metals Panel — Urine (21 Toxic)", addon_title_s),
+        Paragraph("$280", addon_price_s),
+    ]], colWidths=[5.0*inch, 2.0*inch])
+    addon2_header.setStyle(TableStyle([
+        ('VALIGN',(0,0),(-1,-1),'MIDDLE'),
+        ('TOPPADDING',(0,0),(-1,-1),0),('BOTTOMPADDING',(0,0),(-1,-1),2),
+        ('LEFTPADDING',(0,0),(-1,-1),0),('RIGHTPADDING',(0,0),(-1,-1),0),
+        ('ALIGN',(1,0),(1,0),'RIGHT'),
+    ]))
+    addon2.append(addon2_header)
+    addon2.append(Paragraph("Urine Collection • ICP-MS/MS", body_sm_s))
+    addon2.append(Spacer(1, 8))
+    addon2.append(Paragraph(
+        "The most comprehensive toxic metals screen we offer. Tests 21 metals via "
+        "urine to evaluate cumulative exposure and detoxification status. Recommended for "
+        "patients concerned about environmental toxins, those undergoing chelation, or "
+        "anyone with chronic unexplained symptoms.",
+        body_s
+    ))
+    addon2.append(Spacer(1, 8))
+
+    metals_list = [
+        "Aluminum", "Arsenic", "Antimony", "Barium", "Bismuth", "Cadmium", "Cesium",
+        "Gadolinium", "Germanium", "Lead", "Mercury", "Nickel", "Niobium", "Platinum",
+        "Rubidium", "Thallium", "Thorium", "Tin", "Titanium", "Tungsten", "Uranium",
+    ]
+
+    col1 = metals_list[:7]
+    col2 = metals_list[7:14]
+    col3 = metals_list[14:]
+
+    metals_data = [[Paragraph("METALS TESTED (21)", th_s), Paragraph("", th_s), Paragraph("", th_s)]]
+    for i in range(max(len(col1), len(col2), len(col3))):
+        row = [
+            Paragraph(f"✓  {col1[i]}" if i < len(col1) else "", st('C1', fontName='Helvetica', fontSize=9, textColor=DARK_GRAY, leading=13)),
+            Paragraph(f"✓  {col2[i]}" if i < len(col2) else "", st('C2', fontName='Helvetica', fontSize=9, textColor=DARK_GRAY, leading=13)),
+            Paragraph(f"✓  {col3[i]}" if i < len(col3) else "", st('C3', fontName='Helvetica', fontSize=9, textColor=DARK_GRAY, leading=13)),
+        ]
+        metals_data.append(row)
+
+    # Add Creatinine note
+    metals_data.append([
+        Paragraph("✓  Creatinine (Random Urine)", st('C4', fontName='Helvetica-Oblique', fontSize=9, textColor=MID_GRAY, leading=13)),
+        Paragraph("", tv_s),
+        Paragraph("", tv_s),
+    ])
+
+    metals_tbl = Table(metals_data, colWidths=[2.33*inch, 2.33*inch, 2.34*inch])
+    metals_tbl.setStyle(TableStyle([
+        ('TOPPADDING',    (0,0),(-1,0), 6),
+        ('BOTTOMPADDING', (0,0),(-1,0), 6),
+        ('TOPPADDING',    (0,1),(-1,-1), 3),
+        ('BOTTOMPADDING', (0,1),(-1,-1), 3),
+        ('LEFTPADDING',   (0,0),(-1,-1), 8),
+        ('RIGHTPADDING',  (0,0),(-1,-1), 8),
+        ('VALIGN',        (0,0),(-1,-1), 'TOP'),
+        ('BACKGROUND',    (0,0),(-1,0), LIGHT_GRAY),
+        ('LINEBELOW',     (0,0),(-1,0), 0.75, RULE_GRAY),
+        ('BOX',           (0,0),(-1,-1), 0.5, RULE_GRAY),
+    ]))
+    addon2.append(metals_tbl)
+    addon2.append(Spacer(1, 6))
+    addon2.append(Paragraph(
+        "<b>Preparation:</b> Avoid seafood for 48 hours before collection. "
+        "Specimen must be collected in an acid-washed or metal-free plastic container.",
+        st('PrepNote', fontName='Helvetica', fontSize=8.5, textColor=DARK_GRAY, leading=13, spaceAfter=4)
+    ))
+
+    story.append(KeepTogether(addon2))
+    story.append(Spacer(1, 16))
+
+
+    # ── Mold Profile Plus IgE ───────────────────────────────────────────────────
+
+    addon3 = []
+    addon3_header = Table([[
+        Paragraph("Mold Profile Plus IgE", addon_title_s),
+        Paragraph("$200", addon_price_s),
+    ]], colWidths=[5.0*inch, 2.0*inch])
+    addon3_header.setStyle(TableStyle([
+        ('VALIGN',(0,0),(-1,-1),'MIDDLE'),
+        ('TOPPADDING',(0,0),(-1,-1),0),('BOTTOMPADDING',(0,0),(-1,-1),2),
+        ('LEFTPADDING',(0,0),(-1,-1),0),('RIGHTPADDING',(0,0),(-1,-1),0),
+        ('ALIGN',(1,0),(1,0),'RIGHT'),
+    ]))
+    addon3.append(addon3_header)
+    addon3.append(Paragraph("Blood Draw • Immunoassay", body_sm_s))
+    addon3.append(Spacer(1, 8))
+    addon3.append(Paragraph(
+        "Screens for IgE-mediated allergic sensitivity to six common indoor molds. "
+        "Ideal for patients with chronic sinus issues, unexplained respiratory symptoms, "
+        "persistent fatigue, or known mold exposure at home or work.",
+        body_s
+    ))
+    addon3.append(Spacer(1, 8))
+
+    mold_data = [
+        [Paragraph("MOLD SPECIES", th_s), Paragraph("COMMON NAME / WHERE IT’S FOUND", th_s)],
+        [Paragraph("Penicillium Notatum (m1)", tv_bold_s), Paragraph("Blue-green mold found on food, wallpaper, and damp buildings. One of the most common indoor molds.", tv_s)],
+        [Paragraph("Cladosporium herbarum (m2)", tv_bold_s), Paragraph("Found on plants, textiles, and window frames. The most common outdoor mold, also thrives indoors.", tv_s)],
+        [Paragraph("Aspergillus fumigatus (m3)", tv_bold_s), Paragraph("Found in soil, compost, and HVAC systems. Can cause serious lung infections in susceptible individuals.", tv_s)],
+        [Paragraph("Mucor racemosus (m4)", tv_bold_s), Paragraph("Fast-growing mold found in dust, soil, and decaying food. Common in older buildings.", tv_s)],
+        [Paragraph("Alternaria alternata (m6)", tv_bold_s), Paragraph("Found in showers, window frames, and damp areas. A major trigger for allergic asthma.", tv_s)],
+        [Paragraph("Stemphylium Botryosum (m10)", tv_bold_s), Paragraph("Found on decaying plants and in agricultural settings. Less common but clinically significant.", tv_s)],
+    ]
+    mold_tbl = Table(mold_data, colWidths=[2.4*inch, 4.6*inch])
+    mold_tbl.setStyle(TableStyle([
+        ('TOPPADDING',    (0,0),(-1,0), 6),
+        ('BOTTOMPADDING', (0,0),(-1,0), 6),
+        ('TOPPADDING',    (0,1),(-1,-1), 5),
+        ('BOTTOMPADDING', (0,1),(-1,-1), 5),
+        ('LEFTPADDING',   (0,0),(-1,-1), 8),
+        ('RIGHTPADDING',  (0,0),(-1,-1), 8),
+        ('VALIGN',        (0,0),(-1,-1), 'TOP'),
+        ('ROWBACKGROUNDS',(0,1),(-1,-1), [LIGHT_GRAY, WHITE]),
+        ('LINEBELOW',     (0,0),(-1,0), 0.75, RULE_GRAY),
+        ('BOX',           (0,0),(-1,-1), 0.5, RULE_GRAY),
+        ('LINEBELOW',     (0,1),(-1,-2), 0.5, RULE_GRAY),
+    ]))
+    addon3.append(mold_tbl)
+    addon3.append(Spacer(1, 6))
+    addon3.append(Paragraph("No special preparation required — collected during your regular blood draw.", note_s))
+
+    story.append(KeepTogether(addon3))
+    story.append(Spacer(1, 10))
+
+    build_footer(story)
+
+
+    # ── GENERATE ────────────────────────────────────────────────────────────────
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    doc.build(story)
+    print(f"Generated: {output_path}")
+    return output_path
+
+
+if __name__ == '__main__':
+    build()
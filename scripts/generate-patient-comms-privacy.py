@@ -9,6 +9,7 @@ from reportlab.lib.colors import HexColor
 from reportlab.platypus import (SimpleDocTemplate, Paragraph, Spacer, Table,
                                  TableStyle, HRFlowable)
 from reportlab.lib.enums import TA_LEFT, TA_RIGHT
+import os
 
 BLACK      = HexColor('#0A0A0A')
 DARK_GRAY  = HexColor('#1A1A1A')
@@ -104,118 +105,126 @@ def build_footer(story):
 
 # ── BUILD THE DOCUMENT ──────────────────────────────────────────────────────
 
-OUTPUT_PATH = "public/docs/patient-comms-privacy-policy.pdf"
-
-doc = SimpleDocTemplate(
-    OUTPUT_PATH,
-    pagesize=letter,
-    rightMargin=0.75*inch, leftMargin=0.75*inch,
-    topMargin=0.65*inch,   bottomMargin=0.65*inch,
-)
-story = []
-build_header(story)
-
-# Title
-story.append(Paragraph("PATIENT COMMUNICATION PRIVACY POLICY", title_s))
-story.append(Paragraph("Staff reference \u2014 How patient-facing messages should read", subtitle_s))
-story.append(Spacer(1, 10))
-
-# ── THE RULE ──
-story += section_label("The Rule")
-story.append(Paragraph(
-    "All patient-facing appointment messages \u2014 texts, emails, and reminders \u2014 must use "
-    "<b>generic language only</b>. Patients see \u201cappointment with Range Medical\u201d and a time. "
-    "They never see the specific service or treatment type.",
-    body_s
-))
-story.append(Spacer(1, 6))
-story.append(Paragraph(
-    "This applies for privacy purposes. A patient\u2019s phone screen, email inbox, or notification "
-    "banner should never reveal what type of medical treatment they\u2019re receiving.",
-    body_s
-))
-
-# ── WHAT PATIENTS SEE ──
-story.append(Spacer(1, 4))
-story += section_label("What Patients See")
-
-# Before / After table
-compare_header = st('CmpH', fontName='Helvetica-Bold', fontSize=8, textColor=WHITE, leading=11)
-before_s = st('Bef', fontName='Helvetica', fontSize=9, textColor=RED, leading=14)
-after_s  = st('Aft', fontName='Helvetica', fontSize=9, textColor=GREEN, leading=14)
-
-data = [
-    [Paragraph("BEFORE (old)", compare_header), Paragraph("NOW (correct)", compare_header)],
-    [Paragraph("\u2718  \u201cYour Testosterone Injection appointment is confirmed for...\u201d", before_s),
-     Paragraph("\u2713  \u201cYour appointment with Range Medical is confirmed for...\u201d", after_s)],
-    [Paragraph("\u2718  \u201cReminder: your Weight Loss Injection is tomorrow at 10 AM\u201d", before_s),
-     Paragraph("\u2713  \u201cReminder: your appointment with Range Medical is tomorrow at 10 AM\u201d", after_s)],
-    [Paragraph("\u2718  Email subject: \u201cAppointment Confirmed: NAD+ IV \u2014 Range Medical\u201d", before_s),
-     Paragraph("\u2713  Email subject: \u201cAppointment Confirmed \u2014 Range Medical\u201d", after_s)],
-    [Paragraph("\u2718  \u201cYour Range IV is included with your HRT membership\u201d", before_s),
-     Paragraph("\u2713  \u201cYou have a complimentary IV session included with your membership\u201d", after_s)],
-]
-
-tbl = Table(data, colWidths=[W/2, W/2])
-tbl.setStyle(TableStyle([
-    ('BACKGROUND',    (0,0), (-1,0), BLACK),
-    ('TOPPADDING',    (0,0), (-1,-1), 6),
-    ('BOTTOMPADDING', (0,0), (-1,-1), 6),
-    ('LEFTPADDING',   (0,0), (-1,-1), 10),
-    ('RIGHTPADDING',  (0,0), (-1,-1), 10),
-    ('VALIGN',        (0,0), (-1,-1), 'TOP'),
-    ('ROWBACKGROUNDS',(0,1), (-1,-1), [LIGHT_GRAY, WHITE]),
-    ('BOX',           (0,0), (-1,-1), 0.5, RULE_GRAY),
-    ('LINEBELOW',     (0,0), (-1,-2), 0.5, RULE_GRAY),
-    ('LINEBEFORE',    (1,0), (1,-1),  0.5, RULE_GRAY),
-]))
-story.append(tbl)
-
-# ── WHAT THIS COVERS ──
-story.append(Spacer(1, 4))
-story += section_label("Messages Covered by This Policy")
-
-story.append(bullet("<b>Booking confirmations</b> \u2014 SMS and email sent when an appointment is created"))
-story.append(bullet("<b>24-hour reminders</b> \u2014 daily cron SMS sent the day before an appointment"))
-story.append(bullet("<b>Reschedule notices</b> \u2014 SMS and email when an appointment time changes"))
-story.append(bullet("<b>Cancellation notices</b> \u2014 SMS and email when an appointment is cancelled"))
-story.append(bullet("<b>Membership reminders</b> \u2014 monthly SMS about included benefits"))
-story.append(bullet("<b>Email subject lines</b> \u2014 no service type in any email subject"))
-story.append(bullet("<b>Email body</b> \u2014 the \u201cService\u201d row has been removed from appointment detail emails"))
-
-# ── INTERNAL SIDE ──
-story.append(Spacer(1, 4))
-story += section_label("What Stays Internal")
-
-story.append(Paragraph(
-    "The specific service type is still stored in our system and visible on the admin side. "
-    "Staff can see what type of appointment it is on the schedule, patient profile, and service log. "
-    "The privacy rule only applies to what the <b>patient receives</b> on their phone or email.",
-    body_s
-))
-story.append(Spacer(1, 6))
-story.append(bullet("<b>Admin schedule</b> \u2014 still shows full service names (Testosterone Injection, NAD+ IV, etc.)"))
-story.append(bullet("<b>Staff notifications</b> \u2014 still include service type (Tara\u2019s alerts, prereq checks, etc.)"))
-story.append(bullet("<b>Patient profile</b> \u2014 still shows full appointment and protocol details"))
-story.append(bullet("<b>Comms log</b> \u2014 still records the service name for internal tracking"))
-
-# ── KEY REMINDER ──
-story.append(Spacer(1, 4))
-story += section_label("Key Reminder")
-
-story.append(Paragraph(
-    "If you are ever manually texting or emailing a patient about an upcoming appointment, "
-    "follow the same rule: <b>no treatment names</b>. Say \u201cyour appointment\u201d or "
-    "\u201cyour visit at Range Medical.\u201d This protects our patients\u2019 privacy and keeps us "
-    "aligned with HIPAA best practices.",
-    body_s
-))
-
-story.append(Spacer(1, 8))
-
-# Effective date
-story.append(Paragraph("Effective: April 6, 2026", note_s))
-
-build_footer(story)
-doc.build(story)
-print(f"PDF generated: {OUTPUT_PATH}")
+OUTPUT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           "public", "docs", "patient-comms-privacy-policy.pdf")
+
+
+def build(output_path=OUTPUT_PATH):
+    doc = SimpleDocTemplate(
+        output_path,
+        pagesize=letter,
+        rightMargin=0.75*inch, leftMargin=0.75*inch,
+        topMargin=0.65*inch,   bottomMargin=0.65*inch,
+    )
+    story = []
+    build_header(story)
+
+    # Title
+    story.append(Paragraph("PATIENT COMMUNICATION PRIVACY POLICY", title_s))
+    story.append(Paragraph("Staff reference \u2014 How patient-facing messages should read", subtitle_s))
+    story.append(Spacer(1, 10))
+
+    # ── THE RULE ──
+    story += section_label("The Rule")
+    story.append(Paragraph(
+        "All patient-facing appointment messages \u2014 texts, emails, and reminders \u2014 must use "
+        "<b>generic language only</b>. Patients see \u201cappointment with Range Medical\u201d and a time. "
+        "They never see the specific service or treatment type.",
+        body_s
+    ))
+    story.append(Spacer(1, 6))
+    story.append(Paragraph(
+        "This applies for privacy purposes. A patient\u2019s phone screen, email inbox, or notification "
+        "banner should never reveal what type of medical treatment they\u2019re receiving.",
+        body_s
+    ))
+
+    # ── WHAT PATIENTS SEE ──
+    story.append(Spacer(1, 4))
+    story += section_label("What Patients See")
+
+    # Before / After table
+    compare_header = st('CmpH', fontName='Helvetica-Bold', fontSize=8, textColor=WHITE, leading=11)
+    before_s = st('Bef', fontName='Helvetica', fontSize=9, textColor=RED, leading=14)
+    after_s  = st('Aft', fontName='Helvetica', fontSize=9, textColor=GREEN, leading=14)
+
+    data = [
+        [Paragraph("BEFORE (old)", compare_header), Paragraph("NOW (correct)", compare_header)],
+        [Paragraph("\u2718  \u201cYour Testosterone Injection appointment is confirmed for...\u201d", before_s),
+         Paragraph("\u2713  \u201cYour appointment with Range Medical is confirmed for...\u201d", after_s)],
+        [Paragraph("\u2718  \u201cReminder: your Weight Loss Injection is tomorrow at 10 AM\u201d", before_s),
+         Paragraph("\u2713  \u201cReminder: your appointment with Range Medical is tomorrow at 10 AM\u201d", after_s)],
+        [Paragraph("\u2718  Email subject: \u201cAppointment Confirmed: NAD+ IV \u2014 Range Medical\u201d", before_s),
+         Paragraph("\u2713  Email subject: \u201cAppointment Confirmed \u2014 Range Medical\u201d", after_s)],
+        [Paragraph("\u2718  \u201cYour Range IV is included with your HRT membership\u201d", before_s),
+         Paragraph("\u2713  \u201cYou have a complimentary IV session included with your membership\u201d", after_s)],
+    ]
+
+    tbl = Table(data, colWidths=[W/2, W/2])
+    tbl.setStyle(TableStyle([
+        ('BACKGROUND',    (0,0), (-1,0), BLACK),
+        ('TOPPADDING',    (0,0), (-1,-1), 6),
+        ('BOTTOMPADDING', (0,0), (-1,-1), 6),
+        ('LEFTPADDING',   (0,0), (-1,-1), 10),
+        ('RIGHTPADDING',  (0,0), (-1,-1), 10),
+        ('VALIGN',        (0,0), (-1,-1), 'TOP'),
+        ('ROWBACKGROUNDS',(0,1), (-1,-1), [LIGHT_GRAY, WHITE]),
+        ('BOX',           (0,0), (-1,-1), 0.5, RULE_GRAY),
+        ('LINEBELOW',     (0,0), (-1,-2), 0.5, RULE_GRAY),
+        ('LINEBEFORE',    (1,0), (1,-1),  0.5, RULE_GRAY),
+    ]))
+    story.append(tbl)
+
+    # ── WHAT THIS COVERS ──
+    story.append(Spacer(1, 4))
+    story += section_label("Messages Covered by This Policy")
+
+    story.append(bullet("<b>Booking confirmations</b> \u2014 SMS and email sent when an appointment is created"))
+    story.append(bullet("<b>24-hour reminders</b> \u2014 daily cron SMS sent the day before an appointment"))
+    story.append(bullet("<b>Reschedule notices</b> \u2014 SMS and email when an appointment time changes"))
+    story.append(bullet("<b>Cancellation notices</b> \u2014 SMS and email when an appointment is cancelled"))
+    story.append(bullet("<b>Membership reminders</b> \u2014 monthly SMS about included benefits"))
+    story.append(bullet("<b>Email subject lines</b> \u2014 no service type in any email subject"))
+    story.append(bullet("<b>Email body</b> \u2014 the \u201cService\u201d row has been removed from appointment detail emails"))
+
+    # ── INTERNAL SIDE ──
+    story.append(Spacer(1, 4))
+    story += section_label("What Stays Internal")
+
+    story.append(Paragraph(
+        "The specific service type is still stored in our system and visible on the admin side. "
+        "Staff can see what type of appointment it is on the schedule, patient profile, and service log. "
+        "The privacy rule only applies to what the <b>patient receives</b> on their phone or email.",
+        body_s
+    ))
+    story.append(Spacer(1, 6))
+    story.append(bullet("<b>Admin schedule</b> \u2014 still shows full service names (Testosterone Injection, NAD+ IV, etc.)"))
+    story.append(bullet("<b>Staff notifications</b> \u2014 still include service type (Tara\u2019s alerts, prereq checks, etc.)"))
+    story.append(bullet("<b>Patient profile</b> \u2014 still shows full appointment and protocol details"))
+    story.append(bullet("<b>Comms log</b> \u2014 still records the service name for internal tracking"))
+
+    # ── KEY REMINDER ──
+    story.append(Spacer(1, 4))
+    story += section_label("Key Reminder")
+
+    story.append(Paragraph(
+        "If you are ever manually texting or emailing a patient about an upcoming appointment, "
+        "follow the same rule: <b>no treatment names</b>. Say \u201cyour appointment\u201d or "
+        "\u201cyour visit at Range Medical.\u201d This protects our patients\u2019 privacy and keeps us "
+        "aligned with HIPAA best practices.",
+        body_s
+    ))
+
+    story.append(Spacer(1, 8))
+
+    # Effective date
+    story.append(Paragraph("Effective: April 6, 2026", note_s))
+
+    build_footer(story)
+    doc.build(story)
+    print(f"PDF generated: {output_path}")
+    return output_path
+
+
+if __name__ == '__main__':
+    build()
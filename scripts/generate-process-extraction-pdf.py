@@ -8,6 +8,7 @@ from reportlab.lib.colors import HexColor
 from reportlab.platypus import (SimpleDocTemplate, Paragraph, Spacer, Table,
                                  TableStyle, HRFlowable, PageBreak)
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
+import os
 
 BLACK      = HexColor('#0A0A0A')
 DARK_GRAY  = HexColor('#1A1A1A')
@@ -90,185 +91,193 @@ def build_step_section(story, number, title, questions):
 
 # ── BUILD THE PDF ────────────────────────────────────────────────────────────
 
-OUTPUT_PATH = "public/docs/range-sports-therapy-process-extraction.pdf"
+OUTPUT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           "public", "docs", "range-sports-therapy-process-extraction.pdf")
 
-doc = SimpleDocTemplate(
-    OUTPUT_PATH,
-    pagesize=letter,
-    rightMargin=0.75 * inch,
-    leftMargin=0.75 * inch,
-    topMargin=0.65 * inch,
-    bottomMargin=0.65 * inch,
-)
 
-story = []
-build_header(story)
+def build(output_path=OUTPUT_PATH):
+    doc = SimpleDocTemplate(
+        output_path,
+        pagesize=letter,
+        rightMargin=0.75 * inch,
+        leftMargin=0.75 * inch,
+        topMargin=0.65 * inch,
+        bottomMargin=0.65 * inch,
+    )
 
-# Title
-story.append(Paragraph("PROCESS EXTRACTION TEMPLATE", title_s))
-story.append(Paragraph("Part 1 \u2014 The Journey Map", subtitle_s))
-story.append(Spacer(1, 14))
+    story = []
+    build_header(story)
 
-# Instructions
-story += section_label("Instructions")
-story.append(Paragraph(
-    "Walk through a single patient from first contact to discharge. "
-    "For each step, document the following:",
-    instruct_s
-))
-story.append(Spacer(1, 6))
+    # Title
+    story.append(Paragraph("PROCESS EXTRACTION TEMPLATE", title_s))
+    story.append(Paragraph("Part 1 \u2014 The Journey Map", subtitle_s))
+    story.append(Spacer(1, 14))
 
-# The 7 questions as a reference checklist
-ref_questions = [
-    "What happens? (Describe it like you\u2019re narrating to someone who\u2019s never been here)",
-    "Who does it?",
-    "How long does it take?",
-    "What tools / forms / systems are used?",
-    "What decisions get made at this step? (If X \u2192 do Y, if Z \u2192 do W)",
-    "What gets documented, and where?",
-    "What triggers the next step?",
-]
-
-for q in ref_questions:
-    story.append(Paragraph(f"\u25a2  {q}", check_label_s))
-    story.append(Spacer(1, 2))
-
-story.append(Spacer(1, 8))
-story.append(Paragraph(
-    "Each step below repeats these seven questions with space to write your answers.",
-    instruct_s
-))
-
-# Page break before steps begin
-story.append(PageBreak())
+    # Instructions
+    story += section_label("Instructions")
+    story.append(Paragraph(
+        "Walk through a single patient from first contact to discharge. "
+        "For each step, document the following:",
+        instruct_s
+    ))
+    story.append(Spacer(1, 6))
 
-# The 12 steps
-steps = [
-    ("Booking / First Contact", [
-        "What happens when someone first reaches out or books?",
-        "Who handles it?",
-        "How long does it take?",
-        "What tools / forms / systems are used?",
-        "What decisions get made? (If X \u2192 do Y, if Z \u2192 do W)",
-        "What gets documented, and where?",
-        "What triggers the next step?",
-    ]),
-    ("Arrival / Check-in", [
-        "What happens when the patient walks in the door?",
-        "Who handles it?",
-        "How long does it take?",
-        "What tools / forms / systems are used?",
-        "What decisions get made? (If X \u2192 do Y, if Z \u2192 do W)",
-        "What gets documented, and where?",
-        "What triggers the next step?",
-    ]),
-    ("Intake Paperwork", [
-        "What paperwork does the patient fill out?",
-        "Who handles it?",
-        "How long does it take?",
-        "What tools / forms / systems are used?",
-        "What decisions get made? (If X \u2192 do Y, if Z \u2192 do W)",
-        "What gets documented, and where?",
-        "What triggers the next step?",
-    ]),
-    ("Initial Assessment", [
-        "What does the assessment consist of?",
-        "Who performs it?",
-        "How long does it take?",
-        "What tools / equipment / systems are used?",
-        "What decisions get made? (If finding X \u2192 recommend Y)",
-        "What gets documented, and where?",
-        "What triggers the next step?",
-    ]),
-    ("Diagnosis / Findings Discussion with Patient", [
-        "What happens \u2014 how are findings communicated?",
-        "Who does it?",
-        "How long does it take?",
-        "What tools / visuals / systems are used?",
-        "What decisions get made? (If X \u2192 do Y, if Z \u2192 do W)",
-        "What gets documented, and where?",
-        "What triggers the next step?",
-    ]),
-    ("Treatment Plan Recommendation", [
-        "What happens \u2014 how is the plan presented?",
+    # The 7 questions as a reference checklist
+    ref_questions = [
+        "What happens? (Describe it like you\u2019re narrating to someone who\u2019s never been here)",
         "Who does it?",
         "How long does it take?",
         "What tools / forms / systems are used?",
-        "What decisions get made? (If patient wants X \u2192 do Y)",
-        "What gets documented, and where?",
-        "What triggers the next step?",
-    ]),
-    ("First Treatment (if same day)", [
-        "What happens during the first treatment?",
-        "Who performs it?",
-        "How long does it take?",
-        "What tools / equipment / systems are used?",
-        "What decisions get made during treatment?",
+        "What decisions get made at this step? (If X \u2192 do Y, if Z \u2192 do W)",
         "What gets documented, and where?",
         "What triggers the next step?",
-    ]),
-    ("Scheduling Follow-ups", [
-        "What happens \u2014 how are follow-ups scheduled?",
-        "Who handles it?",
-        "How long does it take?",
-        "What tools / systems are used?",
-        "What decisions get made? (Frequency, duration, etc.)",
-        "What gets documented, and where?",
-        "What triggers the next step?",
-    ]),
-    ("Payment / Insurance", [
-        "What happens \u2014 how is payment handled?",
-        "Who handles it?",
-        "How long does it take?",
-        "What tools / systems are used?",
-        "What decisions get made? (Insurance vs. cash, packages, etc.)",
-        "What gets documented, and where?",
-        "What triggers the next step?",
-    ]),
-    ("Ongoing Visits \u2014 What Changes Visit to Visit?", [
-        "What happens at a typical follow-up visit?",
-        "Who handles it?",
-        "How long does it take?",
-        "What tools / equipment / systems are used?",
-        "What decisions get made? (Progress, plan adjustments, etc.)",
-        "What gets documented, and where?",
-        "What triggers the next step or change in plan?",
-    ]),
-    ("Discharge / Graduation \u2014 How Do You Know They\u2019re Done?", [
-        "What happens \u2014 what does discharge look like?",
-        "Who makes the call?",
-        "How long does the process take?",
-        "What tools / forms / systems are used?",
-        "What decisions get made? (Criteria for discharge)",
-        "What gets documented, and where?",
-        "What triggers discharge vs. continued care?",
-    ]),
-    ("Re-engagement \u2014 What Happens If They Stop Showing Up?", [
-        "What happens when a patient goes dark?",
-        "Who handles outreach?",
-        "How long before you reach out?",
-        "What tools / systems are used?",
-        "What decisions get made? (When to call, text, give up)",
-        "What gets documented, and where?",
-        "What triggers re-engagement vs. closing the case?",
-    ]),
-]
+    ]
+
+    for q in ref_questions:
+        story.append(Paragraph(f"\u25a2  {q}", check_label_s))
+        story.append(Spacer(1, 2))
+
+    story.append(Spacer(1, 8))
+    story.append(Paragraph(
+        "Each step below repeats these seven questions with space to write your answers.",
+        instruct_s
+    ))
+
+    # Page break before steps begin
+    story.append(PageBreak())
+
+    # The 12 steps
+    steps = [
+        ("Booking / First Contact", [
+            "What happens when someone first reaches out or books?",
+            "Who handles it?",
+            "How long does it take?",
+            "What tools / forms / systems are used?",
+            "What decisions get made? (If X \u2192 do Y, if Z \u2192 do W)",
+            "What gets documented, and where?",
+            "What triggers the next step?",
+        ]),
+        ("Arrival / Check-in", [
+            "What happens when the patient walks in the door?",
+            "Who handles it?",
+            "How long does it take?",
+            "What tools / forms / systems are used?",
+            "What decisions get made? (If X \u2192 do Y, if Z \u2192 do W)",
+            "What gets documented, and where?",
+            "What triggers the next step?",
+        ]),
+        ("Intake Paperwork", [
+            "What paperwork does the patient fill out?",
+            "Who handles it?",
+            "How long does it take?",
+            "What tools / forms / systems are used?",
+            "What decisions get made? (If X \u2192 do Y, if Z \u2192 do W)",
+            "What gets documented, and where?",
+            "What triggers the next step?",
+        ]),
+        ("Initial Assessment", [
+            "What does the assessment consist of?",
+            "Who performs it?",
+            "How long does it take?",
+            "What tools / equipment / systems are used?",
+            "What decisions get made? (If finding X \u2192 recommend Y)",
+            "What gets documented, and where?",
+            "What triggers the next step?",
+        ]),
+        ("Diagnosis / Findings Discussion with Patient", [
+            "What happens \u2014 how are findings communicated?",
+            "Who does it?",
+            "How long does it take?",
+            "What tools / visuals / systems are used?",
+            "What decisions get made? (If X \u2192 do Y, if Z \u2192 do W)",
+            "What gets documented, and where?",
+            "What triggers the next step?",
+        ]),
+        ("Treatment Plan Recommendation", [
+            "What happens \u2014 how is the plan presented?",
+            "Who does it?",
+            "How long does it take?",
+            "What tools / forms / systems are used?",
+            "What decisions get made? (If patient wants X \u2192 do Y)",
+            "What gets documented, and where?",
+            "What triggers the next step?",
+        ]),
+        ("First Treatment (if same day)", [
+            "What happens during the first treatment?",
+            "Who performs it?",
+            "How long does it take?",
+            "What tools / equipment / systems are used?",
+            "What decisions get made during treatment?",
+            "What gets documented, and where?",
+            "What triggers the next step?",
+        ]),
+        ("Scheduling Follow-ups", [
+            "What happens \u2014 how are follow-ups scheduled?",
+            "Who handles it?",
+            "How long does it take?",
+            "What tools / systems are used?",
+            "What decisions get made? (Frequency, duration, etc.)",
+            "What gets documented, and where?",
+            "What triggers the next step?",
+        ]),
+        ("Payment / Insurance", [
+            "What happens \u2014 how is payment handled?",
+            "Who handles it?",
+            "How long does it take?",
+            "What tools / systems are used?",
+            "What decisions get made? (Insurance vs. cash, packages, etc.)",
+            "What gets documented, and where?",
+            "What triggers the next step?",
+        ]),
+        ("Ongoing Visits \u2014 What Changes Visit to Visit?", [
+            "What happens at a typical follow-up visit?",
+            "Who handles it?",
+            "How long does it take?",
+            "What tools / equipment / systems are used?",
+            "What decisions get made? (Progress, plan adjustments, etc.)",
+            "What gets documented, and where?",
+            "What triggers the next step or change in plan?",
+        ]),
+        ("Discharge / Graduation \u2014 How Do You Know They\u2019re Done?", [
+            "What happens \u2014 what does discharge look like?",
+            "Who makes the call?",
+            "How long does the process take?",
+            "What tools / forms / systems are used?",
+            "What decisions get made? (Criteria for discharge)",
+            "What gets documented, and where?",
+            "What triggers discharge vs. continued care?",
+        ]),
+        ("Re-engagement \u2014 What Happens If They Stop Showing Up?", [
+            "What happens when a patient goes dark?",
+            "Who handles outreach?",
+            "How long before you reach out?",
+            "What tools / systems are used?",
+            "What decisions get made? (When to call, text, give up)",
+            "What gets documented, and where?",
+            "What triggers re-engagement vs. closing the case?",
+        ]),
+    ]
+
+    for i, (title, questions) in enumerate(steps, 1):
+        if i > 1:
+            story.append(PageBreak())
+        build_step_section(story, i, title, questions)
+
+    # Final page - notes
+    story.append(PageBreak())
+    story += section_label("Additional Notes")
+    story.append(Paragraph(
+        "Use this space for anything that didn\u2019t fit above \u2014 "
+        "unwritten rules, edge cases, things Dr. G does that he\u2019s never documented.",
+        instruct_s
+    ))
+    write_lines(story, count=20)
 
-for i, (title, questions) in enumerate(steps, 1):
-    if i > 1:
-        story.append(PageBreak())
-    build_step_section(story, i, title, questions)
+    build_footer(story)
+    doc.build(story)
+    print(f"PDF generated: {output_path}")
+    return output_path
 
-# Final page - notes
-story.append(PageBreak())
-story += section_label("Additional Notes")
-story.append(Paragraph(
-    "Use this space for anything that didn\u2019t fit above \u2014 "
-    "unwritten rules, edge cases, things Dr. G does that he\u2019s never documented.",
-    instruct_s
-))
-write_lines(story, count=20)
 
-build_footer(story)
-doc.build(story)
-print(f"PDF generated: {OUTPUT_PATH}")
+if __name__ == '__main__':
+    build()
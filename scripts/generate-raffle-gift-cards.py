@@ -226,30 +226,36 @@ def build_card(output_path: str, title_line1: str, title_line2: str,
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
 OUT_DIR = os.path.join(PROJECT_DIR, 'public')
-os.makedirs(OUT_DIR, exist_ok=True)
+OUTPUT_HBOT = os.path.join(OUT_DIR, 'Range-Medical-Raffle-HBOT.pdf')
+OUTPUT_RED_LIGHT = os.path.join(OUT_DIR, 'Range-Medical-Raffle-RedLight.pdf')
 
-hbot_path = os.path.join(OUT_DIR, 'Range-Medical-Raffle-HBOT.pdf')
-rlt_path  = os.path.join(OUT_DIR, 'Range-Medical-Raffle-RedLight.pdf')
 
-hbot_code = build_card(
-    output_path=hbot_path,
-    title_line1="Hyperbaric Oxygen",
-    title_line2="Chamber Therapy",
-    prize_slug="hbot",
-    code_prefix="HYPERBARIC",
-)
-rlt_code = build_card(
-    output_path=rlt_path,
-    title_line1="Red Light",
-    title_line2="Therapy",
-    prize_slug="red-light",
-    code_prefix="REDLIGHT",
-)
+def main():
+    os.makedirs(OUT_DIR, exist_ok=True)
+
+    hbot_code = build_card(
+        output_path=OUTPUT_HBOT,
+        title_line1="Hyperbaric Oxygen",
+        title_line2="Chamber Therapy",
+        prize_slug="hbot",
+        code_prefix="HYPERBARIC",
+    )
+    rlt_code = build_card(
+        output_path=OUTPUT_RED_LIGHT,
+        title_line1="Red Light",
+        title_line2="Therapy",
+        prize_slug="red-light",
+        code_prefix="REDLIGHT",
+    )
+
+    print(f"Hyperbaric Oxygen card: {OUTPUT_HBOT}")
+    print(f"  Code: {hbot_code}")
+    print(f"  URL:  {BASE_URL}/raffle/hbot?c={hbot_code}")
+    print()
+    print(f"Red Light Therapy card: {OUTPUT_RED_LIGHT}")
+    print(f"  Code: {rlt_code}")
+    print(f"  URL:  {BASE_URL}/raffle/red-light?c={rlt_code}")
+
 
-print(f"Hyperbaric Oxygen card: {hbot_path}")
-print(f"  Code: {hbot_code}")
-print(f"  URL:  {BASE_URL}/raffle/hbot?c={hbot_code}")
-print()
-print(f"Red Light Therapy card: {rlt_path}")
-print(f"  Code: {rlt_code}")
-print(f"  URL:  {BASE_URL}/raffle/red-light?c={rlt_code}")
+if __name__ == "__main__":
+    main()
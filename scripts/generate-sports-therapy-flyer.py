@@ -112,56 +112,64 @@ QR_PATH = os.path.join(PROJECT_DIR, 'public', 'qr-sports-therapy.png')
 OUTPUT_PATH = os.path.join(PROJECT_DIR, 'public', 'Range-Medical-Sports-Therapy-Flyer.pdf')
 
 # --- Build document ---
-doc = SimpleDocTemplate(
-    OUTPUT_PATH,
-    pagesize=letter,
-    rightMargin=0.75*inch, leftMargin=0.75*inch,
-    topMargin=0.65*inch,   bottomMargin=0.65*inch,
-)
-
-story = []
-build_header(story)
-
-# Title
-story.append(Paragraph("Recover Faster. We\u2019re Right Upstairs.", title_s))
-story.append(Paragraph(
-    "Range Medical offers regenerative treatments that work alongside "
-    "your PT and rehab to help you heal faster.",
-    subtitle_s
-))
-story.append(Spacer(1, 10))
-
-# Injury & Recovery
-story += section_label("Injury & Recovery")
-story.append(service_table([
-    ("Peptide Therapy",          "BPC-157 / TB4 \u2014 accelerates tissue repair and reduces inflammation"),
-    ("Toradol Injection",        "Fast-acting pain relief for acute injuries and flare-ups"),
-    ("PRP Therapy",              "Your own platelets concentrated to support natural repair"),
-    ("Exosome Therapy",          "Cell-signaling molecules that ramp up your body\u2019s repair"),
-    ("Red Light Therapy",        "Full body \u2014 cellular repair and collagen production, 10\u201320 min sessions"),
-]))
-story.append(Spacer(1, 4))
-
-# Energy & Optimization
-story += section_label("Energy & Optimization")
-story.append(service_table([
-    ("Lab Panels",               "Comprehensive bloodwork to identify what\u2019s holding you back"),
-    ("Hormone Optimization",     "Testosterone, thyroid, and metabolic balancing"),
-    ("Weight Loss",              "Medical weight loss programs with GLP-1 and more"),
-    ("IV Therapy & NAD+",        "Performance drips, recovery, and cellular energy"),
-]))
-story.append(Spacer(1, 8))
-
-# QR Code section
-story.append(Paragraph("Scan to See Everything We Offer", scan_s))
-story.append(Paragraph("Or text us \u2014 the message is pre-filled, just hit send.", scan_sub_s))
-story.append(Spacer(1, 6))
-
-qr_img = Image(QR_PATH, width=1.6*inch, height=1.6*inch)
-qr_img.hAlign = 'CENTER'
-story.append(qr_img)
-story.append(Spacer(1, 10))
-
-build_footer(story)
-doc.build(story)
-print(f"Flyer saved to: {OUTPUT_PATH}")
+
+
+def build(output_path=OUTPUT_PATH):
+    doc = SimpleDocTemplate(
+        output_path,
+        pagesize=letter,
+        rightMargin=0.75*inch, leftMargin=0.75*inch,
+        topMargin=0.65*inch,   bottomMargin=0.65*inch,
+    )
+
+    story = []
+    build_header(story)
+
+    # Title
+    story.append(Paragraph("Recover Faster. We\u2019re Right Upstairs.", title_s))
+    story.append(Paragraph(
+        "Range Medical offers regenerative treatments that work alongside "
+        "your PT and rehab to help you heal faster.",
+        subtitle_s
+    ))
+    story.append(Spacer(1, 10))
+
+    # Injury & Recovery
+    story += section_label("Injury & Recovery")
+    story.append(service_table([
+        ("Peptide Therapy",          "BPC-157 / TB4 \u2014 accelerates tissue repair and reduces inflammation"),
+        ("Toradol Injection",        "Fast-acting pain relief for acute injuries and flare-ups"),
+        ("PRP Therapy",              "Your own platelets concentrated to support natural repair"),
+        ("Exosome Therapy",          "Cell-signaling molecules that ramp up your body\u2019s repair"),
+        ("Red Light Therapy",        "Full body \u2014 cellular repair and collagen production, 10\u201320 min sessions"),
+    ]))
+    story.append(Spacer(1, 4))
+
+    # Energy & Optimization
+    story += section_label("Energy & Optimization")
+    story.append(service_table([
+        ("Lab Panels",               "Comprehensive bloodwork to identify what\u2019s holding you back"),
+        ("Hormone Optimization",     "Testosterone, thyroid, and metabolic balancing"),
+        ("Weight Loss",              "Medical weight loss programs with GLP-1 and more"),
+        ("IV Therapy & NAD+",        "Performance drips, recovery, and cellular energy"),
+    ]))
+    story.append(Spacer(1, 8))
+
+    # QR Code section
+    story.append(Paragraph("Scan to See Everything We Offer", scan_s))
+    story.append(Paragraph("Or text us \u2014 the message is pre-filled, just hit send.", scan_sub_s))
+    story.append(Spacer(1, 6))
+
+    qr_img = Image(QR_PATH, width=1.6*inch, height=1.6*inch)
+    qr_img.hAlign = 'CENTER'
+    story.append(qr_img)
+    story.append(Spacer(1, 10))
+
+    build_footer(story)
+    doc.build(story)
+    print(f"Flyer saved to: {output_path}")
+    return output_path
+
+
+if __name__ == '__main__':
+    build()
@@ -24,12 +24,15 @@ TEXT_BLACK = HexColor('#171717')
 ACCENT_GRAY = HexColor('#737373')
 
 # Paths
-LOGO_PATH = "/Users/chriscupp/Downloads/ChatGPT Image Jan 8, 2026, 09_19_41 AM (1).png"
-OUTPUT_PATH = "/Users/chriscupp/Desktop/Range_Medical_Services_Lookbook_2025.pdf"
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOGO_PATH = os.path.join(ROOT, 'public', 'brand', 'range_logo_transparent_black.png')
+OUTPUT_PATH = os.path.join(ROOT, 'public', 'docs', 'range-services-lookbook-2025.pdf')
 
 class LookbookGenerator:
-    def __init__(self):
-        self.c = canvas.Canvas(OUTPUT_PATH, pagesize=landscape(letter))
+    def __init__(self, output_path=OUTPUT_PATH, logo_path=LOGO_PATH):
+        self.output_path = output_path
+        self.logo_path = logo_path
+        self.c = canvas.Canvas(output_path, pagesize=landscape(letter))
         self.page_num = 0
         self.half_width = PAGE_WIDTH / 2
 
@@ -62,8 +65,9 @@ class LookbookGenerator:
     def draw_logo(self, x, y, size=1.5*inch):
         """Draw the Range Medical logo"""
         try:
-            logo = ImageReader(LOGO_PATH)
-            self.c.drawImage(logo, x - size/2, y - size/2, width=size, height=size, mask='auto')
+            logo = ImageReader(self.logo_path)
+            self.c.drawImage(logo, x - size/2, y - size/2, width=size, height=size,
+                             mask='auto', preserveAspectRatio=True, anchor='c')
         except:
             # Fallback if logo not found
             self.c.setFillColor(TEXT_BLACK)
@@ -854,9 +858,14 @@ Our mission is simple: help you optimize, perform, and live beyond your limits."
 
         # Save
         self.c.save()
-        print(f"Lookbook saved to: {OUTPUT_PATH}")
+        print(f"Lookbook saved to: {self.output_path}")
         print(f"Total pages: {self.page_num}")
 
+
+def build(output_path=OUTPUT_PATH, logo_path=LOGO_PATH):
+    LookbookGenerator(output_path, logo_path).generate()
+    return output_path
+
+
 if __name__ == "__main__":
-    generator = LookbookGenerator()
-    generator.generate()
+    build()
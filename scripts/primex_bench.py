@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Primex Parser Benchmarks — Range Medical CRM
+Equivalence + throughput checks for primex_parser.py changes.
+
+Text is extracted from the corpus once, then each benchmark times only the
+stage under test, so results reflect the parser rather than pdfplumber.
+
+Usage:
+    python3 primex_bench.py matcher [/path/to/pdf/folder] [--repeat N] [--limit N]
+    python3 primex_bench.py layout  [/path/to/pdf/folder] [--limit N]
+    python3 primex_bench.py backends [/path/to/pdf/folder] [--limit N]
+    python3 primex_bench.py golden  [/path/to/corpus] [--backend B] [--extract-mode M] [--workers N]
+    python3 primex_bench.py golden  /path/to/pdf/folder --record   (snapshot current output)
+
+The golden corpus (scripts/primex-golden/) holds synthetic, de-identified
+Primex-layout PDFs plus golden.json, the header and values every report must
+parse to; rebuild it with primex_synth.py golden.
+"""
+
+import argparse, contextlib, io, json, re, resource, sys, tempfile, time
+from pathlib import Path
+
+from pypdf import PdfReader
+
+sys.path.insert(0, str(Path(__file__).parent))
+import primex_parser as pp
+from primex_profile import peak_rss_mb
+
+DEFAULT_CORPUS = Path(__file__).parent.parent / 'primex-pdfs'
+DEFAULT_GOLDEN = Path(__file__).parent / 'primex-golden'
+
+
+# ── Corpus loading ────────────────────────────────────────────────────────────
+
+def load_sections(folder, limit=None):
+    """Extract every PDF in folder once and return [(label, section_text)]."""
+    pdf_files = sorted(Path(folder).glob('*.pdf'))[:limit]
+    sections = []
+    for pdf_path in pdf_files:
+        pages = pp.extract_pages(pdf_path)
+        for i, section in enumerate(pp.split_into_sections(pages)):
+            if re.search(r'DOB:', section['text']):
+                sections.append((f"{pdf_path.name}[{i+1}]", section['text']))
+    return sections
+
+
+# ── Matcher: compiled vs. reference ───────────────────────────────────────────
+
+def parse_values_reference(text):
+    """The original per-pattern full-text scan, kept as the equivalence oracle."""
+    values = {}
+    for pattern, col in pp.PATTERNS:
+        m = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+        if m:
+            try:
+                raw = re.sub(r'[<>,\s]', '', m.group(1))
+                values[col] = float(raw)
+            except ValueError:
+                pass
+    return values
+
+
+def _time(fn, texts, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for text in texts:
+            fn(text)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def bench_matcher(args):
+    t0 = time.perf_counter()
+    sections = load_sections(args.folder, args.limit)
+    print(f"Loaded {len(sections)} report sections in {time.perf_counter() - t0:.1f}s")
+    if not sections:
+        return 1
+
+    mismatches = 0
+    for label, text in sections:
+        expected, actual = parse_values_reference(text), pp.parse_values(text)
+        if expected != actual:
+            mismatches += 1
+            diff = sorted(set(expected.items()) ^ set(actual.items()))
+            print(f"  MISMATCH {label}: {diff}")
+
+    texts = [text for _, text in sections]
+    ref = _time(parse_values_reference, texts, args.repeat)
+    new = _time(pp.parse_values, texts, args.repeat)
+    n = len(texts)
+
+    print()
+    print(f"{'matcher':<12} {'total':>10} {'per report':>12} {'reports/s':>10}")
+    print(f"{'reference':<12} {ref*1000:>8.1f}ms {ref/n*1e6:>10.0f}µs {n/ref:>10.0f}")
+    print(f"{'compiled':<12} {new*1000:>8.1f}ms {new/n*1e6:>10.0f}µs {n/new:>10.0f}")
+    print(f"Speedup: {ref/new:.1f}x   Equivalent: {n - mismatches}/{n}")
+    return 1 if mismatches else 0
+
+
+# ── Layout vs. text extraction ────────────────────────────────────────────────
+
+def _extract_sections(pdf_path, layout=False, backend='pdfplumber'):
+    """[(label, header, values)] for one PDF, plus extraction seconds and page count."""
+    t0 = time.perf_counter()
+    pages = pp.extract_pages(pdf_path, pp.ExtractOptions(layout=layout, skip_pages=False,
+                                                         backend=backend))
+    elapsed = time.perf_counter() - t0
+    sections = [(f"{pdf_path.name}[{i+1}]", s['header'], s['values'])
+                for i, s in enumerate(pp.iter_parsed_sections(pages))]
+    return sections, elapsed, len(pages)
+
+
+def bench_layout(args):
+    pdf_files = sorted(Path(args.folder).glob('*.pdf'))[:args.limit]
+    totals = {'text': 0.0, 'layout': 0.0}
+    n_pages = n_sections = same = 0
+    gained = lost = 0
+    for pdf_path in pdf_files:
+        text_secs, t_text, n = _extract_sections(pdf_path, layout=False)
+        layout_secs, t_layout, _ = _extract_sections(pdf_path, layout=True)
+        totals['text'] += t_text
+        totals['layout'] += t_layout
+        n_pages += n
+        for (label, th, tv), (_, lh, lv) in zip(text_secs, layout_secs):
+            n_sections += 1
+            if th != lh:
+                print(f"  HEADER {label}: {th} vs {lh}")
+            if tv == lv:
+                same += 1
+                continue
+            only_text = sorted(set(tv.items()) - set(lv.items()))
+            only_layout = sorted(set(lv.items()) - set(tv.items()))
+            lost += len(only_text)
+            gained += len(only_layout)
+            print(f"  DIFF {label}: text-only {only_text}  layout-only {only_layout}")
+
+    print()
+    print(f"{'extractor':<10} {'total':>9} {'pages/s':>9}")
+    for mode, t in totals.items():
+        print(f"{mode:<10} {t:>8.2f}s {n_pages / t if t else 0:>9.1f}")
+    print(f"Sections with identical values: {same}/{n_sections}  "
+          f"(layout adds {gained}, drops {lost} values)")
+    return 1 if lost else 0
+
+
+# ── Text backends ─────────────────────────────────────────────────────────────
+
+def bench_backends(args):
+    pdf_files = sorted(Path(args.folder).glob('*.pdf'))[:args.limit]
+    reference = {}
+    results = []
+    for backend in pp.TEXT_BACKENDS:
+        pp._PROFILER = pp.StageProfiler()
+        total = 0.0
+        n_pages = n_sections = same = 0
+        for pdf_path in pdf_files:
+            sections, elapsed, n = _extract_sections(pdf_path, backend=backend)
+            total += elapsed
+            n_pages += n
+            if backend == 'pdfplumber':
+                reference[pdf_path] = sections
+            expected = reference[pdf_path]
+            n_sections += len(expected)
+            if len(sections) != len(expected):
+                print(f"  {backend}: {pdf_path.name}: {len(sections)} sections, expected {len(expected)}")
+                continue
+            for (label, h, v), (_, eh, ev) in zip(sections, expected):
+                if (h, v) == (eh, ev):
+                    same += 1
+                elif args.verbose:
+                    diff = sorted(set(v.items()) ^ set(ev.items()))
+                    print(f"  {backend}: {label}: header {h == eh}, values {diff}")
+        stages = pp._PROFILER.stages
+        fallbacks = stages.get('extract_pages', {}).get('calls', 0) if backend != 'pdfplumber' else 0
+        results.append((backend, total, n_pages, fallbacks, same, n_sections))
+    pp._PROFILER = None
+
+    print()
+    print(f"{'backend':<11} {'total':>9} {'pages/s':>9} {'fallback':>9} {'sections = pdfplumber':>22}")
+    for backend, total, n_pages, fallbacks, same, n_sections in results:
+        print(f"{backend:<11} {total:>8.2f}s {n_pages / total if total else 0:>9.1f} "
+              f"{fallbacks:>4}/{n_pages:<4} {same:>12}/{n_sections}")
+    return 0
+
+
+# ── Golden corpus: regression + throughput ───────────────────────────────────
+
+def _diff_values(expected, actual):
+    """(missing, unexpected, wrong) between two {db_column: value} dicts."""
+    missing = sorted(set(expected) - set(actual))
+    unexpected = sorted(set(actual) - set(expected))
+    wrong = sorted((c, expected[c], actual[c]) for c in set(expected) & set(actual)
+                   if expected[c] != actual[c])
+    return missing, unexpected, wrong
+
+
+def bench_golden(args):
+    folder = args.folder
+    pdf_files = sorted(folder.glob('*.pdf'))
+    golden_path = folder / 'golden.json'
+    if not pdf_files:
+        print(f"No PDFs in {folder}")
+        return 1
+    if not args.record and not golden_path.exists():
+        print(f"No {golden_path} (create one with --record)")
+        return 1
+    n_pages = sum(len(PdfReader(str(f)).pages) for f in pdf_files)
+    extract = pp.ExtractOptions(layout=args.extract_mode == 'layout', backend=args.backend)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        t0 = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            records = list(pp.iter_records(pdf_files, Path(tmp), args.workers, extract=extract))
+        elapsed = time.perf_counter() - t0
+    actual = {r['filename']: {'header': r['header'], 'values': r['values']} for r in records}
+
+    if args.record:
+        golden_path.write_text(json.dumps(actual, indent=2, sort_keys=True) + '\n')
+        print(f"Recorded {len(actual)} reports to {golden_path}")
+        return 0
+
+    golden = json.loads(golden_path.read_text())
+    failed = n_values = n_correct = 0
+    for label in sorted(set(golden) | set(actual)):
+        exp, got = golden.get(label), actual.get(label)
+        if exp is None or got is None:
+            failed += 1
+            print(f"  {label}: {'unexpected report' if exp is None else 'report not produced'}")
+            continue
+        missing, unexpected, wrong = _diff_values(exp['values'], got['values'])
+        n_values += len(exp['values'])
+        n_correct += len(exp['values']) - len(missing) - len(wrong)
+        if exp['header'] != got['header'] or missing or unexpected or wrong:
+            failed += 1
+            print(f"  {label}:")
+            if exp['header'] != got['header']:
+                print(f"    header   expected {exp['header']}, got {got['header']}")
+            for name, items in (('missing', missing), ('extra', unexpected), ('wrong', wrong)):
+                if items:
+                    print(f"    {name:<8} {items}")
+
+    print()
+    print(f"Corpus:     {folder} ({len(pdf_files)} PDFs, {n_pages} pages, {len(golden)} reports)")
+    print(f"Extraction: --backend {args.backend} --extract-mode {args.extract_mode} "
+          f"--workers {args.workers}")
+    print(f"Values:     {n_correct}/{n_values} correct   Reports: {len(golden) - failed}/{len(golden)}")
+    print(f"Throughput: {elapsed:.2f}s  {n_pages / elapsed:.1f} pages/s  "
+          f"{len(records) / elapsed:.1f} reports/s")
+    print(f"Peak RSS:   {peak_rss_mb(resource.RUSAGE_SELF):.0f} MB"
+          + (f" (workers {peak_rss_mb(resource.RUSAGE_CHILDREN):.0f} MB)" if args.workers > 1 else ''))
+    return 1 if failed else 0
+
+
+# ── Main ──────────────────────────────────────────────────────────────────────
+
+def main():
+    ap = argparse.ArgumentParser(description='Primex parser benchmarks')
+    sub = ap.add_subparsers(dest='bench', required=True)
+
+    p = sub.add_parser('matcher', help='parse_values() equivalence + speed vs. the per-pattern scan')
+    p.add_argument('folder', nargs='?', type=Path, default=DEFAULT_CORPUS)
+    p.add_argument('--repeat', type=int, default=5, help='timing repetitions (best is reported)')
+    p.add_argument('--limit', type=int, help='only use the first N PDFs')
+    p.set_defaults(func=bench_matcher)
+
+    p = sub.add_parser('layout', help='--extract-mode layout vs. text: values + extraction speed')
+    p.add_argument('folder', nargs='?', type=Path, default=DEFAULT_CORPUS)
+    p.add_argument('--limit', type=int, help='only use the first N PDFs')
+    p.set_defaults(func=bench_layout)
+
+    p = sub.add_parser('backends', help='primex_parser --backend choices: speed, fallbacks, accuracy')
+    p.add_argument('folder', nargs='?', type=Path, default=DEFAULT_CORPUS)
+    p.add_argument('--limit', type=int, help='only use the first N PDFs')
+    p.add_argument('--verbose', action='store_true', help='print every differing section')
+    p.set_defaults(func=bench_backends)
+
+    p = sub.add_parser('golden', help='regression vs. golden.json + pages/s, reports/s, peak RSS')
+    p.add_argument('folder', nargs='?', type=Path, default=DEFAULT_GOLDEN)
+    p.add_argument('--backend', choices=pp.TEXT_BACKENDS, default='pdfplumber')
+    p.add_argument('--extract-mode', choices=['text', 'layout'], default='text')
+    p.add_argument('--workers', type=int, default=1)
+    p.add_argument('--record', action='store_true',
+                   help="write the current parser output as the folder's golden.json")
+    p.set_defaults(func=bench_golden)
+
+    args = ap.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == '__main__':
+    main()
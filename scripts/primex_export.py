@@ -0,0 +1,118 @@
+"""
+Primex Columnar Export — Range Medical CRM
+Writes parsed Primex records to one analytics table for primex_parser.py --export.
+
+One row per report section: source metadata (file, section, hash, pdf_url),
+patient name / sex / DOB / test_date, then one float column per PATTERNS db_column
+(empty where the report did not include that analyte). The format follows the
+file suffix:
+
+    .parquet               Parquet (pyarrow)
+    .arrow .feather .ipc   Arrow IPC file (pyarrow)
+    .csv                   CSV (standard library)
+
+Without pyarrow installed, Parquet/Arrow requests are written as CSV next to
+the requested path instead, so an export never fails a run. read_export()
+turns any of the three back into record dicts (e.g. as --flags-history).
+"""
+
+import csv
+from datetime import date
+
+META_COLUMNS = ['source_file', 'section_index', 'source_hash', 'pdf_url',
+                'last_name', 'first_name', 'sex', 'dob', 'test_date']
+ARROW_SUFFIXES = {'.parquet': 'parquet', '.arrow': 'arrow', '.feather': 'arrow', '.ipc': 'arrow'}
+
+
+def export_rows(records, value_columns):
+    """[{column: value}] for records — META_COLUMNS then value_columns."""
+    rows = []
+    for rec in records:
+        header = rec['header']
+        row = {
+            'source_file': rec['filename'],
+            'section_index': rec.get('section_index'),
+            'source_hash': rec.get('source_hash'),
+            'pdf_url': rec.get('pdf_url'),
+            'last_name': header.get('last_name'),
+            'first_name': header.get('first_name'),
+            'sex': header.get('sex'),
+            'dob': header.get('dob'),
+            'test_date': header.get('test_date'),
+        }
+        for col in value_columns:
+            row[col] = rec['values'].get(col)
+        rows.append(row)
+    return rows
+
+
+def _arrow_table(pa, rows, value_columns):
+    types = {'section_index': pa.int32(), 'dob': pa.date32(), 'test_date': pa.date32()}
+    fields = [pa.field(c, types.get(c, pa.string())) for c in META_COLUMNS]
+    fields += [pa.field(c, pa.float64()) for c in value_columns]
+    schema = pa.schema(fields)
+    columns = {}
+    for field in schema:
+        col = [row[field.name] for row in rows]
+        if field.type == pa.date32():
+            col = [date.fromisoformat(v) if v else None for v in col]
+        columns[field.name] = col
+    return pa.table(columns, schema=schema)
+
+
+def _write_csv(rows, path, value_columns):
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=META_COLUMNS + list(value_columns))
+        writer.writeheader()
+        writer.writerows(rows)  # None → empty field
+
+
+def export_records(records, path, value_columns):
+    """
+    Write records to path in the format its suffix names (see module docstring).
+    Returns (written_path, format) — a .csv path when pyarrow is unavailable.
+    """
+    rows = export_rows(records, value_columns)
+    fmt = ARROW_SUFFIXES.get(path.suffix.lower(), 'csv')
+    if fmt != 'csv':
+        try:
+            import pyarrow as pa
+        except ImportError:
+            path, fmt = path.with_suffix('.csv'), 'csv'
+    if fmt == 'csv':
+        _write_csv(rows, path, value_columns)
+        return path, fmt
+
+    table = _arrow_table(pa, rows, value_columns)
+    if fmt == 'parquet':
+        import pyarrow.parquet as pq
+        pq.write_table(table, str(path))
+    else:
+        with pa.OSFile(str(path), 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    return path, fmt
+
+
+def read_export(path):
+    """Records ({'filename', 'header', 'values'}) from a file written by export_records()."""
+    fmt = ARROW_SUFFIXES.get(path.suffix.lower(), 'csv')
+    if fmt == 'csv':
+        with open(path, newline='') as f:
+            rows = [{k: (v if v != '' else None) for k, v in row.items()} for row in csv.DictReader(f)]
+    else:
+        import pyarrow as pa
+        if fmt == 'parquet':
+            import pyarrow.parquet as pq
+            table = pq.read_table(str(path))
+        else:
+            with pa.memory_map(str(path)) as source:
+                table = pa.ipc.open_file(source).read_all()
+        rows = table.to_pylist()
+
+    records = []
+    for row in rows:
+        header = {k: str(row[k]) for k in ('last_name', 'first_name', 'sex', 'dob', 'test_date')
+                  if row.get(k) is not None}
+        values = {k: float(v) for k, v in row.items() if k not in META_COLUMNS and v is not None}
+        records.append({'filename': row['source_file'], 'header': header, 'values': values})
+    return records
@@ -0,0 +1,172 @@
+"""
+Primex Batch Flags — Range Medical CRM
+Out-of-range flags, deltas and z-scores for a whole import in one NumPy pass.
+
+Records become a patients × analytes float matrix (NaN = not reported) and
+every statistic is an array expression over it:
+
+    flag      computeFlag() from lib/biomarker-config.js: low / high /
+              borderline_low / borderline_high (within 10% of a reference
+              bound) / optimal / normal, against lab_reference_ranges rows
+    previous  the patient's most recent earlier result for that analyte
+              (earlier records in the batch, or --flags-history records)
+    delta     value - previous
+    z         (value - range midpoint) / SD, reading the reference range
+              as mean ± 1.96 SD
+
+Ranges are chosen per record like generate-lab-synopsis.js: the row for the
+patient's sex ('Male' / 'Female', from the M / F parse_header() reads into
+header['sex']), else the 'Both' row.
+"""
+
+import json, os
+
+try:
+    import numpy as np
+except ImportError:
+    os.system("pip install numpy --break-system-packages -q")
+    import numpy as np
+
+FLAG_NAMES = ('normal', 'low', 'high', 'borderline_low', 'borderline_high', 'optimal')
+MISSING = -1
+GENDERS = ('Both', 'Male', 'Female')
+BORDERLINE = 0.1       # share of the reference width counted as borderline
+REFERENCE_SDS = 1.96   # a reference range spans mean ± this many SDs
+
+
+def load_ranges(path):
+    """
+    lab_reference_ranges rows from a JSON file: either a list of rows or the
+    /api/labs/reference-ranges response ({"ranges": {biomarker: row}}).
+    """
+    data = json.loads(path.read_text())
+    if isinstance(data, dict):
+        data = list(data.get('ranges', data).values())
+    return data
+
+
+def range_arrays(rows, columns):
+    """
+    {'lo', 'hi', 'opt_lo', 'opt_hi'} arrays of shape (len(GENDERS), len(columns)),
+    NaN where no row gives the bound. Accepts the same field aliases as the JS.
+    """
+    index = {col: j for j, col in enumerate(columns)}
+    out = {k: np.full((len(GENDERS), len(columns)), np.nan)
+           for k in ('lo', 'hi', 'opt_lo', 'opt_hi')}
+    aliases = {'lo': ('min_value', 'ref_low', 'reference_low'),
+               'hi': ('max_value', 'ref_high', 'reference_high'),
+               'opt_lo': ('optimal_min', 'optimal_low'),
+               'opt_hi': ('optimal_max', 'optimal_high')}
+    for row in rows:
+        j = index.get(row.get('biomarker'))
+        gender = row.get('gender') or 'Both'
+        if j is None or gender not in GENDERS:
+            continue
+        g = GENDERS.index(gender)
+        for key, names in aliases.items():
+            val = next((row[n] for n in names if row.get(n) is not None), None)
+            if val is not None:
+                out[key][g, j] = float(val)
+    return out
+
+
+def _record_ranges(ranges, genders):
+    """Per-record bounds (records × analytes): the sex-specific row, else 'Both'."""
+    out = {}
+    for key, arr in ranges.items():
+        specific = arr[genders]
+        out[key] = np.where(np.isnan(specific), arr[0], specific)
+    return out
+
+
+def flag_codes(values, lo, hi, opt_lo, opt_hi):
+    """Vectorized computeFlag(): int8 codes into FLAG_NAMES, MISSING where no value."""
+    with np.errstate(invalid='ignore'):
+        margin = (hi - lo) * BORDERLINE  # NaN unless both bounds exist
+        conditions = [
+            np.isnan(values),
+            values < lo,
+            values > hi,
+            values < lo + margin,
+            values > hi - margin,
+            (values >= opt_lo) & (values <= opt_hi),
+        ]
+    return np.select(conditions, [MISSING, 1, 2, 3, 4, 5], default=0).astype(np.int8)
+
+
+def z_scores(values, lo, hi):
+    """(value - midpoint) / SD with the range read as mean ± REFERENCE_SDS SD."""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sd = (hi - lo) / (2 * REFERENCE_SDS)
+        return np.where(sd > 0, (values - (lo + hi) / 2) / sd, np.nan)
+
+
+def previous_values(values, groups):
+    """
+    For rows sorted by (group, date): each cell's most recent earlier non-NaN
+    value in the same group (NaN if none). Forward fill by running max of
+    row indices, discarding indices that reach back into another group.
+    """
+    n = len(values)
+    rows = np.arange(n)[:, None]
+    seen = np.where(np.isnan(values), -1, rows)
+    last = np.maximum.accumulate(seen, axis=0)
+    prev = np.vstack([np.full((1, values.shape[1]), -1), last[:-1]])
+    valid = (prev >= 0) & (groups[np.maximum(prev, 0)] == groups[:, None])
+    return np.where(valid, values[np.maximum(prev, 0), np.arange(values.shape[1])], np.nan)
+
+
+def _patient_key(header):
+    return (header.get('last_name', '').lower(), header.get('first_name', '').lower(),
+            header.get('dob', ''))
+
+
+def flag_records(records, range_rows, columns, history=()):
+    """
+    Flags for every record with a name and test_date, in one vectorized pass.
+    history records (same shape, e.g. a previous --export) only supply
+    previous results; history for a patient/date that is in the batch (the
+    same report exported earlier) is ignored. Returns [(record, {column:
+    {'value', 'flag', 'previous', 'delta', 'z'}})] in records order.
+    """
+    batch = [r for r in records if 'last_name' in r['header'] and 'test_date' in r['header']]
+    if not batch:
+        return []
+    in_batch = {(_patient_key(r['header']), r['header']['test_date']) for r in batch}
+    history = [r for r in history
+               if (_patient_key(r['header']), r['header'].get('test_date')) not in in_batch]
+    rows = history + batch
+    col_index = {c: j for j, c in enumerate(columns)}
+    values = np.full((len(rows), len(columns)), np.nan)
+    for i, rec in enumerate(rows):
+        for col, val in rec['values'].items():
+            j = col_index.get(col)
+            if j is not None:
+                values[i, j] = val
+
+    keys = {}
+    groups = np.array([keys.setdefault(_patient_key(r['header']), len(keys)) for r in rows])
+    dates = np.array([r['header'].get('test_date', '') for r in rows])
+    order = np.lexsort((np.arange(len(rows)), dates, groups))  # stable within a date
+    prev = np.empty_like(values)
+    prev[order] = previous_values(values[order], groups[order])
+
+    sex = {'M': 1, 'F': 2, 'Male': 1, 'Female': 2}
+    genders = np.array([sex.get(r['header'].get('sex'), 0) for r in rows])
+    b = _record_ranges(range_arrays(range_rows, columns), genders)
+    codes = flag_codes(values, b['lo'], b['hi'], b['opt_lo'], b['opt_hi'])
+    z = z_scores(values, b['lo'], b['hi'])
+    delta = values - prev
+
+    def num(x):
+        return None if np.isnan(x) else round(float(x), 4)
+
+    out = []
+    for i in range(len(history), len(rows)):
+        flags = {}
+        for j in np.flatnonzero(codes[i] != MISSING):
+            flags[columns[j]] = {'value': float(values[i, j]), 'flag': FLAG_NAMES[codes[i, j]],
+                                 'previous': num(prev[i, j]), 'delta': num(delta[i, j]),
+                                 'z': num(z[i, j])}
+        out.append((rows[i], flags))
+    return out
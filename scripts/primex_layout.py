@@ -0,0 +1,152 @@
+"""
+Primex Layout Extraction — Range Medical CRM
+Rebuilds the results table of a Primex report from pdfplumber word positions.
+
+Primex prints results on a fixed grid (612pt page, monospaced):
+
+    x≈32   analyte label          (section titles sit at 18, comments at 68+)
+    ≤300   result, in range       (right-aligned near 290)
+    ≤390   result, out of range   (shifted right, followed by the flag)
+    ≈400   flag (H / L / ...)
+    ≈450   units                  (10^3 superscripts print on their own line)
+    ≈508   reference range
+
+Each page's words are read once (page.extract_words()); the same lines give
+the page text used for header parsing and the ResultRows used for values, so
+layout mode costs one pdfplumber pass per page. Labels are mapped to
+db_columns by dictionary lookup, memoized per distinct label.
+"""
+
+import re
+from collections import namedtuple
+
+ResultRow = namedtuple('ResultRow', ['analyte', 'result', 'flag', 'units', 'reference'])
+
+# Column boundaries in PDF points (left edge of the word)
+LABEL_X = (28, 40)        # first word of an analyte row
+RESULT_MIN_X = 230        # labels never reach this far right
+FLAG_X = (395, 430)
+UNITS_X = (430, 500)
+REFERENCE_MIN_X = 500
+LINE_TOLERANCE = 3        # words whose tops differ by less than this share a line
+
+FLAGS = {'H', 'L', 'HH', 'LL', 'A', 'AA', '*'}
+_RESULT = re.compile(r'[<>]?\d[\d.,]*$')
+_WS = re.compile(r'\s+')
+
+
+def page_lines(page):
+    """
+    Group a pdfplumber page's words into lines, top to bottom.
+    Returns [[(x0, text), ...], ...] with each line sorted left to right.
+    """
+    lines = []
+    current, current_top = [], None
+    for w in sorted(page.extract_words(), key=lambda w: (w['top'], w['x0'])):
+        if current_top is not None and w['top'] - current_top >= LINE_TOLERANCE:
+            lines.append(sorted(current))
+            current = []
+        if not current:
+            current_top = w['top']
+        current.append((round(w['x0'], 1), w['text']))
+    if current:
+        lines.append(sorted(current))
+    return lines
+
+
+def lines_text(lines):
+    """Page text from grouped lines (same line breaks as page.extract_text())."""
+    return '\n'.join(' '.join(text for _, text in line) for line in lines)
+
+
+def _superscript(line):
+    """The digits of a line holding only a units superscript (the 3 of 10^3/uL), else None."""
+    if len(line) == 1 and UNITS_X[0] <= line[0][0] < UNITS_X[1] and line[0][1].isdigit():
+        return line[0][1]
+    return None
+
+
+def parse_row(line, superscript=None):
+    """
+    Split one line into a ResultRow, or None if it is not an analyte result
+    (section title, comment, header, label continuation, non-numeric result).
+    superscript is a pending units exponent from the line above.
+    """
+    if not (LABEL_X[0] <= line[0][0] < LABEL_X[1]):
+        return None
+    label, result, flag, units, reference = [], None, None, [], []
+    for x0, text in line:
+        if x0 < RESULT_MIN_X:
+            label.append(text)
+        elif result is None and x0 < UNITS_X[0]:
+            if not _RESULT.match(text):
+                return None
+            result = text
+        elif FLAG_X[0] <= x0 < FLAG_X[1] and text in FLAGS:
+            flag = text
+        elif UNITS_X[0] <= x0 < UNITS_X[1]:
+            units.append(text)
+        elif x0 >= REFERENCE_MIN_X:
+            reference.append(text)
+    if result is None:
+        return None
+    if superscript and units[:1] == ['10']:
+        units[0] = f'10^{superscript}'
+    return ResultRow(' '.join(label), result, flag, ''.join(units) or None,
+                     ' '.join(reference) or None)
+
+
+def page_rows(lines):
+    """ResultRows for a page's grouped lines, in document order."""
+    rows = []
+    superscript = None
+    for line in lines:
+        sup = _superscript(line)
+        if sup:
+            superscript = sup
+            continue
+        row = parse_row(line, superscript)
+        if row:
+            rows.append(row)
+        superscript = None
+    return rows
+
+
+def read_page(page):
+    """One pdfplumber pass over a page: (page_text, [ResultRow, ...])."""
+    lines = page_lines(page)
+    return lines_text(lines), page_rows(lines)
+
+
+# ── Analyte → db_column ───────────────────────────────────────────────────────
+
+class AnalyteMap:
+    """
+    Dictionary from printed analyte label to db_column.
+    A label seen for the first time is classified against the parser's
+    PATTERNS (first pattern that matches "<label> 0" in full) and the answer
+    is kept, so each distinct label is only matched once per process.
+    """
+
+    def __init__(self, matchers):
+        self.matchers = matchers  # [(compiled regex, anchor, db_column)]
+        self.columns = {}
+
+    def column(self, label):
+        key = _WS.sub(' ', label).strip().upper()
+        try:
+            return self.columns[key]
+        except KeyError:
+            probe = f'{label} 0'
+            col = next((c for rx, _, c in self.matchers if rx.fullmatch(probe)), None)
+            self.columns[key] = col
+            return col
+
+    def results(self, rows):
+        """{db_column: ResultRow} — the first row in document order wins per column."""
+        out = {}
+        for row in rows:
+            col = self.column(row.analyte)
+            if col and col not in out:
+                out[col] = row
+        return out
@@ -0,0 +1,97 @@
+"""
+Primex Import Manifest — Range Medical CRM
+SQLite record of which Primex report sections have already been imported.
+
+One row per (source file hash, section index) with the patient, test date and
+a hash of the parsed header + values. primex_parser.py --incremental skips a
+section when the same section of the same file, or the same patient/date with
+identical values from any file (a re-sent combined batch), is already recorded.
+Rows are only written after the SQL/load for them has succeeded.
+"""
+
+import hashlib, json, sqlite3
+from datetime import datetime, timezone
+
+HASHED_HEADER = ('last_name', 'first_name', 'dob', 'test_date')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sections (
+    source_hash   TEXT NOT NULL,
+    section_index INTEGER NOT NULL,
+    source_file   TEXT,
+    last_name     TEXT,
+    first_name    TEXT,
+    test_date     TEXT,
+    values_hash   TEXT NOT NULL,
+    imported_at   TEXT NOT NULL,
+    PRIMARY KEY (source_hash, section_index)
+);
+CREATE INDEX IF NOT EXISTS sections_patient_date
+    ON sections (last_name, first_name, test_date, values_hash);
+"""
+
+
+def values_hash(header, values):
+    """
+    Stable hash of a section's patient / date header fields and values. Only
+    HASHED_HEADER counts, so header fields added later (sex) don't change the
+    hash of sections already in the manifest.
+    """
+    header = {k: v for k, v in header.items() if k in HASHED_HEADER}
+    payload = json.dumps({'header': header, 'values': values}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ImportManifest:
+    """
+    SQLite-backed manifest. The connection is opened lazily and dropped when
+    pickled, so the object can be handed to process-pool workers for lookups;
+    only the parent process writes.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._conn = None
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.path))
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    def __getstate__(self):
+        return {'path': self.path, '_conn': None}
+
+    def is_imported(self, source_hash, section_index, header, vhash):
+        """True if this section (or an identical report for the same patient/date) was imported."""
+        row = self.conn.execute(
+            """SELECT 1 FROM sections
+               WHERE (source_hash = ? AND section_index = ? AND values_hash = ?)
+                  OR (last_name = ? AND first_name = ? AND test_date = ? AND values_hash = ?)
+               LIMIT 1""",
+            (source_hash, section_index, vhash,
+             header.get('last_name'), header.get('first_name'), header.get('test_date'), vhash),
+        ).fetchone()
+        return row is not None
+
+    def record(self, records):
+        """Mark records (dicts with source_hash / section_index / values_hash) as imported."""
+        now = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        with self.conn:
+            self.conn.executemany(
+                """INSERT OR REPLACE INTO sections
+                   (source_hash, section_index, source_file, last_name, first_name,
+                    test_date, values_hash, imported_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                [(r['source_hash'], r['section_index'], r['filename'],
+                  r['header'].get('last_name'), r['header'].get('first_name'),
+                  r['header'].get('test_date'), r['values_hash'], now)
+                 for r in records],
+            )
+        return len(records)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
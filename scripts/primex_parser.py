@@ -2,7 +2,8 @@
 """
 Primex PDF Lab Parser — Range Medical CRM
 Extracts lab values from Primex reports and generates SQL for import.
-Uploads per-patient PDFs to Supabase Storage and sets pdf_url on lab rows.
+Splits per-patient PDFs, sets pdf_url on lab rows and (with --upload)
+uploads them to Supabase Storage.
 
 Handles single-patient PDFs and combined multi-patient PDFs
 (reports separated by "END OF REPORT" markers).
@@ -10,13 +11,30 @@ Handles single-patient PDFs and combined multi-patient PDFs
 Usage:
     python3 primex_parser.py /path/to/pdf/folder
     python3 primex_parser.py  (defaults to uploads folder)
+    python3 primex_parser.py /path/to/pdf/folder --workers 8
+    python3 primex_parser.py /path/to/pdf/folder --rebuild-cache   (or --no-cache)
+    python3 primex_parser.py /path/to/pdf/folder --sql-mode batch
+    python3 primex_parser.py /path/to/pdf/folder --load --database-url postgres://...
+    python3 primex_parser.py /path/to/pdf/folder --upload --upload-workers 8
+    python3 primex_parser.py /path/to/pdf/folder --incremental   (skip already-imported reports)
+    python3 primex_parser.py /path/to/pdf/folder --profile [--cprofile /tmp/primex.prof]
+    python3 primex_parser.py /path/to/pdf/folder --extract-mode layout [--results-json out.json]
+    python3 primex_parser.py /path/to/pdf/folder --no-page-skip   (pdfplumber on every page)
+    python3 primex_parser.py /path/to/pdf/folder --backend stream   (fast text, pdfplumber fallback)
+    python3 primex_parser.py /path/to/pdf/folder --export labs.parquet   (or .arrow / .csv)
+    python3 primex_parser.py /path/to/pdf/folder --flags-json flags.json --ranges ranges.json
+    python3 primex_parser.py /path/to/pdf/folder --match-patients   (or --patients-file roster.csv)
+    python3 primex_parser.py /path/to/inbox --watch [--workers 2]   (daemon: import PDFs as they land)
+    python3 primex_parser.py /path/to/pdf/folder --max-rss 512   (report peak memory; exit 1 over 512 MB)
 """
 
-import sys, os, re
+import sys, os, re, io, csv, json, time, signal, hashlib, resource, argparse, cProfile, contextlib, functools, traceback
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # ── Dependencies ─────────────────────────────────────────────────────────────
-for pkg in ['pdfplumber', 'pypdf', 'supabase']:
+for pkg in ['pdfplumber', 'pypdf']:
     try:
         __import__(pkg.replace('-', '_'))
     except ImportError:
@@ -24,7 +42,15 @@ for pkg in ['pdfplumber', 'pypdf', 'supabase']:
 
 import pdfplumber
 from pypdf import PdfReader, PdfWriter
-from supabase import create_client
+
+from primex_export import export_records, read_export
+from primex_layout import AnalyteMap, ResultRow, read_page
+from primex_manifest import ImportManifest, values_hash
+from primex_patients import MATCHED, PatientIndex, fetch_roster, load_roster
+from primex_probe import probe_text
+from primex_profile import StageProfiler, peak_rss_mb
+from primex_storage import StorageUploader
+from primex_watch import InboxWatcher, archive
 
 # ── Supabase config (read from CRM .env.local) ───────────────────────────────
 _ENV_PATH = Path(__file__).parent / 'mnt/Claude CUPP 2nd brain/Range Medical CRM/rangemedical-system-2/.env.local'
@@ -40,8 +66,8 @@ def _load_env():
     return env
 
 _ENV = _load_env()
-SUPABASE_URL = _ENV.get('NEXT_PUBLIC_SUPABASE_URL', '')
-SUPABASE_KEY = _ENV.get('SUPABASE_SERVICE_ROLE_KEY', '')
+SUPABASE_URL = os.environ.get('NEXT_PUBLIC_SUPABASE_URL') or _ENV.get('NEXT_PUBLIC_SUPABASE_URL', '')
+SUPABASE_KEY = os.environ.get('SUPABASE_SERVICE_ROLE_KEY') or _ENV.get('SUPABASE_SERVICE_ROLE_KEY', '')
 STORAGE_BUCKET = 'lab-documents'
 STORAGE_PREFIX = 'primex'
 
@@ -152,55 +178,178 @@ PATTERNS = [
     (r'%\s*FREE\s+PSA\s*\(Calc\.\)\s+([<>]?[\d.,]+)', 'psa_free_percent'),
 ]
 
+VALUE_COLUMNS = list(dict.fromkeys(col for _, col in PATTERNS))  # db_columns, PATTERNS order
+
+
+# ── Stage profiling (--profile) ─────────────────────────────────────────────────
+# _PROFILER is swapped in per file by _process_pdf_safe() so each process
+# (parent or pool worker) reports its own stage totals back to main().
+
+_PROFILER = None
+
+
+def _stage(name, items=1):
+    """Profile a block as stage `name` when profiling is on; no-op otherwise."""
+    if _PROFILER is None:
+        return contextlib.nullcontext({'items': items})
+    return _PROFILER.stage(name, items)
+
 
 # ── Text extraction ───────────────────────────────────────────────────────────
 
-def extract_pages(pdf_path):
-    """Return list of (page_index, page_text) for every page in the PDF."""
-    pages = []
+# layout:     read values from the results table's word positions (primex_layout);
+#             always uses pdfplumber
+# skip_pages: probe each page's content stream first and only run pdfplumber on
+#             pages that have lab values (primex_probe)
+# backend:    page text extractor for text mode, one of TEXT_BACKENDS
+# release_pages: close each pdfplumber page once its text is captured, so its
+#             chars / layout objects are freed instead of living until the PDF
+#             is closed (a 400-page combined PDF otherwise peaks over 2 GB)
+ExtractOptions = namedtuple('ExtractOptions', ['layout', 'skip_pages', 'backend', 'release_pages'],
+                            defaults=[False, True, 'pdfplumber', True])
+
+# pdfplumber: pdfminer layout of every char (slow, the reference)
+# stream:     literal strings read from the page content stream (primex_probe)
+# Stream pages whose header doesn't parse are re-extracted with pdfplumber.
+# (pypdf was tried and dropped: on primex-pdfs/ its text parses the header on
+# 23 of 154 pages and glues results onto labels — 'ALKALINE PHOSPHATASE68' —
+# so values went missing without triggering the fallback.)
+TEXT_BACKENDS = ('pdfplumber', 'stream')
+
+
+def _needs_extraction(probe):
+    """A probed page needs pdfplumber unless the probe is trusted and has no values."""
+    return probe is None or bool(parse_values(probe))
+
+
+def _header_ok(text):
+    """True if a page's text carries a complete Primex patient header."""
+    header = parse_header(text)
+    return all(k in header for k in ('last_name', 'first_name', 'dob', 'test_date'))
+
+
+def _plumb_page(page, layout):
+    """Full pdfplumber extraction of one page: text, or (text, rows) in layout mode."""
+    with _stage('extract_pages'):
+        if layout:
+            return read_page(page)
+        return page.extract_text() or ''
+
+
+def _read_page(i, page, backend, extract):
+    """One iter_pages() item for an open pdfplumber page."""
+    if backend == 'stream':
+        with _stage('fast_extract'):
+            text = probe_text(page)
+        if text is None or not _header_ok(text):
+            text = _plumb_page(page, layout=False)
+        return i, text
+    if extract.skip_pages:
+        with _stage('probe_pages'):
+            probe = probe_text(page)
+            skip = not _needs_extraction(probe)
+        if skip:
+            return (i, probe, []) if extract.layout else (i, probe)
+    if extract.layout:
+        text, rows = _plumb_page(page, layout=True)
+        return i, text, rows
+    return i, _plumb_page(page, layout=False)
+
+
+def iter_pages(pdf_path, extract=ExtractOptions()):
+    """
+    Yield (page_index, page_text) one page at a time as pdfplumber extracts it.
+    With extract.layout, yield (page_index, page_text, result_rows) instead: both
+    come from one pass over the page's word positions (see primex_layout).
+    With extract.skip_pages, pages whose content-stream probe finds no lab values
+    (trailing END OF REPORT pages, interpretive text, unsupported panels) are
+    yielded with the probe's text and never handed to pdfplumber.
+    A text-mode extract.backend of 'stream' reads each page's content stream and
+    only falls back to pdfplumber for pages whose header won't parse.
+    With extract.release_pages, each page's parsed objects are dropped before
+    its text is yielded, so memory stays flat however long the PDF is.
+    """
+    backend = 'pdfplumber' if extract.layout else extract.backend
     with pdfplumber.open(pdf_path) as pdf:
         for i, page in enumerate(pdf.pages):
-            pages.append((i, page.extract_text() or ''))
-    return pages
+            item = _read_page(i, page, backend, extract)
+            if extract.release_pages:
+                page.close()
+            yield item
 
 
-def split_into_sections(pages):
+def extract_pages(pdf_path, extract=ExtractOptions()):
+    """Return list of (page_index, page_text) for every page in the PDF."""
+    return list(iter_pages(pdf_path, extract))
+
+
+_END_OF_REPORT = re.compile(r'END\s+OF\s+REPORT', re.IGNORECASE)
+
+
+def iter_sections(pages):
     """
     Split pages into per-patient sections based on 'END OF REPORT' markers.
-    Returns list of dicts: {text, page_indices}.
+    Yields dicts: {text, pages} as soon as each marker is seen, so a section
+    only holds its own pages' text. Layout pages (page_index, text, rows) also
+    give each section its 'rows'.
     """
-    sections = []
-    current_text = ''
-    current_indices = []
-
-    for page_num, text in pages:
-        current_text += text + '\n'
-        current_indices.append(page_num)
-        if re.search(r'END\s+OF\s+REPORT', text, re.IGNORECASE):
-            sections.append({'text': current_text.strip(), 'pages': list(current_indices)})
-            current_text = ''
-            current_indices = []
+    parts = []
+    indices = []
+    rows = None
+
+    for page_num, text, *page_rows in pages:
+        with _stage('split_into_sections', items=0) as st:
+            parts.append(text)
+            indices.append(page_num)
+            if page_rows:
+                rows = rows if rows is not None else []
+                rows.extend(page_rows[0])
+            section = None
+            if _END_OF_REPORT.search(text):
+                section = _section(parts, indices, rows)
+                parts = []
+                indices = []
+                rows = None
+                st['items'] = 1
+        if section:
+            yield section
 
     # Trailing pages after last END OF REPORT (usually empty footer)
-    if current_text.strip() and current_indices:
-        sections.append({'text': current_text.strip(), 'pages': list(current_indices)})
+    if indices:
+        section = _section(parts, indices, rows)
+        if section['text']:
+            yield section
+
 
-    return sections
+def _section(parts, indices, rows):
+    section = {'text': '\n'.join(parts).strip(), 'pages': indices}
+    if rows is not None:
+        section['rows'] = rows
+    return section
+
+
+def split_into_sections(pages):
+    """
+    Split pages into per-patient sections based on 'END OF REPORT' markers.
+    Returns list of dicts: {text, page_indices}.
+    """
+    return list(iter_sections(pages))
 
 
 # ── Header & value parsing ────────────────────────────────────────────────────
 
 def parse_header(text):
-    """Extract patient name, DOB, and collection date from a report section."""
+    """Extract patient name, sex, DOB, and collection date from a report section."""
     result = {}
 
     # Patient name — "LASTNAME, FIRSTNAME  AGE  SEX"
     # Unicode curly apostrophe (U+2019) handled in last_name (e.g., O'BRIEN)
-    m = re.search(r'^([A-Z][A-Z\'\u2019\-]+,\s+[A-Z]+)\s+\d+\s+[MF]\b', text, re.MULTILINE)
+    m = re.search(r'^([A-Z][A-Z\'\u2019\-]+,\s+[A-Z]+)\s+\d+\s+([MF])\b', text, re.MULTILINE)
     if m:
         parts = m.group(1).split(',')
         result['last_name'] = parts[0].strip().title().replace('\u2019', "'")
         result['first_name'] = parts[1].strip().title().replace('\u2019', "'")
+        result['sex'] = m.group(2)
 
     # DOB — "DOB: M/D/YYYY" or "DOB: M/D/YY"
     m = re.search(r'DOB:\s*(\d{1,2}/\d{1,2}/\d{2,4})', text)
@@ -224,34 +373,267 @@ def _parse_date(date_str):
     return f"{year:04d}-{month:02d}-{day:02d}"
 
 
+def _literal_anchor(pattern):
+    """
+    Return the uppercase literal text every match of a PATTERNS regex must contain,
+    taken from the start of the pattern after a known prefix ((?m)^\\s*, \\b, %?, %\\s*).
+    Returns '' when the pattern does not start with a plain literal.
+    """
+    src = pattern
+    for prefix in ('(?m)^\\s*', '\\b', '%?', '%\\s*'):
+        if src.startswith(prefix):
+            src = src[len(prefix):]
+            break
+    anchor = []
+    i = 0
+    while i < len(src):
+        ch = src[i]
+        if ch == '\\' and i + 1 < len(src) and src[i + 1] in '.-()/%':
+            lit, step = src[i + 1], 2
+        elif ch.isalnum() or ch in " -/,%':":
+            lit, step = ch, 1
+        else:
+            break
+        if src[i + step:i + step + 1] in ('?', '*', '{'):
+            break  # optional char — not guaranteed to be in the match
+        anchor.append(lit)
+        i += step
+    return ''.join(anchor).upper()
+
+
+def _compile_patterns(patterns):
+    """Compile PATTERNS once into (regex, anchor, db_column) matchers."""
+    matchers = []
+    for pattern, col in patterns:
+        matchers.append((re.compile(pattern, re.IGNORECASE | re.MULTILINE),
+                         _literal_anchor(pattern), col))
+    return matchers
+
+
+_MATCHERS = _compile_patterns(PATTERNS)
+_ANALYTES = AnalyteMap(_MATCHERS)
+_VALUE_STRIP = re.compile(r'[<>,\s]')
+# Characters that IGNORECASE matches against ASCII letters but str.upper() leaves alone
+_CASE_UNSAFE = ('K', 'İ')  # KELVIN SIGN, LATIN CAPITAL I WITH DOT
+
+
+def _search_start(text, anchor_pos):
+    """
+    Earliest position a match containing the anchor at anchor_pos can start:
+    back over the whitespace run before the anchor, plus one char for a '%'
+    or line-start prefix.
+    """
+    j = anchor_pos
+    while j > 0 and text[j - 1].isspace():
+        j -= 1
+    return max(j - 1, 0)
+
+
 def parse_values(text):
     """
     Extract numeric lab values using regex patterns.
     Handles out-of-range prefixes (<, >) and comma-separated numbers (1,500).
+
+    Patterns are compiled once at import. Each pattern's literal anchor is located
+    with a plain substring find over the upper-cased text, and the regex only runs
+    from that point — so absent analytes cost a C-level find instead of a full
+    case-insensitive regex scan. Results are identical to searching every pattern
+    over the whole text in PATTERNS order (later patterns for the same column win).
     """
+    haystack = text.upper()
+    if len(haystack) != len(text) or any(c in text for c in _CASE_UNSAFE):
+        haystack = None  # indices would not line up — search full text
+
     values = {}
-    for pattern, col in PATTERNS:
-        m = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+    for rx, anchor, col in _MATCHERS:
+        if haystack is not None and anchor:
+            pos = haystack.find(anchor)
+            if pos < 0:
+                continue
+            m = rx.search(text, _search_start(text, pos))
+        else:
+            m = rx.search(text)
         if m:
             try:
-                raw = re.sub(r'[<>,\s]', '', m.group(1))
-                values[col] = float(raw)
+                values[col] = float(_VALUE_STRIP.sub('', m.group(1)))
             except ValueError:
                 pass
     return values
 
 
+def parse_results(rows):
+    """
+    Values from layout-extracted table rows (see primex_layout), plus what the
+    text scan throws away. Each printed analyte is mapped to its db_column by
+    dictionary lookup; only rows in the analyte column count, so comment lines
+    (e.g. "ADD ON THE FOLLOWING TEST:URIC ACID") can't shadow the real result.
+    Returns (values, results): results[db_column] = {analyte, result, flag, units, reference}.
+    """
+    values = {}
+    results = {}
+    for col, row in _ANALYTES.results(rows).items():
+        try:
+            values[col] = float(_VALUE_STRIP.sub('', row.result))
+        except ValueError:
+            continue
+        results[col] = {'analyte': row.analyte, 'result': row.result, 'flag': row.flag,
+                        'units': row.units, 'reference': row.reference}
+    return values, results
+
+
+# ── Extraction cache ──────────────────────────────────────────────────────────
+# One JSON file per PDF, keyed by the SHA-256 of its bytes. Page text only depends
+# on the file, so it survives parser changes; parsed sections are tagged with
+# PARSER_VERSION and re-parsed from the cached text when the version moves.
+
+PARSER_REVISION = 2  # bump when parse_header()/parse_values()/section logic changes
+PARSER_VERSION = hashlib.sha256(repr((PARSER_REVISION, PATTERNS)).encode()).hexdigest()[:12]
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'primex_parser'
+DEFAULT_MANIFEST = DEFAULT_CACHE_DIR / 'manifest.sqlite'
+
+
+def file_sha256(pdf_path):
+    """SHA-256 of a file's bytes (the cache and manifest key)."""
+    h = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class ExtractionCache:
+    """
+    Content-hash cache of extract_pages() output and parsed header/values.
+    stats counts 'hit' (nothing recomputed), 'reparse' (cached text, new
+    PARSER_VERSION) and 'miss' (PDF extracted from scratch).
+    variant names the extraction mode (and whether pages were probe-skipped);
+    each variant keeps its own entries.
+    """
+
+    def __init__(self, root=DEFAULT_CACHE_DIR, rebuild=False, variant='text'):
+        self.root = Path(root)
+        self.rebuild = rebuild
+        self.variant = variant
+        self.stats = Counter()
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, digest):
+        if self.variant == 'text':
+            return self.root / f"{digest}.json"
+        return self.root / f"{digest}.{self.variant}.json"
+
+    def load(self, digest):
+        """Return the cached entry for digest, or None (always None when rebuilding)."""
+        path = self._path(digest)
+        if self.rebuild or not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None  # unreadable/partial entry — treat as a miss
+
+    def store(self, digest, pages, sections):
+        entry = {
+            'pages': pages,
+            'parser_version': PARSER_VERSION,
+            'sections': sections,
+        }
+        # Write-then-rename so concurrent workers never see a partial file
+        tmp = self._path(digest).with_suffix(f'.{os.getpid()}.tmp')
+        tmp.write_text(json.dumps(entry))
+        os.replace(tmp, self._path(digest))
+
+
+def iter_parsed_sections(pages):
+    """
+    Parse each patient section of a page stream as it completes.
+    Yields dicts: {pages, header, values} for sections with a DOB line, plus
+    'results' (units, flags, reference ranges) for layout-extracted sections.
+    """
+    for section in iter_sections(pages):
+        # Filter sections that have actual patient content
+        if not (section['text'].strip() and re.search(r'DOB:', section['text'])):
+            continue
+        with _stage('parse_header'):
+            header = parse_header(section['text'])
+        with _stage('parse_values'):
+            if 'rows' in section:
+                values, results = parse_results(section['rows'])
+            else:
+                values, results = parse_values(section['text']), None
+        parsed = {'pages': section['pages'], 'header': header, 'values': values}
+        if results is not None:
+            parsed['results'] = results
+        yield parsed
+
+
+def _cached_page(page):
+    """Cached page back to iter_pages() shape (JSON turns tuples into lists)."""
+    if len(page) == 3:
+        return page[0], page[1], [ResultRow(*row) for row in page[2]]
+    return tuple(page)
+
+
+def iter_pdf_sections(pdf_path, cache=None, digest=None, extract=ExtractOptions()):
+    """
+    Yield iter_parsed_sections() output for pdf_path, served from cache when possible.
+    On a miss the cache entry is written only once the PDF has been fully consumed.
+    digest is the file's SHA-256 if the caller already has it.
+    """
+    if cache is None:
+        yield from iter_parsed_sections(iter_pages(pdf_path, extract))
+        return
+
+    digest = digest or file_sha256(pdf_path)
+    entry = cache.load(digest)
+    if entry and entry.get('parser_version') == PARSER_VERSION:
+        cache.stats['hit'] += 1
+        yield from entry['sections']
+        return
+
+    if entry:
+        cache.stats['reparse'] += 1
+        source = (_cached_page(p) for p in entry['pages'])
+    else:
+        cache.stats['miss'] += 1
+        source = iter_pages(pdf_path, extract)
+
+    pages = []
+    sections = []
+
+    def record_pages():
+        for page in source:
+            pages.append(page)
+            yield page
+
+    for section in iter_parsed_sections(record_pages()):
+        sections.append(section)
+        yield section
+    cache.store(digest, pages, sections)
+
+
 # ── PDF split & upload ────────────────────────────────────────────────────────
 
-def extract_patient_pdf(src_path, page_indices, out_path):
-    """Extract specific pages from a PDF and write to out_path."""
-    reader = PdfReader(str(src_path))
+def extract_patient_pdf(src, page_indices, out_path):
+    """
+    Extract specific pages from a PDF and write to out_path.
+    src is a path or an open PdfReader; pass the reader when splitting several
+    patients out of one combined PDF so the source is only parsed once.
+    Returns (bytes_written, seconds).
+    """
+    t0 = time.perf_counter()
+    reader = src if isinstance(src, PdfReader) else PdfReader(str(src))
     writer = PdfWriter()
     for idx in page_indices:
         if idx < len(reader.pages):
             writer.add_page(reader.pages[idx])
-    with open(out_path, 'wb') as f:
+    # Write-then-rename: an upload thread may be reading a previous copy of out_path
+    tmp_path = Path(out_path).with_suffix('.pdf.part')
+    with open(tmp_path, 'wb') as f:
         writer.write(f)
+        size = f.tell()
+    os.replace(tmp_path, out_path)
+    return size, time.perf_counter() - t0
 
 
 def get_public_url(storage_path):
@@ -261,14 +643,19 @@ def get_public_url(storage_path):
 
 # ── SQL generation ────────────────────────────────────────────────────────────
 
-def generate_sql(records):
+def iter_sql(records, counts):
     """
-    Generate SQL UPDATE + INSERT pairs for all parsed records.
+    Yield SQL UPDATE + INSERT pairs for parsed records, line by line.
     UPDATE: fills any existing row (stub or partial) for patient+provider+date.
     INSERT: creates a new row only if none exists yet.
     pdf_url is included when available.
+    Records resolved by a PatientIndex (a 'patient_id' key, see
+    _resolve_patients()) are keyed on that UUID; unresolved ones are skipped.
+    Records without the key fall back to LOWER(name) patient subqueries.
+    counts['processed'] / counts['skipped'] are updated as records are consumed,
+    so records may be a lazy stream.
     """
-    lines = [
+    yield from [
         "-- ============================================================",
         "-- Primex Lab Import",
         "-- Generated by primex_parser.py",
@@ -276,9 +663,6 @@ def generate_sql(records):
         "",
     ]
 
-    processed = 0
-    skipped = 0
-
     for rec in records:
         header = rec['header']
         vals = rec['values']
@@ -286,50 +670,69 @@ def generate_sql(records):
         pdf_url = rec.get('pdf_url')
 
         if 'last_name' not in header or 'test_date' not in header:
-            lines.append(f"-- SKIPPED (could not parse header): {fname}")
-            lines.append("")
-            skipped += 1
+            yield f"-- SKIPPED (could not parse header): {fname}"
+            yield ""
+            counts['skipped'] += 1
+            continue
+        if 'patient_id' in rec and not rec['patient_id']:
+            yield f"-- UNMATCHED ({rec['patient_match']}): {header['first_name']} {header['last_name']} | {fname}"
+            yield ""
+            counts['skipped'] += 1
             continue
 
-        # SQL-escape single quotes in names
-        first = header['first_name'].replace("'", "''")
-        last = header['last_name'].replace("'", "''")
-        test_date = header['test_date']
-
-        lines.append(f"-- {header['first_name']} {header['last_name']} | {test_date} | {len(vals)} values | {fname}")
+        with _stage('generate_sql'):
+            # SQL-escape single quotes in names
+            first = header['first_name'].replace("'", "''")
+            last = header['last_name'].replace("'", "''")
+            test_date = header['test_date']
 
-        sorted_vals = sorted(vals.items())
+            sorted_vals = sorted(vals.items())
 
-        # ── UPDATE existing row ──────────────────────────────────────────────
-        set_clauses = ', '.join(f"{col} = {val}" for col, val in sorted_vals)
-        set_clauses += ", lab_type = 'historical', status = 'completed'"
-        if pdf_url:
-            set_clauses += f", pdf_url = '{pdf_url}'"
+            # ── UPDATE existing row ──────────────────────────────────────────
+            set_clauses = ', '.join(f"{col} = {val}" for col, val in sorted_vals)
+            set_clauses += ", lab_type = 'historical', status = 'completed'"
+            if pdf_url:
+                set_clauses += f", pdf_url = '{pdf_url}'"
 
-        update_sql = f"""UPDATE labs SET {set_clauses}
-WHERE patient_id = (
+            if rec.get('patient_id'):
+                patient = f"'{rec['patient_id']}'::uuid"
+            else:
+                patient = f"""(
     SELECT id FROM patients
     WHERE LOWER(last_name) = LOWER('{last}')
       AND LOWER(first_name) = LOWER('{first}')
     LIMIT 1
-  )
+  )"""
+            update_sql = f"""UPDATE labs SET {set_clauses}
+WHERE patient_id = {patient}
   AND lab_provider = 'Primex'
   AND test_date = '{test_date}';"""
 
-        # ── INSERT if no row exists ──────────────────────────────────────────
-        cols = ['patient_id', 'lab_provider', 'lab_type', 'status', 'test_date', 'completed_date']
-        vals_sql = [
-            "p.id", "'Primex'", "'historical'", "'completed'",
-            f"'{test_date}'", f"'{test_date}'",
-        ]
-        if pdf_url:
-            cols.append('pdf_url')
-            vals_sql.append(f"'{pdf_url}'")
-        for col, val in sorted_vals:
-            cols.append(col)
-            vals_sql.append(str(val))
-
-        insert_sql = f"""INSERT INTO labs ({', '.join(cols)})
+            # ── INSERT if no row exists ──────────────────────────────────────
+            cols = ['patient_id', 'lab_provider', 'lab_type', 'status', 'test_date', 'completed_date']
+            vals_sql = [
+                "p.id", "'Primex'", "'historical'", "'completed'",
+                f"'{test_date}'", f"'{test_date}'",
+            ]
+            if pdf_url:
+                cols.append('pdf_url')
+                vals_sql.append(f"'{pdf_url}'")
+            for col, val in sorted_vals:
+                cols.append(col)
+                vals_sql.append(str(val))
+
+            if rec.get('patient_id'):
+                vals_sql[0] = patient
+                insert_sql = f"""INSERT INTO labs ({', '.join(cols)})
+SELECT {', '.join(vals_sql)}
+WHERE NOT EXISTS (
+    SELECT 1 FROM labs l
+    WHERE l.patient_id = {patient}
+      AND l.lab_provider = 'Primex'
+      AND l.test_date = '{test_date}'
+  );"""
+            else:
+                insert_sql = f"""INSERT INTO labs ({', '.join(cols)})
 SELECT {', '.join(vals_sql)}
 FROM patients p
 WHERE LOWER(p.last_name) = LOWER('{last}')
@@ -342,107 +745,804 @@ WHERE LOWER(p.last_name) = LOWER('{last}')
   )
 LIMIT 1;"""
 
-        lines.append(update_sql)
-        lines.append(insert_sql)
-        lines.append("")
+        yield f"-- {header['first_name']} {header['last_name']} | {test_date} | {len(vals)} values | {fname}"
+        yield update_sql
+        yield insert_sql
+        yield ""
+        counts['processed'] += 1
+
+    yield f"-- Summary: {counts['processed']} records generated, {counts['skipped']} skipped"
+
+
+def generate_sql(records):
+    """
+    Generate SQL UPDATE + INSERT pairs for all parsed records (see iter_sql()).
+    Returns (sql_text, processed, skipped).
+    """
+    counts = Counter()
+    sql = '\n'.join(iter_sql(records, counts))
+    return sql, counts['processed'], counts['skipped']
+
+
+def write_sql(records, out_path):
+    """
+    Stream iter_sql() output to out_path as records arrive.
+    Byte-identical to generate_sql(); returns (processed, skipped).
+    """
+    counts = Counter()
+    with open(out_path, 'w') as f:
+        for n, line in enumerate(iter_sql(records, counts)):
+            f.write(f"\n{line}" if n else line)
+    return counts['processed'], counts['skipped']
+
+
+# ── Batched (set-based) SQL ───────────────────────────────────────────────────
+# Loads every record into one temp table, resolves patients with a single join,
+# then runs one UPDATE and one anti-joined INSERT — a constant number of
+# statements regardless of batch size. Same semantics as iter_sql():
+# provided columns overwrite, missing columns are left alone.
+
+BATCH_TABLE = 'primex_import'
+
+
+def _sql_literal(val):
+    if val is None:
+        return 'NULL'
+    if isinstance(val, str):
+        return "'" + val.replace("'", "''") + "'"
+    return str(val)
+
+
+def batch_rows(records, keyed=False):
+    """
+    Collapse records into rows for the batch table.
+    Records for the same patient + date are merged in order (later values win,
+    pdf_url kept unless replaced) — what consecutive UPDATEs would have done.
+    Returns (value_columns, rows, processed, skipped); skipped holds
+    (reason, label) pairs. Each row is a tuple of (first_name, last_name,
+    test_date, pdf_url, source, *value_columns) — plus a trailing patient_id
+    when keyed (records resolved by _resolve_patients(); unresolved ones are
+    skipped).
+    """
+    merged = {}
+    processed = 0
+    skipped = []
+    for rec in records:
+        header = rec['header']
+        if 'last_name' not in header or 'test_date' not in header:
+            skipped.append(('could not parse header', rec['filename']))
+            continue
+        if keyed and not rec.get('patient_id'):
+            skipped.append((f"unmatched patient: {rec.get('patient_match')}", rec['filename']))
+            continue
+        if keyed:
+            key = (rec['patient_id'], header['test_date'])
+        else:
+            key = (header['last_name'].lower(), header['first_name'].lower(), header['test_date'])
+        row = merged.setdefault(key, {
+            'first_name': header['first_name'], 'last_name': header['last_name'],
+            'test_date': header['test_date'], 'pdf_url': None, 'sources': [], 'values': {},
+            'patient_id': rec.get('patient_id'),
+        })
+        row['values'].update(rec['values'])
+        row['pdf_url'] = rec.get('pdf_url') or row['pdf_url']
+        row['sources'].append(rec['filename'])
         processed += 1
 
-    lines.append(f"-- Summary: {processed} records generated, {skipped} skipped")
-    return '\n'.join(lines), processed, skipped
+    value_columns = sorted({col for row in merged.values() for col in row['values']})
+    rows = [
+        (row['first_name'], row['last_name'], row['test_date'], row['pdf_url'],
+         ', '.join(row['sources']), *(row['values'].get(col) for col in value_columns),
+         *([row['patient_id']] if keyed else []))
+        for row in merged.values()
+    ]
+    return value_columns, rows, processed, skipped
+
+
+def batch_columns(value_columns, keyed=False):
+    """Column names of batch_rows() tuples."""
+    return (['first_name', 'last_name', 'test_date', 'pdf_url', 'source'] + value_columns
+            + (['patient_id'] if keyed else []))
+
+
+def batch_table_sql(value_columns):
+    """CREATE TEMP TABLE statement for the batch rows (dropped at commit)."""
+    cols = [
+        'first_name TEXT NOT NULL', 'last_name TEXT NOT NULL', 'test_date DATE NOT NULL',
+        'pdf_url TEXT', 'source TEXT',
+    ] + [f'{col} NUMERIC' for col in value_columns] + ['patient_id UUID']
+    body = ',\n  '.join(cols)
+    return f"CREATE TEMP TABLE {BATCH_TABLE} (\n  {body}\n) ON COMMIT DROP;"
+
+
+def batch_merge_sql(value_columns, keyed=False):
+    """
+    Patient resolution, UPDATE and INSERT statements run against the batch table.
+    keyed: patient_id was loaded with the rows, so there is no resolution step.
+    """
+    resolve = f"""UPDATE {BATCH_TABLE} i SET patient_id = p.id
+FROM (
+    SELECT DISTINCT ON (LOWER(last_name), LOWER(first_name))
+           id, LOWER(last_name) AS last_key, LOWER(first_name) AS first_key
+    FROM patients
+    ORDER BY LOWER(last_name), LOWER(first_name), id
+  ) p
+WHERE p.last_key = LOWER(i.last_name)
+  AND p.first_key = LOWER(i.first_name);"""
+
+    set_clauses = ',\n    '.join(
+        [f"{col} = COALESCE(i.{col}, l.{col})" for col in value_columns] +
+        ["lab_type = 'historical'", "status = 'completed'",
+         "pdf_url = COALESCE(i.pdf_url, l.pdf_url)"])
+    update = f"""UPDATE labs l SET
+    {set_clauses}
+FROM {BATCH_TABLE} i
+WHERE l.patient_id = i.patient_id
+  AND l.lab_provider = 'Primex'
+  AND l.test_date = i.test_date;"""
+
+    cols = ['patient_id', 'lab_provider', 'lab_type', 'status', 'test_date',
+            'completed_date', 'pdf_url'] + value_columns
+    select = ['i.patient_id', "'Primex'", "'historical'", "'completed'", 'i.test_date',
+              'i.test_date', 'i.pdf_url'] + [f'i.{col}' for col in value_columns]
+    insert = f"""INSERT INTO labs ({', '.join(cols)})
+SELECT {', '.join(select)}
+FROM {BATCH_TABLE} i
+WHERE i.patient_id IS NOT NULL
+  AND NOT EXISTS (
+    SELECT 1 FROM labs l
+    WHERE l.patient_id = i.patient_id
+      AND l.lab_provider = 'Primex'
+      AND l.test_date = i.test_date
+  );"""
+
+    return [update, insert] if keyed else [resolve, update, insert]
+
+
+def generate_batch_sql(records, keyed=False):
+    """
+    Generate set-based SQL for all parsed records: one temp table, one VALUES
+    list, one patient join, one UPDATE, one INSERT — inside a transaction.
+    keyed: records carry resolved patient UUIDs (no patient join).
+    Returns (sql_text, processed, skipped).
+    """
+    value_columns, rows, processed, skipped = batch_rows(records, keyed)
+    lines = [
+        "-- ============================================================",
+        "-- Primex Lab Import (batch)",
+        "-- Generated by primex_parser.py --sql-mode batch",
+        "-- ============================================================",
+        "",
+    ]
+    for reason, fname in skipped:
+        lines.append(f"-- SKIPPED ({reason}): {fname}")
+    if skipped:
+        lines.append("")
+
+    if rows:
+        col_names = batch_columns(value_columns, keyed)
+        values = ',\n'.join(
+            '  (' + ', '.join(_sql_literal(v) for v in row) + ')' for row in rows)
+        lines += [
+            "BEGIN;",
+            "",
+            batch_table_sql(value_columns),
+            "",
+            f"INSERT INTO {BATCH_TABLE} ({', '.join(col_names)}) VALUES",
+            values + ";",
+            "",
+            *('\n'.join([stmt, '']) for stmt in batch_merge_sql(value_columns, keyed)),
+            "COMMIT;",
+            "",
+        ]
+
+    lines.append(f"-- Summary: {processed} records generated ({len(rows)} patient/date rows), "
+                 f"{len(skipped)} skipped")
+    return '\n'.join(lines), processed, len(skipped)
+
+
+# ── Direct database load ──────────────────────────────────────────────────────
+
+def _import_psycopg2():
+    try:
+        import psycopg2
+    except ImportError:
+        os.system("pip install psycopg2-binary --break-system-packages -q")
+        import psycopg2
+    return psycopg2
+
+
+def load_records(records, database_url, keyed=False):
+    """
+    Load records straight into Postgres: COPY into the batch temp table, then
+    the same patient join / UPDATE / INSERT as generate_batch_sql(), all in one
+    transaction (rolled back on any error).
+    Returns a dict of row counts.
+    """
+    value_columns, rows, processed, skipped = batch_rows(records, keyed)
+    counts = {'records': processed, 'skipped': len(skipped), 'staged': 0,
+              'matched': 0, 'updated': 0, 'inserted': 0}
+    if not rows:
+        return counts
+
+    buf = io.StringIO()
+    csv.writer(buf).writerows(rows)  # None → empty field → NULL under FORMAT csv
+    buf.seek(0)
+    col_names = batch_columns(value_columns, keyed)
+
+    psycopg2 = _import_psycopg2()
+    conn = psycopg2.connect(database_url)
+    try:
+        with conn, conn.cursor() as cur:
+            cur.execute(batch_table_sql(value_columns))
+            cur.copy_expert(
+                f"COPY {BATCH_TABLE} ({', '.join(col_names)}) FROM STDIN WITH (FORMAT csv)", buf)
+            counts['staged'] = cur.rowcount
+            *resolve, update, insert = batch_merge_sql(value_columns, keyed)
+            if resolve:
+                cur.execute(resolve[0])
+            counts['matched'] = cur.rowcount if resolve else len(rows)
+            cur.execute(update)
+            counts['updated'] = cur.rowcount
+            cur.execute(insert)
+            counts['inserted'] = cur.rowcount
+    finally:
+        conn.close()
+    return counts
 
 
 # ── Main ──────────────────────────────────────────────────────────────────────
 
-def process_pdf(pdf_path, tmp_dir):
+def process_pdf(pdf_path, tmp_dir, cache=None, on_split=None, manifest=None,
+                extract=ExtractOptions()):
     """
     Parse a PDF (single or combined), extract per-patient sub-PDFs,
     upload them, and return a list of record dicts for generate_sql().
+    Sections are handled as they are extracted: patient 1 is split and
+    parsed while later pages of a combined PDF are still being read.
+    on_split(local_path, storage_path) is called as each sub-PDF is written
+    (e.g. StorageUploader.submit). With a manifest, sections already imported
+    are returned flagged 'unchanged' and are not split. extract selects how
+    page text and values are read (see ExtractOptions).
     """
     print(f"Parsing: {pdf_path.name}")
-    pages = extract_pages(pdf_path)
-    sections = split_into_sections(pages)
+    digest = file_sha256(pdf_path) if (cache or manifest) else None
+    sections = iter_pdf_sections(pdf_path, cache, digest, extract)
 
-    # Filter sections that have actual patient content
-    valid_sections = [s for s in sections if s['text'].strip() and
-                      re.search(r'DOB:', s['text'])]
+    # One section of lookahead tells us whether this is a combined PDF,
+    # which decides the record label before the first section is handled.
+    records = []
+    combined = False
+    section = next(sections, None)
+    # pypdf reader shared by every split from this file (parsed once, not per patient)
+    reader = PdfReader(str(pdf_path)) if section is not None else None
+    while section is not None:
+        following = next(sections, None)
+        combined = combined or following is not None
+        rec = process_section(pdf_path, reader, tmp_dir, section, len(records), combined,
+                              digest, manifest)
+        if on_split and rec['pdf_file']:
+            on_split(rec['pdf_file'], rec['storage_path'])
+        records.append(rec)
+        section = following
+
+    if combined:
+        print(f"  → {len(records)} patient reports in combined PDF")
 
-    if len(valid_sections) > 1:
-        print(f"  → {len(valid_sections)} patient reports in combined PDF")
+    return records
 
-    records = []
-    for i, section in enumerate(valid_sections):
-        header = parse_header(section['text'])
-        values = parse_values(section['text'])
-
-        label = f"{pdf_path.name}[{i+1}]" if len(valid_sections) > 1 else pdf_path.name
-        name = f"{header.get('first_name', '?')} {header.get('last_name', '?')}"
-        date = header.get('test_date', '?')
-
-        # Extract individual patient PDF and save to tmp_dir for later upload
-        pdf_url = None
-        if header.get('last_name') and header.get('test_date'):
-            safe_last = re.sub(r"[^a-zA-Z0-9]", "_", header['last_name'])
-            safe_first = re.sub(r"[^a-zA-Z0-9]", "_", header.get('first_name', 'unknown'))
-            pdf_filename = f"{safe_last}_{safe_first}_{header['test_date']}.pdf"
-            storage_path = f"{STORAGE_PREFIX}/{pdf_filename}"
-            out_pdf = tmp_dir / pdf_filename
-
-            extract_patient_pdf(pdf_path, section['pages'], out_pdf)
-            pdf_url = get_public_url(storage_path)
-            print(f"  → {name} | {date} | {len(values)} values | PDF saved: {pdf_filename}")
-        else:
-            print(f"  → {name} | {date} | {len(values)} values | {label}")
 
-        records.append({
-            'filename': label,
-            'header': header,
-            'values': values,
-            'pdf_url': pdf_url,
-        })
+def process_section(pdf_path, reader, tmp_dir, section, i, combined, digest=None, manifest=None):
+    """Split out one patient's sub-PDF (from the open reader) and return its record dict."""
+    header = section['header']
+    values = section['values']
+
+    label = f"{pdf_path.name}[{i+1}]" if combined else pdf_path.name
+    name = f"{header.get('first_name', '?')} {header.get('last_name', '?')}"
+    date = header.get('test_date', '?')
+    vhash = values_hash(header, values)
+    provenance = {'source_hash': digest, 'section_index': i, 'values_hash': vhash}
+
+    if manifest is not None and manifest.is_imported(digest, i, header, vhash):
+        print(f"  → {name} | {date} | {len(values)} values | unchanged since last import")
+        return {'filename': label, 'header': header, 'values': values, 'pdf_url': None,
+                'pdf_file': None, 'storage_path': None, 'unchanged': True, **provenance}
+
+    # Extract individual patient PDF and save to tmp_dir for upload
+    pdf_url = None
+    out_pdf = storage_path = None
+    if header.get('last_name') and header.get('test_date'):
+        safe_last = re.sub(r"[^a-zA-Z0-9]", "_", header['last_name'])
+        safe_first = re.sub(r"[^a-zA-Z0-9]", "_", header.get('first_name', 'unknown'))
+        pdf_filename = f"{safe_last}_{safe_first}_{header['test_date']}.pdf"
+        storage_path = f"{STORAGE_PREFIX}/{pdf_filename}"
+        out_pdf = tmp_dir / pdf_filename
+
+        with _stage('extract_patient_pdf'):
+            size, elapsed = extract_patient_pdf(reader, section['pages'], out_pdf)
+        pdf_url = get_public_url(storage_path)
+        print(f"  → {name} | {date} | {len(values)} values | PDF saved: {pdf_filename} "
+              f"({size / 1024:.0f} KB, {elapsed * 1000:.0f} ms)")
+    else:
+        print(f"  → {name} | {date} | {len(values)} values | {label}")
+
+    rec = {
+        'filename': label,
+        'header': header,
+        'values': values,
+        'pdf_url': pdf_url,
+        'pdf_file': out_pdf,
+        'storage_path': storage_path,
+        **provenance,
+    }
+    if 'results' in section:
+        rec['results'] = section['results']
+    return rec
+
+
+def _process_pdf_safe(pdf_path, tmp_dir, cache=None, capture=False, on_split=None, manifest=None,
+                      profile=False, extract=ExtractOptions(), max_rss=None):
+    """
+    Run process_pdf() with per-file failure isolation.
+    A failing PDF yields a single empty record (reported as SKIPPED in the SQL).
+    With capture=True, everything the file prints is returned instead of written,
+    so pool workers' logs can be replayed in file order.
+    Returns (records, log_text, cache_stats, stage_stats) — both stats cover this
+    file only, since pool workers each hold their own cache copy and profiler.
+    With max_rss (MB), warns when this file takes the process's peak RSS over it.
+    """
+    global _PROFILER
+    before = Counter(cache.stats) if cache else Counter()
+    rss_before = peak_rss_mb()
+    outer, _PROFILER = _PROFILER, (StageProfiler() if profile else None)
+    buf = io.StringIO()
+    with contextlib.ExitStack() as stack:
+        if capture:
+            stack.enter_context(contextlib.redirect_stdout(buf))
+            stack.enter_context(contextlib.redirect_stderr(buf))
+        try:
+            recs = process_pdf(pdf_path, tmp_dir, cache, on_split, manifest, extract)
+        except Exception as e:
+            print(f"  ERROR: {e}")
+            traceback.print_exc()
+            recs = [{'filename': pdf_path.name, 'header': {}, 'values': {}, 'pdf_url': None}]
+        finally:
+            profiler, _PROFILER = _PROFILER, outer
+        rss = peak_rss_mb()
+        if max_rss and rss > max_rss >= rss_before:
+            print(f"  ⚠ peak RSS {rss:.0f} MB exceeds --max-rss {max_rss:g} MB "
+                  f"(while parsing {pdf_path.name})")
+    stats = (Counter(cache.stats) - before) if cache else Counter()
+    return recs, buf.getvalue(), stats, profiler.snapshot() if profiler else {}
+
+
+def iter_records(pdf_files, tmp_dir, workers=1, cache=None, cache_stats=None, uploader=None,
+                 manifest=None, profiler=None, extract=ExtractOptions(), max_rss=None):
+    """
+    Process PDFs serially (workers=1) or across a process pool, yielding records.
+    Records always come out in pdf_files order, so the generated SQL is
+    byte-identical regardless of the worker count. Per-file cache stats are
+    added to cache_stats (a Counter) as each file completes.
+    With an uploader, serial runs queue each sub-PDF as soon as it is split;
+    pool runs queue a file's sub-PDFs when its worker returns.
+    With a profiler, each file's stage timings are merge()d into it.
+    max_rss (MB) is checked in whichever process parses each file.
+    """
+    profile = profiler is not None
+    if cache_stats is None:
+        cache_stats = Counter()
+    process = functools.partial(_process_pdf_safe, tmp_dir=tmp_dir, cache=cache,
+                                manifest=manifest, profile=profile, extract=extract,
+                                max_rss=max_rss)
+    if workers <= 1:
+        on_split = uploader.submit if uploader else None
+        for pdf_path in pdf_files:
+            recs, _, stats, stages = process(pdf_path, on_split=on_split)
+            cache_stats.update(stats)
+            if profile:
+                profiler.merge(stages)
+            yield from recs
+        return
 
-    return records
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(functools.partial(process, capture=True), pdf_files)
+        for recs, log, stats, stages in results:
+            sys.stdout.write(log)
+            cache_stats.update(stats)
+            if profile:
+                profiler.merge(stages)
+            if uploader:
+                for rec in recs:
+                    if rec.get('pdf_file'):
+                        uploader.submit(rec['pdf_file'], rec['storage_path'])
+            yield from recs
+
+
+def _collect(records, out):
+    """Pass records through, keeping a reference to each in out."""
+    for rec in records:
+        out.append(rec)
+        yield rec
+
+
+def _resolve_patients(records, index):
+    """Set each parsed record's patient_id (None if unresolved) and patient_match from index."""
+    for rec in records:
+        if 'last_name' in rec['header'] and 'test_date' in rec['header']:
+            with _stage('match_patients'):
+                rec['patient_id'], rec['patient_match'] = index.resolve(rec['header'])
+        yield rec
+
+
+def _write_records_sql(records, out_path, sql_mode, keyed=False):
+    """Write SQL for records to out_path ('rows' streams as records arrive); returns (inserted, skipped)."""
+    if sql_mode == 'batch':
+        records = list(records)
+        with _stage('generate_sql', items=len(records)):
+            sql, inserted, skipped = generate_batch_sql(records, keyed)
+        out_path.write_text(sql)
+        return inserted, skipped
+    # SQL is written as records stream in, not after the whole folder is parsed
+    return write_sql(records, out_path)
+
+
+def _imported(emitted, uploader=None, keyed=False):
+    """Emitted records the manifest may mark imported: parsed, matched (if keyed), uploaded (if uploading)."""
+    failed_uploads = {path for path, _ in uploader.errors} if uploader else set()
+    return [r for r in emitted if r.get('source_hash')
+            and 'last_name' in r['header'] and 'test_date' in r['header']
+            and (not keyed or r.get('patient_id'))
+            and r.get('storage_path') not in failed_uploads]
+
+
+def _only_new(records, emitted, unchanged):
+    """Drop records flagged unchanged by the manifest; collect the rest in emitted."""
+    for rec in records:
+        if rec.get('unchanged'):
+            unchanged['sections'] += 1
+            continue
+        emitted.append(rec)
+        yield rec
 
 
-def main():
-    folder = Path(sys.argv[1]) if len(sys.argv) > 1 else Path('/sessions/dazzling-happy-hopper/mnt/uploads')
+def watch_inbox(args, tmp_dir, extract, cache=None, manifest=None, patients=None):
+    """
+    --watch: import PDFs from args.folder as they finish arriving (see
+    primex_watch), until SIGINT/SIGTERM — or, with --once, until the inbox is
+    empty. Each batch of settled PDFs runs the full pipeline across
+    args.workers processes and gets its own SQL file next to --sql-out
+    (<stem>-YYYYmmdd-HHMMSS-N.sql); handled PDFs move to processed/, or to
+    failed/ if nothing could be parsed from them.
+    """
+    watcher = InboxWatcher(args.folder, settle=args.settle, poll=args.poll)
+    stopping = []
+    previous = {sig: signal.signal(sig, lambda signum, frame: stopping.append(signum))
+                for sig in (signal.SIGINT, signal.SIGTERM)}
+    keyed = patients is not None
+    print(f"Watching {args.folder} ({watcher.mode}, settle {args.settle:g}s) — Ctrl-C to stop")
+    n = 0
+    try:
+        batches = watcher.batches(stop=lambda: bool(stopping), until_empty=args.once)
+        for n, batch in enumerate(batches, 1):
+            started = time.perf_counter()
+            out_path = args.sql_out.with_name(
+                f"{args.sql_out.stem}-{time.strftime('%Y%m%d-%H%M%S')}-{n}{args.sql_out.suffix}")
+            uploader = None
+            if args.upload:
+                uploader = StorageUploader(SUPABASE_URL, SUPABASE_KEY, STORAGE_BUCKET,
+                                           max_workers=args.upload_workers)
+            parsed, emitted, unchanged = [], [], Counter()
+            try:
+                records = _collect(iter_records(batch, tmp_dir, args.workers, cache, uploader=uploader,
+                                                manifest=manifest, extract=extract,
+                                                max_rss=args.max_rss), parsed)
+                if patients:
+                    records = _resolve_patients(records, patients)
+                if manifest:
+                    records = _only_new(records, emitted, unchanged)
+                if args.load:
+                    records = list(records)
+                inserted, skipped = _write_records_sql(records, out_path, args.sql_mode, keyed)
+                if uploader:
+                    uploader.close()
+                    for path, err in uploader.errors:
+                        print(f"  upload failed: {path} — {err}")
+                if args.load:
+                    counts = load_records(records, args.database_url, keyed)
+                    print(f"  loaded: {counts['matched']} matched, {counts['updated']} updated, "
+                          f"{counts['inserted']} inserted")
+                if manifest:
+                    manifest.record(_imported(emitted, uploader, keyed))
+            except Exception as e:
+                print(f"  ERROR: batch failed: {e}")
+                traceback.print_exc()
+                parsed = []  # archive the whole batch as failed rather than retrying it forever
+                inserted = skipped = 0
+            for pdf_path in batch:
+                ok = any(r['header'] for r in parsed
+                         if r['filename'] == pdf_path.name or r['filename'].startswith(pdf_path.name + '['))
+                archive(pdf_path, args.folder / ('processed' if ok else 'failed'))
+            note = f", {unchanged['sections']} unchanged" if manifest else ''
+            print(f"Batch {n}: {len(batch)} PDF(s), {inserted} records, {skipped} skipped{note} "
+                  f"→ {out_path} ({time.perf_counter() - started:.1f}s)")
+            sys.stdout.flush()
+        if stopping:
+            print(f"Stopped ({signal.Signals(stopping[0]).name}) after {n} batch(es)")
+    finally:
+        watcher.close()
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description='Parse Primex lab PDFs into SQL for import.')
+    ap.add_argument('folder', nargs='?', type=Path,
+                    default=Path('/sessions/dazzling-happy-hopper/mnt/uploads'),
+                    help='folder of Primex PDFs (default: uploads folder)')
+    ap.add_argument('--workers', type=int, default=1, metavar='N',
+                    help='parse PDFs across N processes (0 = one per CPU; default 1)')
+    ap.add_argument('--pdf-dir', type=Path,
+                    default=Path('/sessions/dazzling-happy-hopper/mnt/Claude CUPP 2nd brain/Range Medical CRM/rangemedical-system-2/primex-pdfs'),
+                    help='where split per-patient PDFs are written')
+    ap.add_argument('--sql-out', type=Path, default=Path('/tmp/primex_import.sql'),
+                    help='where the generated SQL is written')
+    ap.add_argument('--upload', action='store_true',
+                    help='upload split PDFs to Supabase Storage as they are written')
+    ap.add_argument('--upload-workers', type=int, default=4, metavar='N',
+                    help='concurrent uploads (default 4)')
+    ap.add_argument('--incremental', action='store_true',
+                    help='only emit SQL/uploads for sections not already in the import manifest')
+    ap.add_argument('--manifest', type=Path, default=DEFAULT_MANIFEST,
+                    help=f'import manifest for --incremental (default: {DEFAULT_MANIFEST})')
+    ap.add_argument('--watch', action='store_true',
+                    help='daemon mode: treat folder as an inbox and import each PDF once it has '
+                         'finished arriving (SQL per batch; PDFs move to processed/ or failed/)')
+    ap.add_argument('--settle', type=float, default=5.0, metavar='SECONDS',
+                    help='with --watch, how long a PDF must stay unchanged before import (default 5)')
+    ap.add_argument('--poll', type=float, default=2.0, metavar='SECONDS',
+                    help='with --watch, rescan interval when inotify is unavailable (default 2)')
+    ap.add_argument('--once', action='store_true',
+                    help='with --watch, exit once the inbox is empty instead of waiting')
+    ap.add_argument('--sql-mode', choices=['rows', 'batch'], default='rows',
+                    help='rows: UPDATE+INSERT per record (default, easiest to debug); '
+                         'batch: one temp table + set-based UPDATE/INSERT')
+    ap.add_argument('--load', action='store_true',
+                    help='also load the records into Postgres (COPY + merge, one transaction)')
+    ap.add_argument('--database-url',
+                    default=os.environ.get('DATABASE_URL') or _ENV.get('DATABASE_URL', ''),
+                    help='Postgres connection string for --load (default: $DATABASE_URL)')
+    ap.add_argument('--extract-mode', choices=['text', 'layout'], default='text',
+                    help='text: regex over extracted page text (default); '
+                         'layout: rebuild the results table from word positions')
+    ap.add_argument('--backend', choices=TEXT_BACKENDS, default='pdfplumber',
+                    help='page text extractor for --extract-mode text (default pdfplumber); '
+                         'stream falls back to pdfplumber for pages whose header fails to parse')
+    ap.add_argument('--no-page-skip', action='store_true',
+                    help='run pdfplumber on every page instead of skipping pages '
+                         'whose content-stream probe finds no lab values')
+    ap.add_argument('--keep-page-cache', action='store_true',
+                    help='keep every pdfplumber page\'s parsed layout until its PDF is done '
+                         '(default: free each page once its text is read)')
+    ap.add_argument('--max-rss', type=float, metavar='MB',
+                    help='warn as soon as a PDF takes peak memory over MB, report peak RSS at '
+                         'the end, and exit 1 if it was exceeded')
+    ap.add_argument('--results-json', type=Path, metavar='PATH',
+                    help='with --extract-mode layout, write each record\'s units, '
+                         'flags and reference ranges to PATH')
+    roster = ap.add_mutually_exclusive_group()
+    roster.add_argument('--match-patients', action='store_true',
+                        help='fetch the patients roster from Supabase once and key the SQL on '
+                             'resolved patient UUIDs (unmatched/ambiguous reports are skipped)')
+    roster.add_argument('--patients-file', type=Path, metavar='PATH',
+                        help='like --match-patients, from a local roster export (JSON or CSV '
+                             'with id, first_name, last_name, name, date_of_birth)')
+    ap.add_argument('--export', type=Path, metavar='PATH',
+                    help='also write every parsed record to a columnar file, one column per '
+                         'db_column (.parquet / .arrow need pyarrow; otherwise CSV)')
+    ap.add_argument('--flags-json', type=Path, metavar='PATH',
+                    help='write low/high/borderline/optimal flags, deltas vs. the previous '
+                         'result and z-scores for every record to PATH (needs --ranges)')
+    ap.add_argument('--ranges', type=Path, metavar='PATH',
+                    help='lab_reference_ranges rows as JSON (a list of rows, or the '
+                         '/api/labs/reference-ranges response)')
+    ap.add_argument('--flags-history', type=Path, metavar='PATH',
+                    help='earlier --export file whose results count as previous values')
+    ap.add_argument('--profile', action='store_true',
+                    help='time each pipeline stage; print a summary and write a JSON report')
+    ap.add_argument('--profile-json', type=Path, default=Path('/tmp/primex_profile.json'),
+                    help='where --profile writes its JSON report')
+    ap.add_argument('--cprofile', type=Path, metavar='PATH',
+                    help='also write a cProfile dump of the main process to PATH')
+    ap.add_argument('--cache-dir', type=Path, default=DEFAULT_CACHE_DIR,
+                    help=f'extraction cache location (default: {DEFAULT_CACHE_DIR})')
+    cache_mode = ap.add_mutually_exclusive_group()
+    cache_mode.add_argument('--no-cache', action='store_true',
+                            help='extract every PDF; do not read or write the cache')
+    cache_mode.add_argument('--rebuild-cache', action='store_true',
+                            help='ignore cached entries and re-extract (cache is refreshed)')
+    args = ap.parse_args(argv)
+    if args.upload and not (SUPABASE_URL and SUPABASE_KEY):
+        ap.error('--upload needs NEXT_PUBLIC_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY')
+    if args.match_patients and not (SUPABASE_URL and SUPABASE_KEY):
+        ap.error('--match-patients needs NEXT_PUBLIC_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY')
+    if args.load and not args.database_url:
+        ap.error('--load needs --database-url or DATABASE_URL')
+    if args.extract_mode == 'layout' and args.backend != 'pdfplumber':
+        ap.error('--extract-mode layout reads word positions with pdfplumber; drop --backend')
+    if args.results_json and args.extract_mode != 'layout':
+        ap.error('--results-json needs --extract-mode layout')
+    if args.flags_json and not args.ranges:
+        ap.error('--flags-json needs --ranges')
+    if args.flags_history and not args.flags_json:
+        ap.error('--flags-history needs --flags-json')
+    if args.watch and (args.profile or args.cprofile or args.results_json or args.export
+                       or args.flags_json):
+        ap.error('--watch writes one SQL file per batch; drop --profile/--cprofile/'
+                 '--results-json/--export/--flags-json')
+    if args.once and not args.watch:
+        ap.error('--once needs --watch')
+    if args.workers == 0:
+        args.workers = os.cpu_count() or 1
+    return args
+
+
+def main(argv=None):
+    global _PROFILER
+    args = parse_args(argv)
+    folder = args.folder
     pdf_files = sorted(folder.glob('*.pdf'))
 
-    if not pdf_files:
+    if not pdf_files and not args.watch:
         print(f"No PDFs found in {folder}")
         return
 
-    print(f"Found {len(pdf_files)} PDF(s) in {folder}")
-    if SUPABASE_URL and SUPABASE_KEY:
-        print(f"Supabase Storage: {STORAGE_BUCKET}/{STORAGE_PREFIX}/")
-    else:
+    if not args.watch:
+        print(f"Found {len(pdf_files)} PDF(s) in {folder}")
+    if args.upload:
+        print(f"Supabase Storage: {STORAGE_BUCKET}/{STORAGE_PREFIX}/ ({args.upload_workers} uploaders)")
+    elif not (SUPABASE_URL and SUPABASE_KEY):
         print("⚠ No Supabase credentials — PDF upload disabled")
+    if args.workers > 1:
+        print(f"Workers: {args.workers}")
     print()
 
     # Save split PDFs to workspace folder so the uploader script can find them
-    workspace = Path('/sessions/dazzling-happy-hopper/mnt/Claude CUPP 2nd brain/Range Medical CRM/rangemedical-system-2/primex-pdfs')
-    tmp_dir = workspace
+    tmp_dir = args.pdf_dir
     tmp_dir.mkdir(exist_ok=True)
 
-    all_records = []
-    for pdf_path in pdf_files:
-        try:
-            recs = process_pdf(pdf_path, tmp_dir)
-            all_records.extend(recs)
-        except Exception as e:
-            print(f"  ERROR: {e}")
-            import traceback
-            traceback.print_exc()
-            all_records.append({'filename': pdf_path.name, 'header': {}, 'values': {}, 'pdf_url': None})
+    run_start = time.perf_counter()
+    profiler = _PROFILER = StageProfiler() if args.profile else None
+    cprof = None
+    if args.cprofile:
+        cprof = cProfile.Profile()
+        cprof.enable()
+
+    extract = ExtractOptions(layout=args.extract_mode == 'layout',
+                             skip_pages=not args.no_page_skip, backend=args.backend,
+                             release_pages=not args.keep_page_cache)
+    variant = args.extract_mode if args.backend == 'pdfplumber' else args.backend
+    if not extract.skip_pages and args.backend == 'pdfplumber':
+        variant += '-noskip'  # skipped pages hold probe text, not pdfplumber's
+    cache = None if args.no_cache else ExtractionCache(args.cache_dir, rebuild=args.rebuild_cache,
+                                                       variant=variant)
+    cache_stats = Counter()
+    uploader = None
+    if args.upload and not args.watch:  # --watch opens one per batch
+        uploader = StorageUploader(SUPABASE_URL, SUPABASE_KEY, STORAGE_BUCKET,
+                                   max_workers=args.upload_workers)
+    manifest = None
+    if args.incremental:
+        args.manifest.parent.mkdir(parents=True, exist_ok=True)
+        manifest = ImportManifest(args.manifest)
+    patients = None
+    if args.match_patients or args.patients_file:
+        rows = load_roster(args.patients_file) if args.patients_file else \
+            fetch_roster(SUPABASE_URL, SUPABASE_KEY)
+        patients = PatientIndex(rows)
+        print(f"Patients:       {len(patients)} in roster "
+              f"({args.patients_file or 'Supabase'})")
+    keyed = patients is not None
+    if args.watch:
+        watch_inbox(args, tmp_dir, extract, cache, manifest, patients)
+        if manifest:
+            manifest.close()
+        return
+    records = iter_records(pdf_files, tmp_dir, args.workers, cache, cache_stats, uploader,
+                           manifest, profiler, extract, args.max_rss)
+    if patients:
+        records = _resolve_patients(records, patients)
+    emitted = []
+    unchanged = Counter()
+    if manifest:
+        records = _only_new(records, emitted, unchanged)
+    written = []
+    if args.results_json or args.export or args.flags_json:
+        records = _collect(records, written)
+    if args.load:
+        records = list(records)  # consumed twice: SQL file + database load
+
+    out_path = args.sql_out
+    inserted, skipped = _write_records_sql(records, out_path, args.sql_mode, keyed)
 
     print()
-    out_path = Path('/tmp/primex_import.sql')
-    sql, inserted, skipped = generate_sql(all_records)
-    out_path.write_text(sql)
-
     print(f"SQL written to: {out_path}")
     print(f"Records ready:  {inserted}")
     print(f"Skipped:        {skipped}")
+    if patients:
+        stats = patients.stats
+        print(f"Patient match:  {sum(stats[s] for s in MATCHED)} matched "
+              f"({stats['exact']} exact, {stats['alias']} alias, {stats['dob']} by DOB), "
+              f"{stats['unmatched']} unmatched, {stats['ambiguous']} ambiguous, "
+              f"{stats['dob_mismatch']} DOB mismatch")
+    if uploader:
+        stats = uploader.close()
+        print(f"Uploads:        {stats['uploaded']} uploaded, {stats['skipped']} unchanged, "
+              f"{stats['failed']} failed")
+        for path, err in uploader.errors:
+            print(f"  upload failed: {path} — {err}")
+    if args.load:
+        counts = load_records(records, args.database_url, keyed)
+        print(f"Loaded:         {counts['staged']} staged, {counts['matched']} matched to patients, "
+              f"{counts['updated']} updated, {counts['inserted']} inserted")
+    if manifest:
+        imported = _imported(emitted, uploader, keyed)
+        manifest.record(imported)
+        manifest.close()
+        print(f"Incremental:    {len(imported)} new/changed recorded, "
+              f"{unchanged['sections']} unchanged skipped ({args.manifest})")
+    if args.results_json:
+        args.results_json.write_text(json.dumps([
+            {'filename': r['filename'], **r['header'], 'results': r.get('results', {})}
+            for r in written if 'test_date' in r['header']
+        ], indent=2))
+        print(f"Results JSON:   {args.results_json}")
+    if args.export:
+        with _stage('export', items=len(written)):
+            path, fmt = export_records(written, args.export, VALUE_COLUMNS)
+        note = '' if path == args.export else ' (pyarrow not installed)'
+        print(f"Export:         {len(written)} records → {path} [{fmt}]{note}")
+    if args.flags_json:
+        from primex_flags import FLAG_NAMES, flag_records, load_ranges
+        history = read_export(args.flags_history) if args.flags_history else []
+        with _stage('flag_values', items=len(written)):
+            flagged = flag_records(written, load_ranges(args.ranges), VALUE_COLUMNS, history)
+        args.flags_json.write_text(json.dumps([
+            {'filename': r['filename'], **r['header'], 'flags': flags} for r, flags in flagged
+        ], indent=2))
+        totals = Counter(f['flag'] for _, flags in flagged for f in flags.values())
+        summary = ', '.join(f"{totals[name]} {name}" for name in FLAG_NAMES if totals[name])
+        print(f"Flags JSON:     {args.flags_json} ({len(flagged)} records: {summary or 'no values'})")
+    if cache:
+        print(f"Cache:          {cache_stats['hit']} hit, {cache_stats['reparse']} re-parsed, "
+              f"{cache_stats['miss']} extracted ({cache.root})")
+    over_rss = False
+    if args.max_rss:
+        peak = max(peak_rss_mb(), peak_rss_mb(resource.RUSAGE_CHILDREN))
+        over_rss = peak > args.max_rss
+        workers = f" (largest worker {peak_rss_mb(resource.RUSAGE_CHILDREN):.0f} MB)" \
+            if args.workers > 1 else ''
+        print(f"Peak RSS:       {peak_rss_mb():.0f} MB{workers}, limit {args.max_rss:g} MB"
+              + (" — EXCEEDED" if over_rss else ''))
+
+    total_wall = time.perf_counter() - run_start
+    if cprof:
+        cprof.disable()
+        cprof.dump_stats(str(args.cprofile))
+        note = ' (main process only)' if args.workers > 1 else ''
+        print(f"cProfile dump:  {args.cprofile}{note}")
+    if profiler:
+        _PROFILER = None
+        print()
+        print(profiler.table(total_wall))
+        if args.workers > 1:
+            print(f"(stage wall times are summed across {args.workers} workers)")
+        report = profiler.to_json(total_wall, files=len(pdf_files), workers=args.workers,
+                                  sql_mode=args.sql_mode, cache=cache is not None,
+                                  extract_mode=args.extract_mode, backend=args.backend)
+        args.profile_json.write_text(json.dumps(report, indent=2))
+        print(f"Profile JSON:   {args.profile_json}")
+    return 1 if over_rss else 0
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""
+Primex Patient Matching — Range Medical CRM
+Resolves parsed Primex headers to patients.id before any SQL is generated.
+
+The patients roster is read once (Supabase REST or a local JSON/CSV export)
+into an in-memory index keyed on normalized names:
+
+    last name   casefolded, accents stripped, apostrophes / hyphens / spaces
+                removed (O'Brien = OBrien = O-Brien)
+    first name  first token only (drops middle initials and suffixes)
+
+Aliases (nicknames, a parenthetical in the roster first name like
+"Richard (rick)", each part of a hyphenated last name, NAME_OVERRIDES) are
+only consulted when the exact key has no candidates. The DOB parse_header()
+extracts breaks ties, and a single candidate whose DOB contradicts the
+report is rejected rather than matched.
+
+Used by primex_parser.py --match-patients / --patients-file, so the generated
+SQL is keyed on patient UUIDs instead of LOWER(name) subqueries.
+"""
+
+import csv, json, re, unicodedata, urllib.parse, urllib.request
+from collections import Counter, defaultdict, namedtuple
+
+ROSTER_FIELDS = 'id,first_name,last_name,name,date_of_birth'
+PAGE_SIZE = 1000
+
+# Same table as scripts/upload-primex-pdfs.js
+NICKNAMES = {
+    'mike': ['michael'], 'michael': ['mike'],
+    'kate': ['katherine', 'kathryn', 'kathy'], 'katherine': ['kate', 'kathy'], 'kathryn': ['kate'],
+    'dan': ['daniel', 'danny'], 'daniel': ['dan', 'danny'], 'danny': ['dan', 'daniel'],
+    'matt': ['matthew', 'mathew'], 'matthew': ['matt', 'mathew'], 'mathew': ['matt', 'matthew'],
+    'phil': ['phillip', 'philip'], 'phillip': ['phil', 'philip'], 'philip': ['phil', 'phillip'],
+    'rick': ['richard'], 'richard': ['rick', 'dick'],
+    'tony': ['anthony'], 'anthony': ['tony'],
+    'bill': ['william'], 'william': ['bill', 'will'],
+    'bob': ['robert'], 'robert': ['bob', 'rob'],
+    'jim': ['james'], 'james': ['jim', 'jimmy'],
+    'chris': ['christopher'], 'christopher': ['chris'],
+    'steve': ['steven', 'stephen'], 'steven': ['steve'], 'stephen': ['steve'],
+    'nick': ['nicholas'], 'nicholas': ['nick'],
+    'joe': ['joseph'], 'joseph': ['joe'],
+    'tom': ['thomas'], 'thomas': ['tom'],
+    'jen': ['jennifer'], 'jennifer': ['jen', 'jenny'],
+    'liz': ['elizabeth'], 'elizabeth': ['liz', 'beth'],
+    'ed': ['edward', 'edwin'], 'edward': ['ed', 'eddie'],
+}
+
+# Primex name → roster name, for patients registered under a different name
+NAME_OVERRIDES = {
+    ('michelle', 'davidson'): ('Thoa Mai', 'Davidson'),
+    ('lily', 'diaz'): ('Lily', 'Nikou'),
+    ('tony', 'quartatato'): ('Anthony', 'Quartararo'),
+}
+
+Match = namedtuple('Match', ['patient_id', 'status'])
+# status: exact / alias / dob (tie broken by DOB) — or, with patient_id None:
+# unmatched / ambiguous / dob_mismatch
+MATCHED = ('exact', 'alias', 'dob')
+
+_PAREN = re.compile(r'\(([^)]*)\)')
+_NON_ALNUM = re.compile(r'[^0-9a-z]+')
+
+
+def _fold(text):
+    """Casefold and strip accents."""
+    text = unicodedata.normalize('NFKD', text or '')
+    return ''.join(c for c in text if not unicodedata.combining(c)).casefold()
+
+
+def last_key(last):
+    """Normalized last name: letters and digits only."""
+    return _NON_ALNUM.sub('', _fold(last))
+
+
+def first_key(first):
+    """Normalized first name: its first token, letters and digits only."""
+    tokens = _PAREN.sub(' ', _fold(first)).split()
+    return _NON_ALNUM.sub('', tokens[0]) if tokens else ''
+
+
+def _split_name(row):
+    """(first, last) for a roster row, falling back to splitting 'name'."""
+    first, last = row.get('first_name') or '', row.get('last_name') or ''
+    if not (first and last) and row.get('name'):
+        parts = row['name'].split()
+        first = first or parts[0]
+        last = last or (parts[-1] if len(parts) > 1 else '')
+    return first, last
+
+
+class PatientIndex:
+    """In-memory name index over the patients roster; see module docstring."""
+
+    def __init__(self, rows):
+        self.exact = defaultdict(list)
+        self.alias = defaultdict(list)
+        self.dob = {}
+        self.stats = Counter()
+        for row in rows:
+            pid = row['id']
+            first, last = _split_name(row)
+            lk, fk = last_key(last), first_key(first)
+            if not (lk and fk):
+                continue
+            self.dob[pid] = (row.get('date_of_birth') or '')[:10] or None
+            self.exact[(lk, fk)].append(pid)
+            aliases = set(NICKNAMES.get(fk, []))
+            aliases.update(first_key(p) for p in _PAREN.findall(first))
+            keys = {(lk, a) for a in aliases if a}
+            parts = [last_key(p) for p in re.split(r"[-\s]+", _fold(last))]
+            if len(parts) > 1:
+                keys.update((p, f) for p in parts if p for f in {fk, *aliases} if f)
+            for key in keys - {(lk, fk)}:
+                self.alias[key].append(pid)
+
+    def __len__(self):
+        return len(self.dob)
+
+    def _candidates(self, first, last):
+        fk, lk = first_key(first), last_key(last)
+        override = NAME_OVERRIDES.get((fk, lk))
+        if override:
+            fk, lk = first_key(override[0]), last_key(override[1])
+        if self.exact.get((lk, fk)):
+            return self.exact[(lk, fk)], 'exact'
+        ids = list(self.alias.get((lk, fk), []))
+        for part in re.split(r"[-\s]+", _fold(last)):  # hyphenated report name
+            if last_key(part) != lk:
+                ids += self.exact.get((last_key(part), fk), [])
+        return list(dict.fromkeys(ids)), 'alias'
+
+    def resolve(self, header):
+        """Match for a parse_header() dict (needs first_name/last_name; uses dob)."""
+        ids, how = self._candidates(header.get('first_name', ''), header.get('last_name', ''))
+        dob = header.get('dob')
+        if not ids:
+            match = Match(None, 'unmatched')
+        elif dob and any(self.dob[i] == dob for i in ids):
+            same = [i for i in ids if self.dob[i] == dob]
+            match = Match(same[0], how if len(ids) == 1 else 'dob') if len(same) == 1 \
+                else Match(None, 'ambiguous')
+        elif len(ids) > 1:
+            match = Match(None, 'ambiguous')
+        elif dob and self.dob[ids[0]]:
+            match = Match(None, 'dob_mismatch')
+        else:
+            match = Match(ids[0], how)
+        self.stats[match.status] += 1
+        return match
+
+
+# ── Roster sources ────────────────────────────────────────────────────────────
+
+def load_roster(path):
+    """Roster rows from a local export: JSON (list of rows) or CSV with ROSTER_FIELDS."""
+    if path.suffix.lower() == '.json':
+        return json.loads(path.read_text())
+    with open(path, newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def fetch_roster(base_url, key, timeout=60):
+    """Every patients row (ROSTER_FIELDS) from the Supabase REST API, PAGE_SIZE at a time."""
+    rows = []
+    while True:
+        query = urllib.parse.urlencode({'select': ROSTER_FIELDS, 'order': 'id',
+                                        'limit': PAGE_SIZE, 'offset': len(rows)})
+        req = urllib.request.Request(f"{base_url.rstrip('/')}/rest/v1/patients?{query}",
+                                     headers={'Authorization': f'Bearer {key}', 'apikey': key})
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            page = json.loads(resp.read())
+        rows += page
+        if len(page) < PAGE_SIZE:
+            return rows
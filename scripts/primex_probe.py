@@ -0,0 +1,102 @@
+"""
+Primex Page Probe — Range Medical CRM
+Cheap page text straight from the PDF content stream, used by primex_parser.py
+to decide which pages are worth a full pdfplumber extraction.
+
+Primex pages draw their text as plain literal strings in a monospaced simple
+font ([-1800 (DOB:)] TJ, 0 -12 Td, ...), so walking the decompressed content
+stream gives almost exactly page.extract_text() — only the 10^3 / 10^6
+superscripts come out inline — in about 1 ms instead of ~70 ms.
+
+probe_text() returns None whenever the stream can't be trusted to hold all of
+the page's text (composite fonts, hex strings, form XObjects, or no readable
+Primex header); callers must then extract the page normally.
+"""
+
+import re
+
+from pdfminer.pdftypes import resolve1
+
+_TOKEN = re.compile(
+    rb'\((?:\\.|[^\\)])*\)'           # literal string
+    rb'|(?<!<)<(?!<)'                 # hex string opener (not a << dict)
+    rb'|[-+]?(?:\d+\.?\d*|\.\d+)'     # number
+    rb'|\[|\]'
+    rb'|[A-Za-z*\'"]+'                # operator
+    rb'|/[^\s/\[\]()<>{}%]+',         # name
+    re.DOTALL)
+_ESCAPE = re.compile(rb'\\([0-7]{1,3}|.)', re.DOTALL)
+_ESCAPES = {b'n': b'\n', b'r': b'\r', b't': b'\t', b'b': b'\b', b'f': b'\f'}
+_MARKERS = ('DOB:', 'END OF REPORT')
+
+# A TJ offset at least this far right (thousandths of an em) reads as a space
+SPACE_OFFSET = 300
+
+
+def _unescape(m):
+    c = m.group(1)
+    if c[:1].isdigit():
+        return bytes([int(c, 8) & 0xFF])
+    return _ESCAPES.get(c, c)
+
+
+def _simple_resources(page):
+    """False if the page uses composite (Type0) fonts or draws form XObjects."""
+    resources = resolve1(page.page_obj.resources) or {}
+    for font in (resolve1(resources.get('Font')) or {}).values():
+        if str(resolve1(font).get('Subtype')) == '/Type0':
+            return False
+    for xobj in (resolve1(resources.get('XObject')) or {}).values():
+        if str(resolve1(xobj).attrs.get('Subtype')) == '/Form':
+            return False
+    return True
+
+
+def stream_text(data):
+    """Text lines of a decoded content stream, or None if it uses hex strings."""
+    lines, line, nums, in_array = [], [], [], False
+    for tok in _TOKEN.findall(data):
+        c = tok[:1]
+        if c == b'(':
+            if in_array and nums and nums[-1] <= -SPACE_OFFSET:
+                line.append(' ')
+            line.append(_ESCAPE.sub(_unescape, tok[1:-1]).decode('latin-1'))
+            nums = []
+        elif c == b'<':
+            return None
+        elif c == b'[':
+            in_array, nums = True, []
+        elif c == b']':
+            in_array = False
+        elif c in b'-+.0123456789':
+            nums.append(float(tok))
+        elif tok in (b'Td', b'TD'):
+            if len(nums) >= 2 and nums[-1] != 0:  # moved to a new line
+                lines.append(''.join(line))
+                line = []
+            nums = []
+        elif tok in (b'T*', b"'", b'"'):
+            lines.append(''.join(line))
+            line, nums = [], []
+        elif c != b'/':
+            nums = []
+    lines.append(''.join(line))
+    text = (' '.join(l.split()) for l in lines)
+    return '\n'.join(l for l in text if l)
+
+
+def probe_text(page):
+    """
+    Page text of a pdfplumber page read from its content stream, or None when
+    the probe can't vouch for it (see module docstring).
+    """
+    try:
+        if not _simple_resources(page):
+            return None
+        data = b''.join(resolve1(s).get_data() for s in (page.page_obj.contents or []))
+        text = stream_text(data)
+    except Exception:
+        return None
+    if text is None or not any(marker in text for marker in _MARKERS):
+        return None
+    return text
@@ -0,0 +1,80 @@
+"""
+Primex Stage Profiler — Range Medical CRM
+Per-stage wall/CPU timing and counts for primex_parser.py --profile.
+
+Stages are timed with a context manager at the call site. CPU time is the
+calling thread's (time.thread_time), so concurrent upload threads don't
+inflate parser stages. Each worker process profiles into its own
+StageProfiler and the parent merge()s the snapshots.
+"""
+
+import resource, sys, time
+from contextlib import contextmanager
+
+# Pipeline order for the report; unknown stages are listed after these
+STAGE_ORDER = [
+    'probe_pages', 'fast_extract', 'extract_pages', 'split_into_sections', 'parse_header',
+    'parse_values', 'extract_patient_pdf', 'match_patients', 'generate_sql', 'export',
+    'flag_values',
+]
+
+
+def peak_rss_mb(who=resource.RUSAGE_SELF):
+    """Peak resident set size in MB (ru_maxrss is KB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(who).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+class StageProfiler:
+
+    def __init__(self):
+        self.stages = {}
+
+    @contextmanager
+    def stage(self, name, items=1):
+        """Time one call of a stage. The yielded dict's 'items' can be adjusted inside the block."""
+        counter = {'items': items}
+        w0, c0 = time.perf_counter(), time.thread_time()
+        try:
+            yield counter
+        finally:
+            s = self.stages.setdefault(name, {'calls': 0, 'items': 0, 'wall': 0.0, 'cpu': 0.0})
+            s['calls'] += 1
+            s['items'] += counter['items']
+            s['wall'] += time.perf_counter() - w0
+            s['cpu'] += time.thread_time() - c0
+
+    def snapshot(self):
+        return {name: dict(s) for name, s in self.stages.items()}
+
+    def merge(self, stages):
+        """Add another profiler's snapshot (e.g. from a pool worker)."""
+        for name, other in stages.items():
+            s = self.stages.setdefault(name, {'calls': 0, 'items': 0, 'wall': 0.0, 'cpu': 0.0})
+            for k in s:
+                s[k] += other[k]
+
+    def _ordered(self):
+        known = [n for n in STAGE_ORDER if n in self.stages]
+        return known + sorted(n for n in self.stages if n not in STAGE_ORDER)
+
+    def table(self, total_wall):
+        """Human-readable summary; % is of the run's total wall time."""
+        lines = [f"{'stage':<22} {'calls':>7} {'items':>7} {'wall s':>9} {'cpu s':>9} "
+                 f"{'% run':>6} {'items/s':>9}"]
+        for name in self._ordered():
+            s = self.stages[name]
+            pct = 100 * s['wall'] / total_wall if total_wall else 0
+            rate = s['items'] / s['wall'] if s['wall'] else 0
+            lines.append(f"{name:<22} {s['calls']:>7} {s['items']:>7} {s['wall']:>9.3f} "
+                         f"{s['cpu']:>9.3f} {pct:>5.1f}% {rate:>9.1f}")
+        lines.append(f"{'total run':<22} {'':>7} {'':>7} {total_wall:>9.3f}")
+        return '\n'.join(lines)
+
+    def to_json(self, total_wall, **meta):
+        """Machine-readable report: run metadata plus per-stage totals."""
+        return {
+            **meta,
+            'total_wall': total_wall,
+            'stages': {name: self.stages[name] for name in self._ordered()},
+        }
@@ -0,0 +1,112 @@
+"""
+Primex Storage Uploader — Range Medical CRM
+Bounded-concurrency uploads of split Primex PDFs to Supabase Storage.
+
+Talks to the Storage REST API directly (no SDK), so it can be pointed at a
+local HTTP stand-in. Objects whose remote ETag already equals the local MD5
+are skipped; transient failures (network errors, 429, 5xx) are retried with
+exponential backoff.
+
+Used by primex_parser.py --upload; replaces scripts/upload-primex-pdfs.js
+for the upload step (pdf_url is already set by the generated SQL).
+"""
+
+import hashlib, threading, time, urllib.error, urllib.parse, urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+RETRY_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+class StorageUploader:
+    """
+    Thread-pool uploader. submit() returns immediately; close() waits for all
+    uploads and returns stats: uploaded / skipped (already current) / failed.
+    """
+
+    def __init__(self, base_url, key, bucket, max_workers=4, retries=4,
+                 backoff=0.5, timeout=60):
+        self.base_url = base_url.rstrip('/')
+        self.key = key
+        self.bucket = bucket
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.stats = Counter()
+        self.errors = []
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers,
+                                        thread_name_prefix='primex-upload')
+
+    # ── HTTP ──────────────────────────────────────────────────────────────────
+
+    def _object_url(self, storage_path):
+        quoted = urllib.parse.quote(f"{self.bucket}/{storage_path}")
+        return f"{self.base_url}/storage/v1/object/{quoted}"
+
+    def _request(self, method, url, data=None, headers=None):
+        """Send one request with retries; returns (status, headers). 404 is not an error."""
+        hdrs = {'Authorization': f'Bearer {self.key}', 'apikey': self.key}
+        hdrs.update(headers or {})
+        for attempt in range(self.retries + 1):
+            req = urllib.request.Request(url, data=data, headers=hdrs, method=method)
+            try:
+                with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+                    resp.read()
+                    return resp.status, resp.headers
+            except urllib.error.HTTPError as e:
+                if e.code in (400, 404) and method == 'HEAD':
+                    return 404, e.headers  # Storage answers 400 for some missing objects
+                if e.code not in RETRY_STATUS or attempt == self.retries:
+                    raise
+            except (urllib.error.URLError, TimeoutError, ConnectionError):
+                if attempt == self.retries:
+                    raise
+            time.sleep(self.backoff * (2 ** attempt))
+
+    def remote_etag(self, storage_path):
+        """ETag of the remote object (quotes stripped), or None if it does not exist."""
+        status, headers = self._request('HEAD', self._object_url(storage_path))
+        if status == 404:
+            return None
+        return (headers.get('ETag') or '').strip('"').lower() or None
+
+    def upload_file(self, local_path, storage_path):
+        """Upload one file unless the remote copy has the same MD5. Returns 'uploaded' or 'skipped'."""
+        with open(local_path, 'rb') as f:
+            data = f.read()
+        if self.remote_etag(storage_path) == hashlib.md5(data).hexdigest():
+            return 'skipped'
+        self._request('POST', self._object_url(storage_path), data=data, headers={
+            'Content-Type': 'application/pdf',
+            'x-upsert': 'true',
+        })
+        return 'uploaded'
+
+    # ── Pool ──────────────────────────────────────────────────────────────────
+
+    def _run(self, local_path, storage_path):
+        try:
+            outcome = self.upload_file(local_path, storage_path)
+        except Exception as e:
+            outcome = 'failed'
+            with self._lock:
+                self.errors.append((storage_path, str(e)))
+        with self._lock:
+            self.stats[outcome] += 1
+        return outcome
+
+    def submit(self, local_path, storage_path):
+        """Queue an upload; returns a Future resolving to 'uploaded' / 'skipped' / 'failed'."""
+        return self._pool.submit(self._run, local_path, storage_path)
+
+    def close(self):
+        """Wait for queued uploads to finish and return stats."""
+        self._pool.shutdown(wait=True)
+        return self.stats
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,498 @@
+#!/usr/bin/env python3
+"""
+Primex Synthetic Reports — Range Medical CRM
+Writes de-identified Primex-style lab PDFs with known ground truth.
+
+Pages copy the Primex print layout: Courier 12 on a 7.2pt column grid, the
+patient header repeated on every page, results as analyte / result / flag /
+units / reference columns (out-of-range results shifted right next to their
+flag), 10^3 units as a raised superscript, and an END OF REPORT line on a
+patient's last page. primex_parser.py reads them exactly like lab-issued PDFs.
+
+The fixed regression corpus in scripts/primex-golden/ is built from
+GOLDEN_PATIENTS; `generate` writes any number of randomized reports (names,
+dates, panels, results, flags, combined PDFs) for load testing. Both write
+golden.json next to the PDFs, so `primex_bench.py golden` can check them.
+
+Usage:
+    python3 primex_synth.py golden [out_dir]
+    python3 primex_synth.py generate out_dir --reports 5000 [--seed N] [--combined 0.2]
+"""
+
+import argparse, json, random, sys, time
+from collections import namedtuple
+from datetime import date, timedelta
+from pathlib import Path
+
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+
+DEFAULT_GOLDEN_DIR = Path(__file__).parent / 'primex-golden'
+
+# ── Analytes ─────────────────────────────────────────────────────────────────
+# (db_column, panel, printed label, units, reference, normal low, normal high, decimals)
+# Labels are the ones Primex prints, except dht (Primex prints
+# "DIHYDROTESTOSTERONE (DHT)", which PATTERNS does not match).
+
+Analyte = namedtuple('Analyte', ['column', 'panel', 'label', 'units', 'reference',
+                                 'low', 'high', 'decimals'])
+
+ANALYTES = [Analyte(*a) for a in [
+    ('total_protein',        'CHEMISTRY', 'TOTAL PROTEIN',              'g/dL',     '6.0-8.3',     6.0, 8.3, 1),
+    ('albumin',              'CHEMISTRY', 'ALBUMIN',                    'g/dL',     '3.5-5.5',     3.5, 5.5, 1),
+    ('globulin',             'CHEMISTRY', 'GLOBULIN (Calc.)',           'g/dL',     '2.0-4.0',     2.0, 4.0, 1),
+    ('ag_ratio',             'CHEMISTRY', 'A/G RATIO (Calc.)',          'Ratio',    '1.1-2.5',     1.1, 2.5, 1),
+    ('ast',                  'CHEMISTRY', 'SGOT (AST)',                 'IU/L',     '1-40',        1, 40, 0),
+    ('alt',                  'CHEMISTRY', 'SGPT (ALT)',                 'IU/L',     '5-45',        5, 45, 0),
+    ('alkaline_phosphatase', 'CHEMISTRY', 'ALKALINE PHOSPHATASE',       'IU/L',     '30-125',      30, 125, 0),
+    ('total_bilirubin',      'CHEMISTRY', 'BILIRUBIN, TOTAL',           'mg/dL',    '0.1-1.4',     0.1, 1.4, 1),
+    ('ggt',                  'CHEMISTRY', 'Gamma-glutamyl Transferase', 'IU/L',     '1-48',        1, 48, 0),
+    ('glucose',              'CHEMISTRY', 'GLUCOSE',                    'mg/dL',    '65-99',       65, 99, 0),
+    ('uric_acid',            'CHEMISTRY', 'URIC ACID',                  'mg/dL',    '2.0-7.2',     2.0, 7.2, 1),
+    ('calcium',              'CHEMISTRY', 'CALCIUM',                    'mg/dL',    '8.3-10.5',    8.3, 10.5, 1),
+    ('chloride',             'CHEMISTRY', 'CHLORIDE',                   'mEq/L',    '96-110',      96, 110, 0),
+    ('co2',                  'CHEMISTRY', 'CO2',                        'mEq/L',    '15-35',       15, 35, 0),
+    ('sodium',               'CHEMISTRY', 'SODIUM',                     'mEq/L',    '135-155',     135, 155, 0),
+    ('potassium',            'CHEMISTRY', 'POTASSIUM',                  'mEq/L',    '3.5-5.5',     3.5, 5.5, 1),
+    ('anion_gap',            'CHEMISTRY', 'ANION GAP (Calc.)',          None,       '<25',         4, 20, 0),
+    ('magnesium',            'CHEMISTRY', 'MAGNESIUM',                  'mg/dL',    '1.5-2.6',     1.5, 2.6, 1),
+    ('bun',                  'CHEMISTRY', 'BUN',                        'mg/dL',    '6-25',        6, 25, 0),
+    ('creatinine',           'CHEMISTRY', 'CREATININE',                 'mg/dL',    '0.5-1.3',     0.5, 1.3, 1),
+    ('bun_creatinine_ratio', 'CHEMISTRY', 'BUN/CREATININE (Calc.)',     'Ratio',    '7-30',        7, 30, 0),
+    ('egfr',                 'CHEMISTRY', 'e.GFR (Calc.)',              None,       '>60',         60, 120, 0),
+
+    ('total_cholesterol',    'CARDIAC RISK STUDIES', 'CHOLESTEROL',                 'mg/dL',  '135-200',  135, 200, 0),
+    ('hdl_cholesterol',      'CARDIAC RISK STUDIES', 'HDL CHOLESTEROL',             'mg/dL',  '>40',      40, 90, 0),
+    ('chol_hdl_ratio',       'CARDIAC RISK STUDIES', 'CHOL/HDL RISK RATIO (Calc.)', None,     None,       2.0, 5.0, 1),
+    ('ldl_cholesterol',      'CARDIAC RISK STUDIES', 'LDL (Calc.)',                 'mg/dL',  '<100',     40, 99, 0),
+    ('vldl_cholesterol',     'CARDIAC RISK STUDIES', 'VLDL (Calc.)',                'mg/dL',  '0-40',     0, 40, 0),
+    ('triglycerides',        'CARDIAC RISK STUDIES', 'TRIGLYCERIDES',               'mg/dL',  '<150',     40, 149, 0),
+    ('apolipoprotein_a1',    'CARDIAC RISK STUDIES', 'APOLIPOPROT. A-1',            'mg/dL',  '115-220',  115, 220, 0),
+    ('apolipoprotein_b',     'CARDIAC RISK STUDIES', 'APOLIPOPROT.B',               'mg/dL',  '50-155',   50, 155, 0),
+    ('apo_b_a1_ratio',       'CARDIAC RISK STUDIES', 'Apo B/A1 Ratio',              None,     None,       0.30, 1.10, 2),
+    ('lp_a',                 'CARDIAC RISK STUDIES', 'LIPOPROTEIN (a)',             'mg/dL',  '<30',      1, 29, 1),
+    ('crp_hs',               'CARDIAC RISK STUDIES', 'CRP, HIGHLY SENSITIVE',       'mg/L',   '<1.0',     0.1, 0.9, 2),
+    ('homocysteine',         'CARDIAC RISK STUDIES', 'HOMOCYSTEINE',                'umol/L', '5.0-15.0', 5.0, 15.0, 1),
+
+    ('tsh',                  'THYROID STUDIES', 'TSH (3rd GENERATION)',   'uIU/mL', '0.340-5.600', 0.34, 5.6, 3),
+    ('total_t4',             'THYROID STUDIES', 'TOTAL T4',               'ug/dL',  '4.5-12.5',    4.5, 12.5, 1),
+    ('free_t4',              'THYROID STUDIES', 'FREE T4',                'ng/dL',  '0.8-1.9',     0.8, 1.9, 1),
+    ('free_t3',              'THYROID STUDIES', 'FREE T3',                'pg/mL',  '2.3-4.2',     2.3, 4.2, 2),
+    ('thyroglobulin_antibody', 'THYROID STUDIES', 'THYROGLOBULIN ANTIBODY', 'IU/mL', '<40',        1, 39, 1),
+    ('tpo_antibody',         'THYROID STUDIES', 'THYROID PEROXIDASE AB.', 'IU/mL',  '<35',         1, 34, 1),
+
+    ('iron',                 'ANEMIA PROFILE', 'SERUM IRON',               'ug/dL', '40-180',    40, 180, 0),
+    ('tibc',                 'ANEMIA PROFILE', 'TIBC (Calc.)',             'ug/dL', '200-400',   200, 400, 0),
+    ('iron_saturation',      'ANEMIA PROFILE', '%IRON SATURATION (Calc.)', '%',     '15-50',     15, 50, 0),
+    ('ferritin',             'ANEMIA PROFILE', 'FERRITIN',                 'ng/mL', '28-365',    28, 365, 0),
+    ('vitamin_b12',          'ANEMIA PROFILE', 'VITAMIN B-12',             'pg/mL', '193-982',   193, 982, 0),
+    ('folate',               'ANEMIA PROFILE', 'FOLATE, SERUM',            'ng/mL', '3.0-17.0',  3.0, 17.0, 1),
+
+    ('wbc',                  'HEMATOLOGY (CBC)', 'WBC',           '10^3/uL', '4.0-11.0',  4.0, 11.0, 1),
+    ('rbc',                  'HEMATOLOGY (CBC)', 'RBC',           '10^6/uL', '4.4-5.9',   4.4, 5.9, 2),
+    ('hemoglobin',           'HEMATOLOGY (CBC)', 'HGB',           'g/dL',    '13.0-17.0', 13.0, 17.0, 1),
+    ('hematocrit',           'HEMATOLOGY (CBC)', 'HCT',           '%',       '40-52',     40, 52, 1),
+    ('mcv',                  'HEMATOLOGY (CBC)', 'MCV',           'fL',      '82.0-97.0', 82.0, 97.0, 1),
+    ('mch',                  'HEMATOLOGY (CBC)', 'MCH',           'pg',      '27.0-34.0', 27.0, 34.0, 1),
+    ('mchc',                 'HEMATOLOGY (CBC)', 'MCHC',          'g/dL',    '31.0-35.0', 31.0, 35.0, 1),
+    ('rdw',                  'HEMATOLOGY (CBC)', 'RDW',           '%',       '11.8-15.2', 11.8, 15.2, 1),
+    ('platelets',            'HEMATOLOGY (CBC)', 'PLATELETS',     '10^3/uL', '150-400',   150, 400, 0),
+    ('mpv',                  'HEMATOLOGY (CBC)', 'MPV',           'fL',      '5.2-11.1',  5.2, 11.1, 1),
+    ('neutrophils_percent',  'HEMATOLOGY (CBC)', 'NEUTROPHILS %', '%',       '45-75',     45, 75, 0),
+    ('lymphocytes_percent',  'HEMATOLOGY (CBC)', 'LYMPHOCYTES %', '%',       '15-50',     15, 50, 0),
+    ('monocytes_percent',    'HEMATOLOGY (CBC)', 'MONOCYTES %',   '%',       '0-10',      0, 10, 0),
+    ('eosinophils_percent',  'HEMATOLOGY (CBC)', 'EOSINOPHILS %', '%',       '0-5',       0, 5, 0),
+    ('basophils_percent',    'HEMATOLOGY (CBC)', 'BASOPHILS %',   '%',       '0-5',       0, 5, 0),
+    ('esr',                  'HEMATOLOGY (CBC)', 'SED RATE',      'mm/hr',   '0-15',      0, 15, 0),
+
+    ('hemoglobin_a1c',       'SPECIAL CHEMISTRY', 'HGBA1C',              '%',     '<5.7',       4.0, 5.6, 1),
+    ('vitamin_d',            'SPECIAL CHEMISTRY', 'VITAMIN D, 25-HYDROXY', 'ng/mL', '>30-100',  30, 100, 1),
+    ('fasting_insulin',      'SPECIAL CHEMISTRY', 'INSULIN, FASTING',    'mU/L',  '2.6-37.6',   2.6, 37.6, 1),
+    ('growth_hormone',       'SPECIAL CHEMISTRY', 'GROWTH HORMONE (GH)', 'ng/mL', '0.0-1.0',    0.0, 1.0, 2),
+    ('cortisol',             'SPECIAL CHEMISTRY', 'CORTISOL',            'ug/dL', None,         3.0, 23.0, 1),
+    ('igf_1',                'SPECIAL CHEMISTRY', 'IGF-1',               'ng/mL', '83.6-259',   83.6, 259, 1),
+
+    ('estradiol',            'HORMONAL STUDIES', 'ESTRADIOL',                  'pg/mL',  None,        10, 60, 1),
+    ('fsh',                  'HORMONAL STUDIES', 'FSH',                        'mIU/mL', None,        1.0, 12.0, 1),
+    ('lh',                   'HORMONAL STUDIES', 'LH',                         'mIU/mL', None,        1.0, 9.0, 1),
+    ('shbg',                 'HORMONAL STUDIES', 'SEX HORMONE BNDG. GLOBULIN', 'nmol/L', '10-57',     10, 57, 1),
+    ('total_testosterone',   'HORMONAL STUDIES', 'TESTOSTERONE, TOTAL',        'ng/dL',  '240-950',   240, 950, 0),
+    ('free_testosterone',    'HORMONAL STUDIES', 'TESTOSTERONE, FREE',         'pg/mL',  '9.1-32.2',  9.1, 32.2, 2),
+    ('dhea_s',               'HORMONAL STUDIES', 'DHEA-SULFATE',               'ug/dL',  '26-450',    26, 450, 0),
+    ('dht',                  'HORMONAL STUDIES', 'DHT',                        'ng/dL',  '4-25',      4, 25, 1),
+
+    ('psa_total',            'TUMOR MARKERS', 'PSA, Total',         'ng/mL', '<4.00', 0.10, 3.99, 2),
+    ('psa_free',             'TUMOR MARKERS', 'FREE PSA',           'ng/mL', None,    0.05, 1.00, 2),
+    ('psa_free_percent',     'TUMOR MARKERS', '% FREE PSA (Calc.)', '%',     None,    10, 60, 1),
+]]
+
+ANALYTE_BY_COLUMN = {a.column: a for a in ANALYTES}
+PANELS = list(dict.fromkeys(a.panel for a in ANALYTES))
+
+
+# ── Patients ─────────────────────────────────────────────────────────────────
+# results:  {db_column: result text as printed ('7.3', '<20.0', '1,250')}
+# flags:    {db_column: 'H' / 'L'} for out-of-range results
+# comments: {db_column: comment line printed under that result}
+
+Patient = namedtuple('Patient', ['last', 'first', 'sex', 'dob', 'collected', 'time',
+                                 'patient_id', 'results', 'flags', 'comments'],
+                     defaults=[None])
+
+
+def age_on(dob, day):
+    return day.year - dob.year - ((day.month, day.day) < (dob.month, dob.day))
+
+
+def _mdy(d, year_digits=2):
+    year = d.year % 100 if year_digits == 2 else d.year
+    return f"{d.month}/{d.day:02d}/{year:0{year_digits}d}"
+
+
+def result_value(text):
+    """The float primex_parser should read from a printed result."""
+    return float(text.lstrip('<>').replace(',', ''))
+
+
+def ground_truth(patient):
+    """{'header': ..., 'values': ...} exactly as parse_header()/parse_values() should return."""
+    header = {
+        'last_name': patient.last.title(),
+        'first_name': patient.first.title(),
+        'sex': patient.sex,
+        'dob': patient.dob.isoformat(),
+    }
+    if patient.time:
+        header['test_date'] = patient.collected.isoformat()
+    values = {col: result_value(text) for col, text in patient.results.items()}
+    return {'header': header, 'values': values}
+
+
+# ── Page layout ──────────────────────────────────────────────────────────────
+
+FONT = 'Courier'
+FONT_SIZE = 12
+COL = 7.2           # Courier 12 advance width
+LEFT = 18           # x of column 0
+TOP = 759           # baseline of the first letterhead line
+LINE = 12
+BODY_TOP = 597      # baseline of the first results line
+BODY_BOTTOM = 54    # lowest results baseline
+FOOTER = 30
+SUPERSCRIPT_RISE = 6
+
+# result column edges (exclusive), units and reference columns
+RESULT_END, FLAGGED_RESULT_END, FLAG_COL, UNITS_COL, REFERENCE_COL = 38, 52, 53, 60, 68
+
+
+def _place(*fields):
+    """Build a fixed-width line from (column, text) pairs."""
+    line = ''
+    for col, text in fields:
+        line = line.ljust(col) + text
+    return line
+
+
+def result_line(analyte, text, flag=None):
+    """Segments of one result row; units like 10^3/uL become (text, rise) superscript segments."""
+    end = FLAGGED_RESULT_END if flag else RESULT_END
+    fields = [(2, analyte.label), (end - len(text), text)]
+    if flag:
+        fields.append((FLAG_COL, flag))
+    line = _place(*fields)
+    segments = []
+    if analyte.units and '^' in analyte.units:
+        base, rest = analyte.units.split('^', 1)
+        exponent, unit = rest[0], rest[1:]
+        segments = [(line.ljust(UNITS_COL) + base, 0), (exponent, SUPERSCRIPT_RISE), (unit, 0)]
+        line = ''.ljust(UNITS_COL + len(base) + len(exponent) + len(unit))
+    elif analyte.units:
+        line = _place((0, line), (UNITS_COL, analyte.units))
+    if analyte.reference:
+        if segments:
+            segments.append((' ' * (REFERENCE_COL - len(line)) + analyte.reference, 0))
+        else:
+            line = _place((0, line), (REFERENCE_COL, analyte.reference))
+    return segments or [(line, 0)]
+
+
+def body_lines(patient):
+    """Every body line of a report: [(segments)] with blank lines between panels."""
+    lines = []
+    for panel in PANELS:
+        rows = [a for a in ANALYTES if a.panel == panel and a.column in patient.results]
+        if not rows:
+            continue
+        if lines:
+            lines.append([])
+        lines.append([(panel, 0)])
+        for a in rows:
+            lines.append(result_line(a, patient.results[a.column], patient.flags.get(a.column)))
+            comment = (patient.comments or {}).get(a.column)
+            if comment:
+                lines.append([(_place((7, comment)), 0)])
+    return lines
+
+
+def _header_lines(patient, page, pages, reported):
+    age = age_on(patient.dob, patient.collected)
+    collected = _mdy(patient.collected)
+    return [
+        _place((48, 'RANGE MEDICAL')),
+        _place((48, '1901 WESTCLIFF DR #9-10')),
+        _place((48, 'NEWPORT BEACH, CA 92660')),
+        '',
+        _place((3, 'David V. Kon, M.D. Medical Director'), (51, 'RT:10/3'),
+               (68, f'Page {page} of {pages}')),
+        '',
+        _place((3, f'{patient.last}, {patient.first}'), (33, str(age)), (38, patient.sex),
+               (44, '14676'), (71, '510000000')),
+        '',
+        _place((3, patient.patient_id), (30, patient.time.rjust(5) if patient.time else ''),
+               (39, collected), (51, collected), (62, _mdy(reported)), (73, 'FINAL')),
+        '',
+        _place((3, 'DOB:'), (8, _mdy(patient.dob, 4)), (20, 'TEL:'), (38, 'Other'), (44, 'ID:')),
+    ]
+
+
+def _draw_lines(c, y, lines):
+    """Draw lines (plain strings or segment lists) from baseline y down."""
+    t = c.beginText(LEFT, y)
+    t.setFont(FONT, FONT_SIZE)
+    t.setLeading(LINE)
+    for line in lines:
+        for text, rise in ([(line, 0)] if isinstance(line, str) else line):
+            t.setRise(rise)
+            t.textOut(text)
+        t.setRise(0)
+        t.textLine('')
+    c.drawText(t)
+
+
+def draw_report(c, patient):
+    """Draw one patient's report (one or more pages) onto canvas c."""
+    per_page = int((BODY_TOP - BODY_BOTTOM) / LINE) + 1
+    body = body_lines(patient)
+    chunks = [body[i:i + per_page] for i in range(0, len(body), per_page)] or [[]]
+    reported = patient.collected.fromordinal(patient.collected.toordinal() + 2)
+    for n, chunk in enumerate(chunks, 1):
+        _draw_lines(c, TOP, _header_lines(patient, n, len(chunks), reported))
+        _draw_lines(c, BODY_TOP, chunk)
+        if n < len(chunks):
+            footer = _place((31, 'CONTINUED ON NEXT PAGE'))
+        else:
+            footer = _place((3, '949 997-3988'), (21, 'END OF REPORT'), (38, 'PRINTED'),
+                            (46, _mdy(reported)), (54, '@'), (56, '13:49'))
+        _draw_lines(c, FOOTER, [footer])
+        c.showPage()
+
+
+def write_pdf(path, patients):
+    """Write patients' reports to one PDF (a combined PDF when there are several)."""
+    c = canvas.Canvas(str(path), pagesize=letter, invariant=1)
+    c.setTitle('Primex synthetic report')
+    for patient in patients:
+        draw_report(c, patient)
+    c.save()
+
+
+# ── Golden corpus ─────────────────────────────────────────────────────────────
+# Hand-picked de-identified reports covering the cases the parser must get
+# right: every PATTERNS column, H/L flags, <, > and thousands separators,
+# multi-page reports, apostrophes and hyphens in names, a missing collection
+# time (no test_date), and a combined multi-patient PDF.
+
+def _results(**overrides):
+    """Mid-range printed results for every analyte, with overrides."""
+    out = {}
+    for a in ANALYTES:
+        mid = (a.low + a.high) / 2
+        out[a.column] = f"{mid:.{a.decimals}f}"
+    out.update(overrides)
+    return out
+
+
+def _panels(*panels, **overrides):
+    return {col: text for col, text in _results(**overrides).items()
+            if ANALYTE_BY_COLUMN[col].panel in panels}
+
+
+GOLDEN_PATIENTS = {
+    'Sample_Alex_2026-01-05.pdf': [
+        Patient('SAMPLE', 'ALEX', 'M', date(1984, 3, 9), date(2026, 1, 5), '9:00',
+                '000000099000001', _results(), {}),
+    ],
+    'Doe_Jordan_2026-01-12.pdf': [
+        Patient('DOE', 'JORDAN', 'F', date(1991, 11, 23), date(2026, 1, 12), '12:30',
+                '000000099000002',
+                _results(total_cholesterol='241', ldl_cholesterol='162', vitamin_d='22.0',
+                         eosinophils_percent='7', thyroglobulin_antibody='<20.0',
+                         folate='>24.0', ferritin='1,250', egfr='>60', free_t4='0.6'),
+                {'total_cholesterol': 'H', 'ldl_cholesterol': 'H', 'vitamin_d': 'L',
+                 'eosinophils_percent': 'H', 'folate': 'H', 'ferritin': 'H', 'free_t4': 'L'}),
+    ],
+    "O'Neil-Park_Riley_2025-12-02.pdf": [
+        Patient("O'NEIL-PARK", 'RILEY', 'M', date(1970, 6, 1), date(2025, 12, 2), '7:45',
+                '000000099000003', _panels('CHEMISTRY', 'HEMATOLOGY (CBC)', glucose='131'),
+                {'glucose': 'H'}),
+    ],
+    'Tester_Casey_2026-02-20.pdf': [
+        Patient('TESTER', 'CASEY', 'F', date(2001, 2, 14), date(2026, 2, 20), None,
+                '000000099000004', _panels('THYROID STUDIES', 'HORMONAL STUDIES'), {}),
+    ],
+    'Combined_Batch_2026-02-27.pdf': [
+        Patient('RIVERA', 'SAM', 'M', date(1966, 8, 30), date(2026, 2, 27), '8:15',
+                '000000099000005', _panels('TUMOR MARKERS', 'SPECIAL CHEMISTRY',
+                                           psa_total='4.75', growth_hormone='1.66'),
+                {'psa_total': 'H', 'growth_hormone': 'H'}),
+        Patient('NGUYEN', 'TAYLOR', 'F', date(1988, 4, 4), date(2026, 2, 27), '10:05',
+                '000000099000006', _panels('CARDIAC RISK STUDIES', 'ANEMIA PROFILE',
+                                           iron='39'),
+                {'iron': 'L'}),
+        Patient('SMITH', 'MORGAN', 'M', date(1979, 12, 31), date(2026, 2, 27), '11:40',
+                '000000099000007', _panels('CHEMISTRY'), {}),
+    ],
+}
+
+
+def build_golden(out_dir=DEFAULT_GOLDEN_DIR):
+    """Write the golden PDFs and golden.json ({record label: ground truth}) to out_dir."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    golden = {}
+    for filename, patients in GOLDEN_PATIENTS.items():
+        write_pdf(out_dir / filename, patients)
+        for i, patient in enumerate(patients):
+            label = f"{filename}[{i+1}]" if len(patients) > 1 else filename
+            golden[label] = ground_truth(patient)
+    (out_dir / 'golden.json').write_text(json.dumps(golden, indent=2, sort_keys=True) + '\n')
+    return golden
+
+
+# ── Randomized reports ────────────────────────────────────────────────────────
+# Names are drawn from stock lists and never from real reports.
+
+LAST_NAMES = ['SAMPLE', 'DOE', 'TESTER', 'RIVERA', 'NGUYEN', 'SMITH', 'JOHNSON', 'GARCIA',
+              'MILLER', 'DAVIS', 'LOPEZ', 'WILSON', 'ANDERSON', 'THOMAS', 'MOORE', 'MARTIN',
+              'LEE', 'PEREZ', 'WHITE', 'HARRIS', 'CLARK', 'LEWIS', 'WALKER', 'HALL', 'YOUNG',
+              'KING', 'WRIGHT', 'SCOTT', 'GREEN', 'BAKER', 'ADAMS', 'NELSON', 'CARTER',
+              'MITCHELL', 'ROBERTS', 'TURNER', 'PHILLIPS', 'CAMPBELL', 'PARKER', 'EVANS']
+NAME_VARIANTS = ["O'NEIL", "D'AMATO", 'SMITH-JONES', 'PARK-LEE', 'MC-KAY']
+FIRST_NAMES = ['ALEX', 'JORDAN', 'CASEY', 'TAYLOR', 'MORGAN', 'RILEY', 'SAM', 'JAMIE',
+               'AVERY', 'QUINN', 'DREW', 'REESE', 'ROWAN', 'SKYLER', 'PARKER', 'HAYDEN',
+               'EMERSON', 'FINLEY', 'KENDALL', 'LOGAN', 'BLAKE', 'CAMERON', 'DAKOTA', 'ELLIS']
+COMMENTS = ['Fasting specimen.', 'Specimen received at room temperature.',
+            'Result verified by repeat analysis.', 'Test performed at reference laboratory.']
+
+FLAG_RATE = 0.08      # share of results printed out of range
+COMMENT_RATE = 0.02   # share of results followed by a comment line
+MISSING_TIME_RATE = 0.02
+
+
+def _print_value(v, decimals):
+    return f"{v:,.{decimals}f}" if v >= 1000 else f"{v:.{decimals}f}"
+
+
+def random_result(rng, a):
+    """(printed result, flag) for analyte a: mostly in range, FLAG_RATE out of range."""
+    span = a.high - a.low
+    roll = rng.random()
+    if roll < FLAG_RATE / 2 and a.low > 0:
+        v = a.low * rng.uniform(0.5, 0.95)
+    elif roll < FLAG_RATE:
+        v = a.high + span * rng.uniform(0.05, 1.5)
+    else:
+        v = rng.uniform(a.low, a.high)
+    text = _print_value(v, a.decimals)
+    value = result_value(text)
+    flag = 'H' if value > a.high else 'L' if value < a.low else None
+    if a.reference and a.reference[0] in '<>' and not flag and rng.random() < 0.05:
+        # detection-limit style result ("<20.0" / ">60"), always in range
+        text = a.reference[0] + _print_value(a.low if a.reference[0] == '<' else a.high, a.decimals)
+    return text, flag
+
+
+def random_patient(rng, patient_no, collected):
+    """One randomized patient on collection date collected: 1 to all panels, random results."""
+    last = rng.choice(NAME_VARIANTS if rng.random() < 0.05 else LAST_NAMES)
+    dob = date(rng.randint(1940, 2006), rng.randint(1, 12), rng.randint(1, 28))
+    panels = rng.sample(PANELS, rng.randint(1, len(PANELS)))
+    results, flags, comments = {}, {}, {}
+    for a in ANALYTES:
+        if a.panel not in panels:
+            continue
+        results[a.column], flag = random_result(rng, a)
+        if flag:
+            flags[a.column] = flag
+        if rng.random() < COMMENT_RATE:
+            comments[a.column] = rng.choice(COMMENTS)
+    time_ = None
+    if rng.random() >= MISSING_TIME_RATE:
+        time_ = f"{rng.randint(6, 17)}:{rng.choice(['00', '15', '30', '45'])}"
+    return Patient(last, rng.choice(FIRST_NAMES), rng.choice('MF'), dob, collected, time_,
+                   f"{99000000 + patient_no:015d}", results, flags, comments)
+
+
+def generate(out_dir, reports, seed=0, combined=0.2, max_per_pdf=5, start=date(2025, 1, 6)):
+    """
+    Write `reports` randomized reports to out_dir and their ground truth to
+    out_dir/golden.json. A `combined` share of PDFs hold 2..max_per_pdf
+    patients collected the same day. The same seed always gives the same files.
+    Returns the ground truth {record label: {'header', 'values'}}.
+    """
+    rng = random.Random(seed)
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    golden = {}
+    made = n_pdf = 0
+    while made < reports:
+        collected = start + timedelta(days=rng.randint(0, 364))
+        count = 1
+        if max_per_pdf > 1 and rng.random() < combined:
+            count = min(rng.randint(2, max_per_pdf), reports - made)
+        patients = [random_patient(rng, made + i, collected) for i in range(count)]
+        n_pdf += 1
+        if count > 1:
+            filename = f"{n_pdf:05d}_Combined_{collected.isoformat()}.pdf"
+        else:
+            p = patients[0]
+            safe_last = p.last.title().replace("'", '').replace('-', '_')
+            filename = f"{n_pdf:05d}_{safe_last}_{p.first.title()}_{collected.isoformat()}.pdf"
+        write_pdf(out_dir / filename, patients)
+        for i, patient in enumerate(patients):
+            label = f"{filename}[{i+1}]" if count > 1 else filename
+            golden[label] = ground_truth(patient)
+        made += count
+    (out_dir / 'golden.json').write_text(json.dumps(golden, indent=2, sort_keys=True) + '\n')
+    return golden
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Synthetic Primex report generator')
+    sub = ap.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('golden', help='rebuild the fixed regression corpus')
+    p.add_argument('out_dir', nargs='?', type=Path, default=DEFAULT_GOLDEN_DIR)
+    p = sub.add_parser('generate', help='write randomized reports for load testing')
+    p.add_argument('out_dir', type=Path)
+    p.add_argument('--reports', type=int, default=1000, help='number of patient reports')
+    p.add_argument('--seed', type=int, default=0)
+    p.add_argument('--combined', type=float, default=0.2,
+                   help='share of PDFs that combine several patients (default 0.2)')
+    p.add_argument('--max-per-pdf', type=int, default=5, help='patients per combined PDF')
+    args = ap.parse_args(argv)
+
+    if args.command == 'golden':
+        golden = build_golden(args.out_dir)
+        print(f"Wrote {len(GOLDEN_PATIENTS)} PDFs / {len(golden)} reports to {args.out_dir}")
+        return 0
+
+    t0 = time.perf_counter()
+    golden = generate(args.out_dir, args.reports, args.seed, args.combined, args.max_per_pdf)
+    n_pdf = len({label.split('[')[0] for label in golden})
+    print(f"Wrote {n_pdf} PDFs / {len(golden)} reports to {args.out_dir} "
+          f"in {time.perf_counter() - t0:.1f}s (seed {args.seed})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
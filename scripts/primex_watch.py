@@ -0,0 +1,140 @@
+"""
+Primex Inbox Watcher — Range Medical CRM
+Finds PDFs that have finished arriving in an inbox folder, for
+primex_parser.py --watch.
+
+Change notification uses Linux inotify (through libc, no extra packages) and
+falls back to polling elsewhere; either way a wake-up only triggers a rescan
+of the folder, so both behave the same. A PDF is handed out once its size and
+mtime have stayed unchanged for `settle` seconds and it ends with a %%EOF
+trailer — files still being copied or saved by the mail client are left
+alone. A PDF that never gets a trailer is handed out after
+INCOMPLETE_AFTER × settle seconds so a broken file cannot stall the inbox
+(primex_parser reports it as failed).
+
+Files are moved out of the inbox (processed/ or failed/) after handling, so
+a restarted daemon never sees them twice.
+"""
+
+import ctypes, ctypes.util, os, select, shutil, time
+from pathlib import Path
+
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+INCOMPLETE_AFTER = 12
+TRAILER_BYTES = 1024
+
+
+def _inotify_fd(folder):
+    """An inotify descriptor watching folder for new/finished files, or None if unavailable."""
+    name = ctypes.util.find_library('c')
+    if not name:
+        return None
+    try:
+        libc = ctypes.CDLL(name, use_errno=True)
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    if libc.inotify_add_watch(fd, str(folder).encode(), IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+def has_trailer(path):
+    """True if the file ends with a PDF %%EOF marker (i.e. was written completely)."""
+    try:
+        with open(path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - TRAILER_BYTES))
+            return b'%%EOF' in f.read()
+    except OSError:
+        return False
+
+
+class InboxWatcher:
+    """
+    Yields batches of settled PDFs from an inbox folder; see module docstring.
+    mode is 'inotify' or 'poll'. Call close() when done.
+    """
+
+    def __init__(self, inbox, settle=5.0, poll=2.0, use_inotify=True):
+        self.inbox = Path(inbox)
+        self.settle = settle
+        self.poll = poll
+        self.fd = _inotify_fd(self.inbox) if use_inotify else None
+        self.mode = 'inotify' if self.fd is not None else 'poll'
+        self._seen = {}  # path → ((size, mtime_ns), first time seen with that signature)
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+    def _wait(self, timeout):
+        """Sleep up to timeout seconds, waking early on an inotify event."""
+        if self.fd is None:
+            time.sleep(timeout)
+            return
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if ready:
+            try:
+                while os.read(self.fd, 65536):  # drain; names are picked up by the rescan
+                    pass
+            except BlockingIOError:
+                pass
+
+    def ready(self, now=None):
+        """Settled PDFs currently in the inbox, in name order."""
+        now = time.monotonic() if now is None else now
+        out = []
+        current = {}
+        for path in sorted(self.inbox.glob('*.pdf')):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            sig = (st.st_size, st.st_mtime_ns)
+            prev = self._seen.get(path)
+            since = prev[1] if prev and prev[0] == sig else now
+            current[path] = (sig, since)
+            stable = now - since
+            if st.st_size and stable >= self.settle and (
+                    has_trailer(path) or stable >= self.settle * INCOMPLETE_AFTER):
+                out.append(path)
+        self._seen = current
+        return out
+
+    def batches(self, stop=lambda: False, until_empty=False):
+        """
+        Yield lists of settled PDFs until stop() is true — or, with
+        until_empty, until the inbox holds no PDFs at all.
+        """
+        while not stop():
+            batch = self.ready()
+            if batch:
+                for path in batch:
+                    self._seen.pop(path, None)
+                yield batch
+                continue
+            if until_empty and not self._seen:
+                return
+            self._wait(self.poll)
+
+
+def archive(path, folder):
+    """Move a handled PDF into folder (created as needed) without overwriting; returns the new path."""
+    folder.mkdir(parents=True, exist_ok=True)
+    dest = folder / path.name
+    n = 1
+    while dest.exists():
+        dest = folder / f"{path.stem}.{n}{path.suffix}"
+        n += 1
+    shutil.move(str(path), str(dest))
+    return dest
@@ -6,7 +6,6 @@ import os
 import pathlib
 import subprocess
 import sys
-import urllib.request
 
 try:
     from PIL import Image, ImageDraw, ImageFont
@@ -15,6 +14,8 @@ except ImportError:
     subprocess.check_call([sys.executable, "-m", "pip", "install", "--quiet", "Pillow"])
     from PIL import Image, ImageDraw, ImageFont
 
+from doc_fonts import inter_variable
+
 SIZE = 1080
 PAD = 80  # safe-zone padding from edges (larger than 60 IG safe-zone)
 
@@ -24,21 +25,9 @@ LABEL = (160, 160, 160)     # #a0a0a0
 RULE = (64, 64, 64)          # #404040
 BULLET_GRAY = (128, 128, 128)  # #808080
 
-FONTS_DIR = pathlib.Path(__file__).parent / ".fonts"
-FONTS_DIR.mkdir(exist_ok=True)
-INTER_PATH = FONTS_DIR / "Inter.ttf"
-INTER_URL = "https://github.com/google/fonts/raw/main/ofl/inter/Inter%5Bopsz%2Cwght%5D.ttf"
-
-def ensure_fonts():
-    if INTER_PATH.exists() and INTER_PATH.stat().st_size > 100_000:
-        return
-    print(f"  downloading Inter variable font...")
-    with urllib.request.urlopen(INTER_URL, timeout=60) as r:
-        INTER_PATH.write_bytes(r.read())
-
 def font(weight, size):
     """Load Inter variable font at the requested weight (100-900)."""
-    f = ImageFont.truetype(str(INTER_PATH), size=size)
+    f = ImageFont.truetype(str(inter_variable()), size=size)
     try:
         f.set_variation_by_axes([weight])
     except Exception:
@@ -202,7 +191,7 @@ ADS = [
 ]
 
 def main():
-    ensure_fonts()
+    inter_variable()  # fail before rendering anything if the font isn't provisioned
     out_dir = pathlib.Path("public/ads/free-session")
     out_dir.mkdir(parents=True, exist_ok=True)
     print(f"Rendering {len(ADS)} ads to {out_dir}...")